@@ -295,10 +295,14 @@ class SCSTAdmin:
             current_config, new_config
         )
 
-        # Remove devices not in new config
-        for device_name in current_config.devices:
+        # Remove devices not in new config. The live config already resolved each
+        # device's handler from its handler link, so there is no need to search
+        # every handler directory again per device (remove_device_by_name)
+        for device_name, device_config in current_config.devices.items():
             if device_name not in new_config.devices:
-                self.device_writer.remove_device_by_name(device_name)
+                self.device_writer.remove_device(
+                    device_config.handler_type, device_name
+                )
 
     def clear_configuration(self, suspend: int = None) -> None:
         """Clear all SCST configuration completely.
@@ -5,11 +5,16 @@ This module defines the core data structures used to represent SCST configuratio
 including the main SCSTConfig dataclass and related enums.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from abc import ABC, abstractmethod
 
+# Large configs hold thousands of device/LUN/group objects; on Python 3.10+
+# they are built with __slots__ instead of a per-instance __dict__.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ConfigAction(Enum):
     """Actions that can be taken for existing SCST entities during configuration."""
@@ -38,7 +43,7 @@ class SCSTErrorCode(Enum):
     FATAL_ERROR = "SCST_C_FATAL_ERROR"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DeviceConfig(ABC):
     """Abstract base class for SCST device configurations.
 
@@ -61,8 +66,26 @@ class DeviceConfig(ABC):
         """Return the SCST handler name for this device type."""
         pass
 
+    @classmethod
+    def _split_known_fields(
+        cls, attrs: Dict[str, str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Split flat attributes into dataclass field values and the rest.
 
-@dataclass
+        Keys in the subclass's _KNOWN_FIELDS become constructor arguments;
+        everything else is kept for the attributes dict.
+        """
+        fields = {}
+        extra = {}
+        for key, value in attrs.items():
+            if key in cls._KNOWN_FIELDS:
+                fields[key] = value
+            else:
+                extra[key] = value
+        return fields, extra
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class VdiskFileioDeviceConfig(DeviceConfig):
     """Configuration for vdisk_fileio devices (file-backed virtual disks).
 
@@ -102,6 +125,16 @@ class VdiskFileioDeviceConfig(DeviceConfig):
         "t10_dev_id",
         "write_through",
     }
+    _KNOWN_FIELDS = frozenset(
+        {
+            "filename",
+            "blocksize",
+            "readonly",
+            "removable",
+            "rotational",
+            "thin_provisioned",
+        }
+    )
     filename: str
     blocksize: Optional[str] = None
     readonly: Optional[str] = None
@@ -159,31 +192,16 @@ class VdiskFileioDeviceConfig(DeviceConfig):
         Returns:
             VdiskFileioDeviceConfig instance
         """
+        fields, extra = cls._split_known_fields(attrs)
         return cls(
             name=name,
-            filename=attrs.get("filename", ""),
-            blocksize=attrs.get("blocksize"),
-            readonly=attrs.get("readonly"),
-            removable=attrs.get("removable"),
-            rotational=attrs.get("rotational"),
-            thin_provisioned=attrs.get("thin_provisioned"),
-            attributes={
-                k: v
-                for k, v in attrs.items()
-                if k
-                not in [
-                    "filename",
-                    "blocksize",
-                    "readonly",
-                    "removable",
-                    "rotational",
-                    "thin_provisioned",
-                ]
-            },
+            filename=fields.pop("filename", ""),
+            attributes=extra,
+            **fields,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VdiskBlockioDeviceConfig(DeviceConfig):
     """Configuration for vdisk_blockio devices (block device backed).
 
@@ -223,6 +241,17 @@ class VdiskBlockioDeviceConfig(DeviceConfig):
         "t10_dev_id",
         "write_through",
     }
+    _KNOWN_FIELDS = frozenset(
+        {
+            "filename",
+            "blocksize",
+            "nv_cache",
+            "o_direct",
+            "readonly",
+            "rotational",
+            "thin_provisioned",
+        }
+    )
     filename: str
     blocksize: Optional[str] = None
     nv_cache: Optional[str] = None
@@ -283,33 +312,16 @@ class VdiskBlockioDeviceConfig(DeviceConfig):
         Returns:
             VdiskBlockioDeviceConfig instance
         """
+        fields, extra = cls._split_known_fields(attrs)
         return cls(
             name=name,
-            filename=attrs.get("filename", ""),
-            blocksize=attrs.get("blocksize"),
-            nv_cache=attrs.get("nv_cache"),
-            o_direct=attrs.get("o_direct"),
-            readonly=attrs.get("readonly"),
-            rotational=attrs.get("rotational"),
-            thin_provisioned=attrs.get("thin_provisioned"),
-            attributes={
-                k: v
-                for k, v in attrs.items()
-                if k
-                not in [
-                    "filename",
-                    "blocksize",
-                    "nv_cache",
-                    "o_direct",
-                    "readonly",
-                    "rotational",
-                    "thin_provisioned",
-                ]
-            },
+            filename=fields.pop("filename", ""),
+            attributes=extra,
+            **fields,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DevDiskDeviceConfig(DeviceConfig):
     """Configuration for dev_disk devices (pass-through to real devices).
 
@@ -328,6 +340,14 @@ class DevDiskDeviceConfig(DeviceConfig):
 
     # dev_disk has no creation-time parameters - only takes device name (H:C:I:L format)
     _CREATION_PARAMS = set()
+    _KNOWN_FIELDS = frozenset(
+        {
+            "filename",
+            "readonly",
+            "rotational",
+            "thin_provisioned",
+        }
+    )
     filename: str
     readonly: Optional[str] = None
     rotational: Optional[str] = None
@@ -374,17 +394,12 @@ class DevDiskDeviceConfig(DeviceConfig):
         Returns:
             DevDiskDeviceConfig instance
         """
+        fields, extra = cls._split_known_fields(attrs)
         return cls(
             name=name,
-            filename=attrs.get("filename", ""),
-            readonly=attrs.get("readonly"),
-            rotational=attrs.get("rotational"),
-            thin_provisioned=attrs.get("thin_provisioned"),
-            attributes={
-                k: v
-                for k, v in attrs.items()
-                if k not in ["filename", "readonly", "rotational", "thin_provisioned"]
-            },
+            filename=fields.pop("filename", ""),
+            attributes=extra,
+            **fields,
         )
 
 
@@ -414,7 +429,7 @@ def create_device_config(
         return None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LunConfig:
     """SCST LUN (Logical Unit Number) configuration.
 
@@ -446,7 +461,7 @@ class LunConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class InitiatorGroupConfig:
     """SCST Initiator Group configuration.
 
@@ -467,14 +482,15 @@ class InitiatorGroupConfig:
 
         Args:
             group_name: Name of the initiator group
-            group_data: Dict with 'initiators', 'luns', and 'attributes' keys
+            group_data: Dict with 'initiators' (any iterable of names), 'luns',
+                and 'attributes' keys
 
         Returns:
             InitiatorGroupConfig object
         """
         return cls(
             name=group_name,
-            initiators=group_data.get("initiators", []).copy(),
+            initiators=list(group_data.get("initiators", ())),
             luns={
                 lun_id: lun_obj
                 for lun_id, lun_obj in group_data.get("luns", {}).items()
@@ -483,7 +499,7 @@ class InitiatorGroupConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TargetConfig:
     """SCST Target configuration.
 
@@ -537,7 +553,7 @@ class TargetConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DriverConfig:
     """SCST Target Driver configuration.
 
@@ -583,7 +599,7 @@ class DriverConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TargetGroupConfig:
     """Configuration for a target group within a device group.
 
@@ -621,7 +637,7 @@ class TargetGroupConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DeviceGroupConfig:
     """Configuration for an SCST device group.
 
@@ -665,7 +681,7 @@ class DeviceGroupConfig:
 
         return cls(
             name=group_name,
-            devices=group_data.get("devices", []).copy(),
+            devices=list(group_data.get("devices", ())),
             target_groups=target_groups,
             attributes=group_data.get("attributes", {}).copy(),
         )
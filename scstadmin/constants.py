@@ -14,6 +14,9 @@ class SCSTConstants:
     # Operation timeouts and intervals
     DEFAULT_TIMEOUT = 60  # Default timeout for SCST operations (seconds)
     OPERATION_POLL_INTERVAL = 0.1  # Polling interval for operation completion (seconds)
+    SESSION_POLL_MIN = 0.01  # First wait between session close checks (seconds)
+    SESSION_POLL_MAX = 0.5  # Longest wait between session close checks (seconds)
+    SNAPSHOT_WORKERS = 8  # Max threads reading target layouts concurrently
 
     # SCST operation results
     SUCCESS_RESULT = "0"  # SCST success result value
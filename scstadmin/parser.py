@@ -15,7 +15,8 @@ Features:
 """
 
 import logging
-from typing import List, Tuple, Dict
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from .config import (
     SCSTConfig,
@@ -29,6 +30,39 @@ from .config import (
 )
 from .exceptions import SCSTError
 
+# Custom attribute store, called as handler(attributes, key, value)
+_AttributeHandler = Callable[[Dict[str, str], str, str], None]
+
+
+class _ConfigLines(list):
+    """Significant config lines plus the closing line of every block opener.
+
+    Built from raw lines, keeping each one stripped and dropping blanks and
+    comments. ``block_ends`` maps the index of each line ending in ``{`` to the index of
+    its matching ``}`` line, so nested blocks are delimited by a lookup rather
+    than by re-scanning their content at every nesting level.
+    """
+
+    __slots__ = ("block_ends",)
+
+    def __init__(self, raw_lines: Iterable[str]):
+        super().__init__(
+            line for line in map(str.strip, raw_lines) if line and line[0] != "#"
+        )
+        self.block_ends = _match_block_ends(self)
+
+
+def _match_block_ends(lines: List[str]) -> Dict[int, int]:
+    """Pair block-opening lines with their closing lines in a single pass."""
+    block_ends = {}
+    open_blocks = []
+    for i, line in enumerate(lines):
+        if line.endswith("{"):
+            open_blocks.append(i)
+        elif line.endswith("}") and open_blocks:
+            block_ends[open_blocks.pop()] = i
+    return block_ends
+
 
 class SCSTConfigParser:
     """SCST configuration file parser for structured config processing.
@@ -51,15 +85,34 @@ class SCSTConfigParser:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Top-level block parsers keyed on the opening keyword. Nested blocks
+        # keep their own branches because the same keyword (e.g. TARGET)
+        # means different things under TARGET_DRIVER and TARGET_GROUP.
+        self._block_parsers = {
+            "HANDLER": self._parse_handler_block,
+            "TARGET_DRIVER": self._parse_target_driver_block,
+            "DEVICE_GROUP": self._parse_device_group_block,
+        }
 
-    def _strip_quotes(self, value: str) -> str:
-        """Strip surrounding quotes from a value if present"""
-        value = value.strip()
-        if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
-            return value[1:-1]
-        elif len(value) >= 2 and value.startswith("'") and value.endswith("'"):
-            return value[1:-1]
-        return value
+    def _split_attribute_line(self, line: str) -> Optional[Tuple[str, str]]:
+        """Split a stripped attribute line into its key and unquoted value.
+
+        Handles both "key=value" and "key value"; surrounding single or double
+        quotes are removed from the value. Returns None when the line holds
+        no attribute.
+        """
+        if "=" in line:
+            key, value = line.split("=", 1)
+            key = key.strip()
+            value = value.strip()
+        elif " " in line:
+            # Stripped line, so both parts come back without outer whitespace
+            key, value = line.split(None, 1)
+        else:
+            return None
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        return key, value
 
     def _add_target_attribute(
         self, attributes: Dict[str, str], key: str, value: str
@@ -86,12 +139,14 @@ class SCSTConfigParser:
         """
         self.logger.info("Parsing configuration file: %s", filename)
         try:
+            # Filter while reading so the whole file never sits in memory as
+            # one string alongside its split lines
             with open(filename, "r") as f:
-                content = f.read()
+                lines = _ConfigLines(f)
         except OSError as e:
             raise SCSTError(f"Cannot read config file {filename}: {e}")
 
-        result = self.parse_config_text(content)
+        result = self._parse_lines(lines)
         self.logger.info("Configuration file parsed successfully")
         return result
 
@@ -111,16 +166,14 @@ class SCSTConfigParser:
         Raises:
             SCSTError: On parsing failures with line number context
         """
+        # Remove comments and empty lines, pairing up block braces as we go
+        return self._parse_lines(_ConfigLines(content.splitlines()))
+
+    def _parse_lines(self, lines: _ConfigLines) -> SCSTConfig:
+        """Parse significant config lines into structured data."""
         config = SCSTConfig()
 
         try:
-            # Remove comments and empty lines
-            lines = []
-            for line in content.splitlines():
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    lines.append(line)
-
             # Parse configuration blocks
             self._parse_blocks(lines, config)
 
@@ -131,48 +184,38 @@ class SCSTConfigParser:
 
         return config
 
-    def _parse_blocks(self, lines: List[str], config: SCSTConfig):
+    def _parse_blocks(self, lines: _ConfigLines, config: SCSTConfig):
         """Parse configuration blocks from lines"""
         i = 0
         while i < len(lines):
             try:
-                line = lines[i].strip()
-                if line.startswith("HANDLER "):
-                    i = self._parse_handler_block(lines, i, config)
-                elif line.startswith("TARGET_DRIVER "):
-                    i = self._parse_target_driver_block(lines, i, config)
-                elif line.startswith("DEVICE_GROUP "):
-                    i = self._parse_device_group_block(lines, i, config)
-                elif "=" in line:
-                    # Global SCST attribute in key=value format
-                    parts = line.split("=", 1)
-                    if len(parts) != 2:
+                line = lines[i]
+                keyword, sep, _ = line.partition(" ")
+                block_parser = self._block_parsers.get(keyword) if sep else None
+                if block_parser is not None:
+                    i = block_parser(lines, i, config)
+                elif line.endswith("{"):
+                    # Unknown block: jump past its closing brace rather than
+                    # reading its contents as global attributes
+                    block_end = lines.block_ends.get(i)
+                    if block_end is None:
                         raise SCSTError(
-                            f"Malformed global attribute at line {i + 1}: '{line}'"
+                            f"Unmatched braces in block starting at line {i + 1}"
                         )
-                    key, value = parts
-                    key = key.strip()
-                    value = self._strip_quotes(value)
-                    config.scst_attributes[key] = value
-                    i += 1
-                elif " " in line and not line.startswith("#"):
-                    # Global SCST attribute in key value format
-                    parts = line.split(None, 1)  # Split on first whitespace
-                    if len(parts) == 2:
-                        key, value = parts
-                        key = key.strip()
-                        value = self._strip_quotes(value)
+                    self.logger.warning(
+                        "Ignoring unrecognized block at line %s: '%s'", i + 1, line
+                    )
+                    i = block_end + 1
+                else:
+                    # Global SCST attribute in key=value or key value format
+                    attribute = self._split_attribute_line(line)
+                    if attribute is not None:
+                        key, value = attribute
                         config.scst_attributes[key] = value
-                        i += 1
                     else:
                         self.logger.warning(
                             "Ignoring unrecognized line %s: '%s'", i + 1, line
                         )
-                        i += 1
-                else:
-                    self.logger.warning(
-                        "Ignoring unrecognized line %s: '%s'", i + 1, line
-                    )
                     i += 1
             except SCSTError:
                 raise  # Re-raise SCSTError as-is
@@ -213,7 +256,9 @@ class SCSTConfigParser:
                 f"Malformed {block_type} line at {start + 1}: '{line}' - {expected_format}"
             )
 
-        block_name = parts[1]
+        # Names recur as dict keys and LUN/group references; intern them so
+        # every mention shares one string
+        block_name = sys.intern(parts[1])
 
         # Check if opening brace is on the same line
         if line.endswith("{"):
@@ -221,38 +266,30 @@ class SCSTConfigParser:
         else:
             # Opening brace should be on next line
             content_start = start + 1
-            if content_start < len(lines) and lines[content_start].strip() == "{":
+            if content_start < len(lines) and lines[content_start] == "{":
                 content_start += 1
             else:
                 # No opening brace found - treat as empty block
                 return block_name, start + 1, start + 1
 
-        # Find matching closing brace by counting ALL braces (nested blocks supported)
-        brace_count = 1  # Start with 1 for the opening brace we already found
-        i = content_start
-        while i < len(lines) and brace_count > 0:
-            line_content = lines[i].strip()
-            # Count opening braces: "BLOCK_NAME {" patterns
-            if line_content.endswith("{"):
-                brace_count += 1
-            # Count closing braces: "}" at end of line (handles both standalone and inline)
-            elif line_content.endswith("}"):
-                brace_count -= 1
-            i += 1
-
-        if brace_count != 0:
+        # Matching closing brace comes from the map built once per parse; lines
+        # handed in as a plain list get their map built here instead
+        block_ends = getattr(lines, "block_ends", None)
+        if block_ends is None:
+            block_ends = _match_block_ends(lines)
+        block_end = block_ends.get(content_start - 1)
+        if block_end is None:
             raise SCSTError(
                 f"Unmatched braces in {block_type} {block_name} starting at line {start + 1}"
             )
 
-        return (
-            block_name,
-            content_start,
-            i - 1,
-        )  # i-1 because we want index of closing brace
+        return block_name, content_start, block_end
 
     def _parse_single_attribute_line(
-        self, line: str, attributes: Dict[str, str], attribute_handler: callable = None
+        self,
+        line: str,
+        attributes: Dict[str, str],
+        attribute_handler: Optional[_AttributeHandler] = None,
     ) -> bool:
         """Parse a single line for key-value attributes.
 
@@ -268,34 +305,16 @@ class SCSTConfigParser:
         Returns:
             True if line contained an attribute, False otherwise
         """
-        line = line.strip()
-        if not line:
+        attribute = self._split_attribute_line(line)
+        if attribute is None:
             return False
 
-        if "=" in line:
-            # Format: key=value
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = self._strip_quotes(value)
-            if attribute_handler:
-                attribute_handler(attributes, key, value)
-            else:
-                attributes[key] = value
-            return True
-        elif " " in line:
-            # Format: key value
-            parts = line.split(None, 1)  # Split on first whitespace
-            if len(parts) == 2:
-                key, value = parts
-                key = key.strip()
-                value = self._strip_quotes(value)
-                if attribute_handler:
-                    attribute_handler(attributes, key, value)
-                else:
-                    attributes[key] = value
-                return True
-
-        return False
+        key, value = attribute
+        if attribute_handler:
+            attribute_handler(attributes, key, value)
+        else:
+            attributes[key] = value
+        return True
 
     def _parse_attributes_in_block(
         self,
@@ -303,7 +322,7 @@ class SCSTConfigParser:
         start: int,
         end: int,
         attributes: Dict[str, str],
-        attribute_handler: callable = None,
+        attribute_handler: Optional[_AttributeHandler] = None,
     ) -> None:
         """Parse key-value attributes within a block using single-line parsing.
 
@@ -599,7 +618,15 @@ class SCSTConfigParser:
             )
 
         lun_number = parts[1]  # LUN number (e.g., "0", "1", "3")
-        device_name = parts[2] if len(parts) > 2 else None  # Optional device name
+        # Kept as the string key SCST uses; only checked, never round-tripped
+        # through int()
+        if not (lun_number.isascii() and lun_number.isdigit()):
+            raise SCSTError(
+                f"Malformed LUN line at {start + 1}: '{line}' - "
+                "LUN number must be a non-negative integer"
+            )
+        # Optional device name, interned like the DEVICE block that defines it
+        device_name = sys.intern(parts[2]) if len(parts) > 2 else None
 
         # Create initial dictionary format for attributes parsing
         lun_config_dict = {"device": device_name, "attributes": {}}
@@ -672,8 +699,9 @@ class SCSTConfigParser:
             lines, start, "GROUP", "expected GROUP <name>"
         )
 
-        # Initialize group configuration structure for parsing
-        group_config_dict = {"luns": {}, "initiators": [], "attributes": {}}
+        # Initialize group configuration structure for parsing; initiators are
+        # collected as dict keys so repeats drop out in O(1) and order is kept
+        group_config_dict = {"luns": {}, "initiators": {}, "attributes": {}}
 
         if content_start == content_end:
             # Empty group block - create InitiatorGroupConfig object
@@ -697,7 +725,7 @@ class SCSTConfigParser:
             elif line.startswith("INITIATOR "):
                 # Initiator IQN that belongs to this group
                 initiator = line.split()[1]
-                group_config_dict["initiators"].append(initiator)
+                group_config_dict["initiators"][initiator] = None
                 i += 1
             else:
                 # Parse group-level attributes using single-line parser
@@ -746,8 +774,9 @@ class SCSTConfigParser:
             lines, start, "DEVICE_GROUP", "expected DEVICE_GROUP <name>"
         )
 
-        # Initialize device group configuration structure
-        group_config = {"devices": [], "target_groups": {}, "attributes": {}}
+        # Initialize device group configuration structure; devices are dict keys
+        # like GROUP initiators, so a repeated DEVICE line is dropped in O(1)
+        group_config = {"devices": {}, "target_groups": {}, "attributes": {}}
 
         if content_start == content_end:
             # Empty device group block
@@ -769,8 +798,8 @@ class SCSTConfigParser:
 
             if line.startswith("DEVICE "):
                 # Device membership in this group
-                device = line.split()[1]
-                group_config["devices"].append(device)
+                device = sys.intern(line.split()[1])
+                group_config["devices"][device] = None
                 i += 1
             elif line.startswith("TARGET_GROUP "):
                 # Nested target group for ALUA configuration
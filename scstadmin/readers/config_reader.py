@@ -8,8 +8,7 @@ domain readers for improved organization and maintainability.
 """
 
 import logging
-import os
-from typing import Optional, Set, Dict
+from typing import Optional, Set, Dict, Tuple
 
 from ..config import SCSTConfig
 from ..sysfs import SCSTSysfs
@@ -78,11 +77,9 @@ class SCSTConfigurationReader:
     def _safe_read_attribute(self, attr_path: str) -> Optional[str]:
         """Safely read a sysfs attribute, returning None on any error"""
         try:
-            if os.path.isfile(attr_path):
-                return self.sysfs.read_sysfs_attribute(attr_path)
+            return self.sysfs.read_sysfs_attribute(attr_path)
         except (OSError, IOError, SCSTError):
-            pass
-        return None
+            return None
 
     def _read_attribute_if_non_default(self, attr_path: str) -> Optional[str]:
         """Read an attribute only if it has a non-default value (indicated by [key] suffix)
@@ -117,6 +114,12 @@ class SCSTConfigurationReader:
             handler, device_name, filter_attrs
         )
 
+    def _bulk_snapshot_devices(
+        self, devices: Dict[str, Tuple[str, Optional[Set[str]]]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Delegate to DeviceReader._bulk_snapshot()"""
+        return self.device_reader._bulk_snapshot(devices)
+
     def _get_current_target_attrs(
         self, driver: str, target_name: str, filter_attrs: Optional[Set[str]] = None
     ) -> Dict[str, str]:
@@ -137,6 +140,24 @@ class SCSTConfigurationReader:
         """Delegate to TargetReader for backward compatibility"""
         return self.target_reader._get_lun_create_params(driver, target, lun_attrs)
 
+    def _get_lun_mgmt_info(
+        self, driver: str, luns_mgmt: str
+    ) -> Optional[Dict[str, Set[str]]]:
+        """Delegate to TargetReader for backward compatibility"""
+        return self.target_reader._get_lun_mgmt_info(driver, luns_mgmt)
+
+    def _get_initiators_mgmt_commands(
+        self, driver: str, initiators_mgmt: str
+    ) -> Optional[Set[str]]:
+        """Delegate to TargetReader for backward compatibility"""
+        return self.target_reader._get_initiators_mgmt_commands(
+            driver, initiators_mgmt
+        )
+
+    def clear_mgmt_help_cache(self) -> None:
+        """Delegate to TargetReader"""
+        self.target_reader.clear_mgmt_help_cache()
+
     def _get_current_lun_device(self, driver: str, target: str, lun_number: str) -> str:
         """Delegate to TargetReader for backward compatibility"""
         return self.target_reader._get_current_lun_device(driver, target, lun_number)
@@ -5,13 +5,15 @@ Handles device discovery, handler type detection, and DeviceConfig creation.
 This module focuses on device-specific operations within the SCST configuration.
 """
 
+import errno
 import logging
 import os
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple
 
 from ..config import DeviceConfig, create_device_config
-from ..sysfs import SCSTSysfs
+from ..sysfs import SCSTSysfs, map_reads
 from ..exceptions import SCSTError
+from .target_reader import parse_mgmt_parameters
 
 
 class DeviceReader:
@@ -36,16 +38,17 @@ class DeviceReader:
         """
         handler_link = f"{self.sysfs.SCST_DEVICES}/{device_name}/handler"
         try:
-            if os.path.islink(handler_link):
-                # Read the symlink target: ../../handlers/vdisk_fileio -> vdisk_fileio
-                target = os.readlink(handler_link)
-                # Extract handler name from path like "../../handlers/vdisk_fileio"
-                handler_type = os.path.basename(target)
-                return handler_type
+            # Read the symlink target: ../../handlers/vdisk_fileio -> vdisk_fileio
+            # No islink() probe first: readlink() itself fails for a missing link
+            # (device without a handler) or a non-link (EINVAL)
+            target = os.readlink(handler_link)
+            # Extract handler name from path like "../../handlers/vdisk_fileio"
+            return os.path.basename(target)
         except (OSError, IOError) as e:
-            self.logger.warning(
-                "Failed to read handler type for device '%s': %s", device_name, e
-            )
+            if e.errno not in (errno.ENOENT, errno.EINVAL):
+                self.logger.warning(
+                    "Failed to read handler type for device '%s': %s", device_name, e
+                )
         return None
 
     def _create_minimal_device_config(
@@ -85,11 +88,9 @@ class DeviceReader:
     def _safe_read_attribute(self, attr_path: str) -> Optional[str]:
         """Safely read a sysfs attribute, returning None on any error"""
         try:
-            if os.path.isfile(attr_path):
-                return self.sysfs.read_sysfs_attribute(attr_path)
+            return self.sysfs.read_sysfs_attribute(attr_path)
         except (OSError, IOError, SCSTError):
-            pass
-        return None
+            return None
 
     def _get_current_device_attrs(
         self, handler: str, device_name: str, filter_attrs: Optional[Set[str]] = None
@@ -119,32 +120,46 @@ class DeviceReader:
             _get_current_device_attrs('vdisk_blockio', 'disk1', {'read_only', 'rotational'})
             -> {'read_only': '0', 'rotational': '1'}
         """
-        attrs = {}
+        device_path = f"{self.sysfs.SCST_HANDLERS}/{handler}/{device_name}"
         try:
-            device_path = f"{self.sysfs.SCST_HANDLERS}/{handler}/{device_name}"
-            if not os.path.exists(device_path):
-                return attrs
-
-            # If filter is provided, only read those specific attributes
+            # If filter is provided, only read those specific attributes;
+            # otherwise read all attribute files in the device directory (fallback)
             if filter_attrs:
-                for attr in filter_attrs:
-                    if attr == "handler":  # Skip handler attribute
-                        continue
-                    attr_path = os.path.join(device_path, attr)
-                    value = self._safe_read_attribute(attr_path)
-                    if value is not None:
-                        attrs[attr] = value
+                names = [attr for attr in filter_attrs if attr != "handler"]
             else:
-                # Read all attribute files in the device directory (fallback)
-                for item in os.listdir(device_path):
-                    item_path = os.path.join(device_path, item)
-                    if not item.startswith("."):
-                        value = self._safe_read_attribute(item_path)
-                        if value is not None:
-                            attrs[item] = value
-            return attrs
+                names = [
+                    item
+                    for item in os.listdir(device_path)
+                    if not item.startswith(".") and item != "handler"
+                ]
+            # One directory open for the whole device; missing attributes and
+            # subdirectories are simply left out of the result
+            return self.sysfs.read_many(device_path, names)
         except (OSError, IOError):
-            return attrs
+            return {}
+
+    def _bulk_snapshot(
+        self, devices: Dict[str, Tuple[str, Optional[Set[str]]]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Read the current attributes of several devices in one pass.
+
+        Each device is read with _get_current_device_attrs() (one directory
+        open per device). The per-device reads only touch sysfs, so they go
+        through map_reads() like TargetReader.read_drivers().
+
+        Args:
+            devices: Dict mapping device names to (handler, filter_attrs)
+
+        Returns:
+            Dict mapping device names to their current attribute values.
+            Devices that do not exist map to an empty dict.
+        """
+
+        def read_device(device_name: str) -> Dict[str, str]:
+            handler, filter_attrs = devices[device_name]
+            return self._get_current_device_attrs(handler, device_name, filter_attrs)
+
+        return map_reads(read_device, list(devices))
 
     def _parse_mgmt_parameters(self, mgmt_content: str) -> Set[str]:
         """Parse SCST management interface output to extract available parameters.
@@ -168,18 +183,7 @@ class DeviceReader:
                    "The following parameters available: filename, blocksize, read_only.\\n"
             Output: {'filename', 'blocksize', 'read_only'}
         """
-        parameters = set()
-        for line in mgmt_content.splitlines():
-            if "The following parameters available:" in line:
-                _, params_str = line.split(":", 1)
-                params_str = params_str.strip().rstrip(".")
-
-                for param in params_str.split(","):
-                    param = param.strip()
-                    if param:
-                        parameters.add(param)
-                break
-        return parameters
+        return parse_mgmt_parameters(mgmt_content)
 
     def read_devices(self) -> Dict[str, DeviceConfig]:
         """Read all devices from SCST sysfs for discovery operations.
@@ -190,7 +194,8 @@ class DeviceReader:
         devices = {}
         devices_path = self.sysfs.SCST_DEVICES
 
-        for device in self.sysfs.list_directory(devices_path):
+        # One scandir() pass; every entry under devices/ is a device directory
+        for device in self.sysfs.list_subdirectories(devices_path):
             if handler_type := self._get_device_handler_type(device):
                 if device_config := self._create_minimal_device_config(
                     device, handler_type
@@ -8,13 +8,107 @@ This module focuses on target-specific operations within the SCST configuration.
 import glob
 import logging
 import os
+import re
 from typing import Dict, Set, Optional
 
-from ..sysfs import SCSTSysfs
+from ..sysfs import SCSTSysfs, map_reads
 from ..exceptions import SCSTError
 from ..config import DriverConfig, TargetConfig
 from ..constants import SCSTConstants
 
+# Line listing the parameters of a mgmt command (add_device, add_target, ...)
+_MGMT_PARAMS_PREFIX = "The following parameters available:"
+
+# Sections of a target driver mgmt help text, in the order SCST prints them
+_TARGET_MGMT_SECTIONS = (
+    (_MGMT_PARAMS_PREFIX, "create_params"),
+    ("The following target driver attributes available:", "driver_attributes"),
+    ("The following target attributes available:", "target_attributes"),
+)
+
+
+def parse_target_mgmt_content(mgmt_content: str) -> Dict[str, Set[str]]:
+    """Parse the help text of a target driver mgmt file into attribute sets.
+
+    SCST prints the creation parameters, driver attributes and target attributes
+    sections in that fixed order, so the lines are scanned with a small state
+    machine: once a section is seen only the later section prefixes are tested,
+    and scanning stops after the last one.
+
+    Args:
+        mgmt_content: Content read from /sys/kernel/scst_tgt/targets/{driver}/mgmt
+
+    Returns:
+        Dictionary with 'create_params', 'driver_attributes' and
+        'target_attributes' sets (empty when a section is absent)
+    """
+    result = {key: set() for _, key in _TARGET_MGMT_SECTIONS}
+    state = 0
+    for line in mgmt_content.splitlines():
+        line = line.lstrip()
+        for index in range(state, len(_TARGET_MGMT_SECTIONS)):
+            prefix, key = _TARGET_MGMT_SECTIONS[index]
+            if line.startswith(prefix):
+                values = line[len(prefix):].strip().rstrip(".")
+                for value in values.split(","):
+                    value = value.strip()
+                    if value:
+                        result[key].add(value)
+                state = index + 1
+                break
+        if state == len(_TARGET_MGMT_SECTIONS):
+            break
+    return result
+
+
+def parse_mgmt_parameters(mgmt_content: str) -> Set[str]:
+    """Extract the parameter names from a handler or luns mgmt help text.
+
+    The help text lists them on one line:
+    "The following parameters available: param1, param2, param3."
+    The line is located with a single str.find() over the whole text rather
+    than splitting it into lines and testing each one.
+
+    Args:
+        mgmt_content: Raw text content from reading an SCST mgmt interface file
+
+    Returns:
+        Set of parameter names; empty set if no parameter line is found
+    """
+    start = mgmt_content.find(_MGMT_PARAMS_PREFIX)
+    if start < 0:
+        return set()
+    start += len(_MGMT_PARAMS_PREFIX)
+    end = mgmt_content.find("\n", start)
+    params_str = mgmt_content[start:] if end < 0 else mgmt_content[start:end]
+    params_str = params_str.strip().rstrip(".")
+    return {param for param in map(str.strip, params_str.split(",")) if param}
+
+
+def parse_mgmt_commands(mgmt_content: str) -> Set[str]:
+    """Extract the command names accepted by a mgmt file from its help text.
+
+    The help quotes each accepted command (echo "add H:C:I:L lun ..." >mgmt),
+    so the command names are the words that follow an opening quote.
+    """
+    return set(re.findall(r'"(\w+)', mgmt_content))
+
+
+def parse_lun_mgmt_content(mgmt_content: str) -> Dict[str, Set[str]]:
+    """Parse the help text of a luns/mgmt file.
+
+    Args:
+        mgmt_content: Content read from a target or initiator group luns/mgmt
+
+    Returns:
+        Dictionary with 'commands' (e.g. add, del, replace, clear) and
+        'create_params' sets
+    """
+    return {
+        "commands": parse_mgmt_commands(mgmt_content),
+        "create_params": parse_mgmt_parameters(mgmt_content),
+    }
+
 
 class TargetReader:
     """Reads SCST target and driver configuration from sysfs.
@@ -29,6 +123,8 @@ class TargetReader:
 
         # Initialize caches
         self._mgmt_cache = {}  # Cache for target management interface info
+        self._lun_mgmt_cache: Dict[str, Dict[str, Set[str]]] = {}  # Per driver
+        self._initiators_mgmt_cache: Dict[str, Set[str]] = {}  # Per driver
 
     def _parse_target_mgmt_interface(self, driver_name: str) -> Dict[str, set]:
         """Parse SCST target driver management interface to discover available attributes.
@@ -82,32 +178,7 @@ class TargetReader:
                 return result
 
             mgmt_content = self.sysfs.read_sysfs(driver_mgmt)
-
-            # Parse different types of available attributes/parameters
-            for line in mgmt_content.splitlines():
-                if "The following parameters available:" in line:
-                    _, params_str = line.split(":", 1)
-                    params_str = params_str.strip().rstrip(".")
-                    for param in params_str.split(","):
-                        param = param.strip()
-                        if param:
-                            result["create_params"].add(param)
-
-                elif "The following target driver attributes available:" in line:
-                    _, attrs_str = line.split(":", 1)
-                    attrs_str = attrs_str.strip().rstrip(".")
-                    for attr in attrs_str.split(","):
-                        attr = attr.strip()
-                        if attr:
-                            result["driver_attributes"].add(attr)
-
-                elif "The following target attributes available:" in line:
-                    _, attrs_str = line.split(":", 1)
-                    attrs_str = attrs_str.strip().rstrip(".")
-                    for attr in attrs_str.split(","):
-                        attr = attr.strip()
-                        if attr:
-                            result["target_attributes"].add(attr)
+            result = parse_target_mgmt_content(mgmt_content)
 
         except SCSTError:
             # If we can't read mgmt interface, return empty sets
@@ -147,41 +218,82 @@ class TargetReader:
 
         return create_params
 
-    def _get_lun_create_params(
-        self, driver: str, target: str, lun_attrs: Dict[str, str]
-    ) -> Dict[str, str]:
-        """Get LUN assignment creation parameters from luns mgmt interface"""
-        create_params = {}
+    def _get_lun_mgmt_info(
+        self, driver: str, luns_mgmt: str
+    ) -> Optional[Dict[str, Set[str]]]:
+        """Get the parsed luns/mgmt help of a driver with caching.
 
-        try:
-            luns_mgmt = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/luns/mgmt"
-            if not self.sysfs.valid_path(luns_mgmt):
-                return create_params
+        Every target and initiator group luns/mgmt of a driver prints the same
+        help, so it is read from whichever luns/mgmt the caller has at hand and
+        parsed once per driver. Failed reads are not cached, since a target
+        created later in the same run will have a readable luns/mgmt.
 
-            mgmt_content = self.sysfs.read_sysfs(luns_mgmt)
+        Args:
+            driver: SCST target driver name
+            luns_mgmt: Any target or initiator group luns/mgmt path of the driver
 
-            # Parse management interface for available parameters
-            available_params = self._parse_mgmt_parameters(mgmt_content)
+        Returns:
+            parse_lun_mgmt_content() result, or None if luns_mgmt cannot be read
+        """
+        info = self._lun_mgmt_cache.get(driver)
+        if info is None:
+            try:
+                mgmt_content = self.sysfs.read_sysfs(luns_mgmt)
+            except SCSTError:
+                return None
+            info = parse_lun_mgmt_content(mgmt_content)
+            self._lun_mgmt_cache[driver] = info
+        return info
 
-            # Return only attributes that are valid creation parameters
-            for attr, value in lun_attrs.items():
-                if attr in available_params:
-                    create_params[attr] = value
+    def _get_initiators_mgmt_commands(
+        self, driver: str, initiators_mgmt: str
+    ) -> Optional[Set[str]]:
+        """Get the commands accepted by a driver's initiators/mgmt with caching.
 
-        except SCSTError:
+        Counterpart of _get_lun_mgmt_info() for the initiator group
+        initiators/mgmt files, whose help is likewise the same for every group.
+
+        Returns:
+            Command names, or None if initiators_mgmt cannot be read
+        """
+        commands = self._initiators_mgmt_cache.get(driver)
+        if commands is None:
+            try:
+                mgmt_content = self.sysfs.read_sysfs(initiators_mgmt)
+            except SCSTError:
+                return None
+            commands = parse_mgmt_commands(mgmt_content)
+            self._initiators_mgmt_cache[driver] = commands
+        return commands
+
+    def clear_mgmt_help_cache(self) -> None:
+        """Forget the parsed luns/mgmt and initiators/mgmt help, which may change
+        across module reloads"""
+        self._lun_mgmt_cache.clear()
+        self._initiators_mgmt_cache.clear()
+
+    def _get_lun_create_params(
+        self, driver: str, target: str, lun_attrs: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Get LUN assignment creation parameters from luns mgmt interface"""
+        luns_mgmt = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/luns/mgmt"
+        lun_mgmt_info = self._get_lun_mgmt_info(driver, luns_mgmt)
+        if lun_mgmt_info is None:
             # If we can't read mgmt interface, assume no creation parameters
-            pass
+            return {}
 
-        return create_params
+        # Return only attributes that are valid creation parameters
+        available_params = lun_mgmt_info["create_params"]
+        return {
+            attr: value for attr, value in lun_attrs.items() if attr in available_params
+        }
 
     def _safe_read_attribute(self, attr_path: str) -> Optional[str]:
         """Safely read a sysfs attribute, returning None on any error"""
         try:
-            if os.path.isfile(attr_path):
-                return self.sysfs.read_sysfs_attribute(attr_path)
+            return self.sysfs.read_sysfs_attribute(attr_path)
         except (OSError, IOError, SCSTError):
-            pass
-        return None
+            return None
 
     def _read_attribute_if_non_default(self, attr_path: str) -> Optional[str]:
         """Read an attribute only if it has a non-default value (indicated by [key] suffix)
@@ -219,73 +331,47 @@ class TargetReader:
             Dict mapping attribute names to values, with multi-values joined by semicolons
         """
         attrs = {}
+        target_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target_name}"
         try:
-            target_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target_name}"
-            if not os.path.exists(target_path):
-                return attrs
+            if not filter_attrs:
+                # Read all attribute files in the target directory (fallback)
+                names = [
+                    item
+                    for item in os.listdir(target_path)
+                    if not item.startswith(".")
+                    and item not in ("luns", "ini_groups", "sessions")
+                ]
+                return self.sysfs.read_many(target_path, names)
 
             # Filtered read: only query specific attributes for performance (vs reading all)
-            if filter_attrs:
-                # Query SCST management interface to understand attribute types
-                mgmt_info = self._get_target_mgmt_info(driver)
-
-                for attr in filter_attrs:
-                    # Skip creation-time-only params (can't be read/compared post-creation)
-                    # Matches Perl scstladmin filterCreateAttributes(TRUE) behavior
-                    if attr in mgmt_info["create_params"]:
-                        continue
-
-                    # Multi-value attributes: IncomingUser, OutgoingUser, etc. can have multiple entries
-                    # SCST stores as: IncomingUser, IncomingUser1, IncomingUser2, IncomingUser3...
-                    if attr in mgmt_info["target_attributes"]:
-                        collected_values = []
-
-                        # Phase 1: Try base attribute name (IncomingUser -> /sys/.../IncomingUser)
-                        attr_path = os.path.join(target_path, attr)
-                        value = self._safe_read_attribute(attr_path)
-                        if value:
-                            collected_values.append(value)
-
-                        # Phase 2: Collect numbered variants (IncomingUser1, IncomingUser2, ...)
-                        # Continue until we hit a non-existent numbered attribute
-                        counter = 1
-                        while True:
-                            numbered_attr_path = os.path.join(
-                                target_path, f"{attr}{counter}"
-                            )
-                            value = self._safe_read_attribute(numbered_attr_path)
-                            if value is not None:  # Attribute file exists
-                                if value:  # Non-empty value
-                                    collected_values.append(value)
-                                counter += 1
-                            else:
-                                break
-
-                        # Store as semicolon-separated if multiple values
-                        if collected_values:
-                            attrs[attr] = ";".join(collected_values)
-
-                    else:
-                        # Regular attribute - read single file
-                        attr_path = os.path.join(target_path, attr)
-                        if os.path.isfile(attr_path):
-                            try:
-                                value = self.sysfs.read_sysfs_attribute(attr_path)
-                                attrs[attr] = value
-                            except SCSTError:
-                                continue
-            else:
-                # Read all attribute files in the target directory (fallback)
-                for item in os.listdir(target_path):
-                    item_path = os.path.join(target_path, item)
-                    if not item.startswith(".") and item not in [
-                        "luns",
-                        "ini_groups",
-                        "sessions",
-                    ]:
-                        value = self._safe_read_attribute(item_path)
-                        if value is not None:
-                            attrs[item] = value
+            # Query SCST management interface to understand attribute types
+            mgmt_info = self._get_target_mgmt_info(driver)
+
+            regular_attrs = []
+            for attr in filter_attrs:
+                # Skip creation-time-only params (can't be read/compared post-creation)
+                # Matches Perl scstladmin filterCreateAttributes(TRUE) behavior
+                if attr in mgmt_info["create_params"]:
+                    continue
+
+                # Multi-value attributes: IncomingUser, OutgoingUser, etc. can have multiple entries
+                # SCST stores as: IncomingUser, IncomingUser1, IncomingUser2, IncomingUser3...
+                if attr in mgmt_info["target_attributes"]:
+                    collected_values = [
+                        value
+                        for _, value in self.sysfs.read_attribute_variants(
+                            target_path, attr
+                        )
+                    ]
+                    # Store as semicolon-separated if multiple values
+                    if collected_values:
+                        attrs[attr] = ";".join(collected_values)
+                else:
+                    regular_attrs.append(attr)
+
+            # Regular attributes are read together relative to one directory fd
+            if regular_attrs:
+                attrs.update(self.sysfs.read_many(target_path, regular_attrs))
             return attrs
         except (OSError, IOError):
             return attrs
@@ -343,120 +429,102 @@ class TargetReader:
     def _parse_mgmt_parameters(self, mgmt_content: str) -> Set[str]:
         """Parse SCST management interface output to extract available parameters.
 
-        SCST management interfaces provide help text when read, listing the available
-        parameters for operations like device creation. This method extracts those
-        parameter names from the formatted help output.
-
-        The expected format is:
-        "The following parameters available: param1, param2, param3."
-
-        Args:
-            mgmt_content: Raw text content from reading an SCST mgmt interface file
-
-        Returns:
-            Set of parameter names that can be used with SCST commands.
-            Returns empty set if no parameter line is found.
-
-        Example:
-            Input: "Usage: add_device dev_name [parameters]\\n" +
-                   "The following parameters available: filename, blocksize, read_only.\\n"
-            Output: {'filename', 'blocksize', 'read_only'}
+        See parse_mgmt_parameters(), which DeviceReader shares.
         """
-        parameters = set()
-        for line in mgmt_content.splitlines():
-            if "The following parameters available:" in line:
-                _, params_str = line.split(":", 1)
-                params_str = params_str.strip().rstrip(".")
-
-                for param in params_str.split(","):
-                    param = param.strip()
-                    if param:
-                        parameters.add(param)
-                break
-        return parameters
+        return parse_mgmt_parameters(mgmt_content)
 
     def read_drivers(self) -> Dict[str, DriverConfig]:
         """Read all target drivers from SCST sysfs for discovery operations.
 
+        Each driver is read independently and only with sysfs reads, so with
+        several drivers loaded they are read concurrently via map_reads(), as
+        the target writer does for its snapshots.
+
         Returns:
             Dict mapping driver names to DriverConfig objects
         """
-        drivers = {}
-        targets_path = self.sysfs.SCST_TARGETS
-
-        for driver in self.sysfs.list_directory(targets_path):
-            driver_path = f"{targets_path}/{driver}"
-            driver_config = {"targets": {}, "attributes": {}}
-
-            # Read driver attributes from live system (only non-default values)
-            driver_attrs = SCSTConstants.DRIVER_ATTRIBUTES.get(driver, set())
-            for attr_name in driver_attrs:
-                # Skip non-attribute entries
-                if attr_name in {
-                    self.sysfs.MGMT_INTERFACE,
-                    "type",
-                    "trace_level",
-                    "open_state",
-                    "version",
-                }:
-                    continue
+        driver_names = self.sysfs.list_directory(self.sysfs.SCST_TARGETS)
+        return map_reads(self._read_driver, driver_names)
 
-                attr_path = f"{driver_path}/{attr_name}"
-                if self.sysfs.valid_path(attr_path):
-                    attr_value = self._read_attribute_if_non_default(attr_path)
-                    if attr_value is not None:
-                        driver_config["attributes"][attr_name] = attr_value
+    def _read_driver(self, driver: str) -> DriverConfig:
+        """Read one target driver's non-default attributes and its targets.
 
-            # Read driver mgmt attributes (IncomingUser, OutgoingUser, etc.)
-            # These are dynamically created via add_attribute commands
-            mgmt_info = self._get_target_mgmt_info(driver)
-            driver_mgmt_attrs = mgmt_info.get("driver_attributes", set())
-            for attr_name in driver_mgmt_attrs:
-                # Use glob to find all variants (IncomingUser, IncomingUser1, IncomingUser2, etc.)
-                # Numbered variants may have gaps (e.g., IncomingUser, IncomingUser2, IncomingUser5)
-                collected_values = []
-                pattern = os.path.join(driver_path, f"{attr_name}*")
-                for attr_file in glob.glob(pattern):
-                    if value := self._safe_read_attribute(attr_file):
-                        collected_values.append(value)
-
-                # Store as semicolon-separated if multiple values
-                if collected_values:
-                    driver_config["attributes"][attr_name] = ";".join(collected_values)
-
-            # Read targets for this driver
-            # Get known driver attributes to skip for target detection
-            driver_attrs_for_skip = SCSTConstants.DRIVER_ATTRIBUTES.get(driver, set())
-            driver_attrs_for_skip.update(
-                {self.sysfs.MGMT_INTERFACE, self.sysfs.ENABLED_ATTR}
-            )  # Always skip these
-
-            for target in self.sysfs.list_directory(driver_path):
-                if target not in driver_attrs_for_skip:
-                    # Only include actual targets, not driver attributes
-                    target_path = f"{driver_path}/{target}"
-                    if os.path.isdir(target_path):
-                        # Verify it's a real target by checking for target-specific subdirectories
-                        has_luns = self.sysfs.valid_path(f"{target_path}/luns")
-                        has_ini_groups = self.sysfs.valid_path(
-                            f"{target_path}/ini_groups"
-                        )
-                        has_sessions = self.sysfs.valid_path(f"{target_path}/sessions")
-
-                        if has_luns or has_ini_groups or has_sessions:
-                            # Create TargetConfig object for this target
-                            target_config_dict = {
-                                "luns": {},
-                                "groups": {},
-                                "attributes": {},
-                            }
-                            driver_config["targets"][target] = (
-                                TargetConfig.from_config_dict(
-                                    target, target_config_dict
-                                )
-                            )
-
-            # Create DriverConfig object from collected data
-            drivers[driver] = DriverConfig.from_config_dict(driver, driver_config)
-
-        return drivers
+        Args:
+            driver: SCST target driver name (e.g., 'iscsi')
+
+        Returns:
+            DriverConfig with minimal TargetConfig objects for discovery
+        """
+        driver_path = f"{self.sysfs.SCST_TARGETS}/{driver}"
+        driver_config = {"targets": {}, "attributes": {}}
+
+        # Read driver attributes from live system (only non-default values)
+        driver_attrs = SCSTConstants.DRIVER_ATTRIBUTES.get(driver, set())
+        for attr_name in driver_attrs:
+            # Skip non-attribute entries
+            if attr_name in {
+                self.sysfs.MGMT_INTERFACE,
+                "type",
+                "trace_level",
+                "open_state",
+                "version",
+            }:
+                continue
+
+            attr_path = f"{driver_path}/{attr_name}"
+            if self.sysfs.valid_path(attr_path):
+                attr_value = self._read_attribute_if_non_default(attr_path)
+                if attr_value is not None:
+                    driver_config["attributes"][attr_name] = attr_value
+
+        # Read driver mgmt attributes (IncomingUser, OutgoingUser, etc.)
+        # These are dynamically created via add_attribute commands
+        mgmt_info = self._get_target_mgmt_info(driver)
+        driver_mgmt_attrs = mgmt_info.get("driver_attributes", set())
+        for attr_name in driver_mgmt_attrs:
+            # Use glob to find all variants (IncomingUser, IncomingUser1, IncomingUser2, etc.)
+            # Numbered variants may have gaps (e.g., IncomingUser, IncomingUser2, IncomingUser5)
+            collected_values = []
+            pattern = os.path.join(driver_path, f"{attr_name}*")
+            for attr_file in glob.glob(pattern):
+                if value := self._safe_read_attribute(attr_file):
+                    collected_values.append(value)
+
+            # Store as semicolon-separated if multiple values
+            if collected_values:
+                driver_config["attributes"][attr_name] = ";".join(collected_values)
+
+        # Read targets for this driver
+        # Get known driver attributes to skip for target detection
+        # Always skip mgmt and enabled; build a new set rather than updating
+        # the shared DRIVER_ATTRIBUTES entry in place
+        driver_attrs_for_skip = {
+            self.sysfs.MGMT_INTERFACE,
+            self.sysfs.ENABLED_ATTR,
+        }.union(SCSTConstants.DRIVER_ATTRIBUTES.get(driver, ()))
+
+        # One scandir() pass: attribute files are filtered out by d_type
+        # instead of an isdir() stat per entry
+        for target in self.sysfs.list_subdirectories(driver_path):
+            if target not in driver_attrs_for_skip:
+                # Only include actual targets, not driver attributes
+                target_path = f"{driver_path}/{target}"
+                # Verify it's a real target by checking for target-specific
+                # subdirectories; stop probing at the first one found
+                if (
+                    self.sysfs.valid_path(f"{target_path}/luns")
+                    or self.sysfs.valid_path(f"{target_path}/ini_groups")
+                    or self.sysfs.valid_path(f"{target_path}/sessions")
+                ):
+                    # Create TargetConfig object for this target
+                    target_config_dict = {
+                        "luns": {},
+                        "groups": {},
+                        "attributes": {},
+                    }
+                    driver_config["targets"][target] = TargetConfig.from_config_dict(
+                        target, target_config_dict
+                    )
+
+        # Create DriverConfig object from collected data
+        return DriverConfig.from_config_dict(driver, driver_config)
@@ -18,7 +18,8 @@ This is the foundational layer for all SCST management operations.
 import os
 import time
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .constants import SCSTConstants
 from .exceptions import SCSTError
@@ -93,9 +94,10 @@ class SCSTSysfs:
             if not os.access(path, os.W_OK):
                 raise SCSTError(f"No write permission for: {path}")
 
-            # Clean up data representation for logging
-            data_repr = repr(data) if "\n" in data or not data.strip() else data
-            self.logger.debug("Writing %s to %s", data_repr, path)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # Clean up data representation for logging
+                data_repr = repr(data) if "\n" in data or not data.strip() else data
+                self.logger.debug("Writing %s to %s", data_repr, path)
 
             with open(path, "w") as f:
                 f.write(data)
@@ -118,6 +120,54 @@ class SCSTSysfs:
                 return True
             raise SCSTError(f"Error writing to {path}: {e}")
 
+    def write_sysfs_batch(
+        self, path: str, commands: List[str], check_result: bool = True
+    ) -> List[Tuple[str, SCSTError]]:
+        """Write several commands to one sysfs file through a single open fd.
+        SCST mgmt files take exactly one command per write() and report its
+        status through last_sysfs_mgmt_res, so the commands cannot be joined
+        into one buffer or one writev(). They are written one by one with the
+        same per-command result handling as write_sysfs(), but the file is
+        opened and closed once for the whole batch.
+        Args:
+            path: Absolute sysfs path to write to (typically a mgmt file)
+            commands: Commands to write, in order
+            check_result: Whether to check the operation result after each write
+        Returns:
+            (command, error) for every command that failed; the remaining
+            commands are still written
+        Raises:
+            SCSTError: If the file cannot be opened (no command was written)
+        """
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+        except PermissionError:
+            raise SCSTError(f"Permission denied writing to {path}")
+        except OSError as e:
+            raise SCSTError(f"Error writing to {path}: {e}")
+
+        failures = []
+        try:
+            for data in commands:
+                self.logger.debug("Writing %s to %s", data, path)
+                try:
+                    try:
+                        os.write(fd, data.encode())
+                    except OSError as e:
+                        if e.errno != SCSTConstants.EAGAIN_ERRNO:
+                            raise SCSTError(f"Error writing to {path}: {e}")
+                        # Resource temporarily unavailable - operation still running
+                        if check_result:
+                            self._wait_for_completion()
+                    else:
+                        if check_result:
+                            self._check_operation_result()
+                except SCSTError as e:
+                    failures.append((data, e))
+        finally:
+            os.close(fd)
+        return failures
+
     def read_sysfs(self, path: str) -> str:
         """Read data from a sysfs file with error handling.
 
@@ -146,6 +196,11 @@ class SCSTSysfs:
         SCST attributes show non-default values with a '\n[key]' suffix.
         This method returns only the actual value by reading the first line.
 
+        Readers call this for every attribute they compare, so it goes
+        through read_sysfs_attribute_fast(): a missing or unreadable file
+        fails in the open itself instead of being probed with exists/access
+        first.
+
         Args:
             path: Absolute sysfs path to attribute file
 
@@ -155,17 +210,158 @@ class SCSTSysfs:
         Raises:
             SCSTError: On path validation or read failures
         """
+        return self.read_sysfs_attribute_fast(path)
+
+    def read_sysfs_attribute_fast(self, path: str, dir_fd: Optional[int] = None) -> str:
+        """Read the value line of an SCST attribute with raw unbuffered I/O.
+        Backs read_sysfs_attribute() and can also read relative to an open
+        directory: no exists/access probes and no text-mode file object
+        (codec lookup, buffering, newline translation), just a single
+        os.open/os.read/os.close. Sysfs attributes fit in one page, so one
+        read returns the whole value.
+        Args:
+            path: Absolute sysfs path to attribute file, or a name relative to dir_fd
+            dir_fd: Optional open directory fd (see open_directory()); the open is
+                   then an openat() and the directory path is not walked again
+        Returns:
+            Attribute value without the [key] suffix
+        Raises:
+            SCSTError: If the attribute is missing or cannot be read
+        """
         try:
-            if not self.valid_path(path):
-                raise SCSTError(f"Cannot read from {path}")
-
-            with open(path, "r") as f:
-                # Read only the first line and strip trailing newline
-                # This handles SCST's pattern where non-default values have '\n[key]' appended
-                return f.readline().rstrip("\n")
-
+            fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC, dir_fd=dir_fd)
         except OSError as e:
             raise SCSTError(f"Error reading from {path}: {e}")
+        try:
+            data = os.read(fd, 4096)
+        except OSError as e:
+            raise SCSTError(f"Error reading from {path}: {e}")
+        finally:
+            os.close(fd)
+        return data.split(b"\n", 1)[0].decode()
+
+    def write_sysfs_attribute_fast(
+        self, path: str, data: str, dir_fd: Optional[int] = None
+    ) -> None:
+        """Write a plain attribute with a single open/write/close.
+        Counterpart of read_sysfs_attribute_fast() for regular (non-mgmt)
+        attributes: no exists/access probes and no operation result check.
+        A missing or read-only attribute fails in the open itself; the OSError
+        is chained as __cause__ so callers can tell the two apart.
+        Args:
+            path: Absolute sysfs path to attribute file, or a name relative to dir_fd
+            data: Value to write
+            dir_fd: Optional open directory fd (see open_directory())
+        Raises:
+            SCSTError: If the attribute cannot be opened or written
+        """
+        self.logger.debug("Writing %s to %s", data, path)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC, dir_fd=dir_fd)
+        except OSError as e:
+            raise SCSTError(f"Error writing to {path}: {e}") from e
+        try:
+            os.write(fd, data.encode())
+        except OSError as e:
+            raise SCSTError(f"Error writing to {path}: {e}") from e
+        finally:
+            os.close(fd)
+
+    def open_directory(self, path: str) -> int:
+        """Open a sysfs directory for use as dir_fd in relative lookups.
+        Uses O_PATH where available: the fd only anchors openat() calls and
+        never reads the directory itself. The caller must os.close() it.
+        Args:
+            path: Absolute sysfs directory path (e.g., a driver directory)
+        Returns:
+            Open directory file descriptor
+        Raises:
+            OSError: If the directory does not exist or cannot be opened
+        """
+        return os.open(
+            path, getattr(os, "O_PATH", os.O_RDONLY) | os.O_DIRECTORY | os.O_CLOEXEC
+        )
+
+    def read_attribute_variants(
+        self, dir_path: str, attr_name: str
+    ) -> List[Tuple[str, str]]:
+        """Read a multi-value attribute and its numbered variants.
+        SCST exposes repeated mgmt attributes as attr, attr1, attr2, ... in the
+        entity directory. The directory is opened once and each variant is read
+        relative to it (openat), so the full sysfs path is only resolved once.
+        Args:
+            dir_path: Entity sysfs directory (e.g., a target directory)
+            attr_name: Base attribute name (e.g., 'IncomingUser')
+        Returns:
+            List of (variant_name, value) tuples for non-empty variants, base
+            attribute first; numbered variants stop at the first missing one
+        Raises:
+            OSError: If the directory exists but cannot be opened
+        """
+        try:
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        except FileNotFoundError:
+            return []
+
+        variants = []
+        try:
+            counter = 0
+            while True:
+                name = f"{attr_name}{counter}" if counter else attr_name
+                try:
+                    fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    if counter:
+                        break
+                    counter += 1
+                    continue
+                except OSError:
+                    # Present but unreadable, move on to the next variant
+                    counter += 1
+                    continue
+                try:
+                    value = os.read(fd, 4096).decode().split("\n", 1)[0]
+                except OSError:
+                    value = ""
+                finally:
+                    os.close(fd)
+                if value:
+                    variants.append((name, value))
+                counter += 1
+        finally:
+            os.close(dir_fd)
+        return variants
+
+    def read_many(self, dir_path: str, names: Iterable[str]) -> Dict[str, str]:
+        """Read several attributes of one entity directory in a single pass.
+        The directory is opened once and every name is read relative to it
+        with read_sysfs_attribute_fast(), so a device with dozens of
+        attributes costs one path walk plus an openat/read/close per
+        attribute, with no exists/isfile probe in between.
+        Args:
+            dir_path: Entity sysfs directory (e.g., a handler device directory)
+            names: Attribute names inside dir_path
+        Returns:
+            Dict of attribute name to value (without the [key] suffix); names
+            that are missing, unreadable or not regular files are left out
+        Raises:
+            OSError: If the directory exists but cannot be opened
+        """
+        try:
+            dir_fd = self.open_directory(dir_path)
+        except FileNotFoundError:
+            return {}
+
+        values = {}
+        try:
+            for name in names:
+                try:
+                    values[name] = self.read_sysfs_attribute_fast(name, dir_fd=dir_fd)
+                except SCSTError:
+                    continue
+        finally:
+            os.close(dir_fd)
+        return values
 
     def _check_operation_result(self) -> bool:
         """Check the result of an asynchronous operation"""
@@ -228,8 +424,61 @@ class SCSTSysfs:
         item_path = os.path.join(base_path, item_name)
         return os.path.isdir(item_path)
 
+    def list_files(self, path: str, exclude_mgmt: bool = True) -> List[str]:
+        """List the regular files of a sysfs directory in a single pass.
+        Counterpart of list_subdirectories() for entries SCST exposes as files,
+        such as initiator names under ini_groups/{group}/initiators/.
+        Args:
+            path: Parent sysfs directory path
+            exclude_mgmt: If True, omit the 'mgmt' interface file
+        Returns:
+            Names of regular files; empty list if path does not exist
+        Raises:
+            OSError: If the directory exists but cannot be read
+        """
+        try:
+            with os.scandir(path) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if entry.is_file()
+                    and not (exclude_mgmt and entry.name == self.MGMT_INTERFACE)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def list_subdirectories(self, path: str, exclude_mgmt: bool = True) -> List[str]:
+        """List the entity subdirectories of a sysfs directory in a single pass.
+        Equivalent to filtering os.listdir() through is_valid_sysfs_directory(),
+        but uses os.scandir() so the directory check comes from the d_type
+        returned with the directory listing instead of a stat() per entry.
+        Args:
+            path: Parent sysfs directory path
+            exclude_mgmt: If True, omit the 'mgmt' interface entry
+        Returns:
+            Names of valid subdirectories; empty list if path does not exist
+        Raises:
+            OSError: If the directory exists but cannot be read
+        """
+        try:
+            with os.scandir(path) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir()
+                    and not (exclude_mgmt and entry.name == self.MGMT_INTERFACE)
+                ]
+        except FileNotFoundError:
+            return []
+
     def mgmt_operation(
-        self, mgmt_path: str, command: str, item: str, success_msg: str, error_msg: str
+        self,
+        mgmt_path: str,
+        command: str,
+        item: str,
+        success_msg: str,
+        error_msg: str,
+        *msg_args: object,
     ) -> bool:
         """Generic method for mgmt interface operations (add/del/create)
         Args:
@@ -238,13 +487,40 @@ class SCSTSysfs:
             item: Item to operate on
             success_msg: Debug message for successful operation
             error_msg: Warning message prefix for failed operation
+            *msg_args: Optional %-style arguments for both messages; formatting
+                      is then deferred until a message is actually emitted
         Returns:
             True if operation succeeded, False if it failed
         """
         try:
             self.write_sysfs(mgmt_path, f"{command} {item}")
-            self.logger.debug(success_msg)
+            self.logger.debug(success_msg, *msg_args)
             return True
         except SCSTError as e:
+            if msg_args:
+                error_msg = error_msg % msg_args
             self.logger.warning("%s: %s", error_msg, e)
             return False
+
+
+def map_reads(read: Callable[[str], Any], names: List[str]) -> Dict[str, Any]:
+    """Call read(name) for every name and map each name to its result.
+
+    With more than one name the calls overlap on a small thread pool, which
+    pays off because the GIL is released while a sysfs read is in the kernel.
+    Only pass read-only callables: SCST reports mgmt results through a single
+    shared last_sysfs_mgmt_res file, so writes must stay serial.
+
+    Args:
+        read: Function reading one item from sysfs
+        names: Names to read, e.g. targets, drivers or devices
+
+    Returns:
+        Dict mapping each name to read(name), in the order of names
+    """
+    if len(names) < 2:
+        return {name: read(name) for name in names}
+    with ThreadPoolExecutor(
+        max_workers=min(SCSTConstants.SNAPSHOT_WORKERS, len(names))
+    ) as executor:
+        return dict(zip(names, executor.map(read, names)))
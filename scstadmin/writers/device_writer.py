@@ -5,7 +5,7 @@ This module handles device-specific write operations for SCST configuration.
 """
 
 import logging
-from typing import Dict
+from typing import Dict, Optional, Set
 
 from ..sysfs import SCSTSysfs
 from ..exceptions import SCSTError
@@ -147,6 +147,15 @@ class DeviceWriter:
         if post_creation_attrs:
             self.set_device_attributes(handler, device_name, post_creation_attrs)
 
+    @staticmethod
+    def _creation_params_of(device_config: DeviceConfig) -> Set[str]:
+        """Return every creation parameter of a device's handler type"""
+        return (
+            device_config._CREATION_PARAMS
+            if hasattr(device_config, "_CREATION_PARAMS")
+            else set()
+        )
+
     def determine_device_action(
         self,
         handler: str,
@@ -154,30 +163,34 @@ class DeviceWriter:
         device_config: DeviceConfig,
         creation_params: Dict[str, str],
         post_creation_attrs: Dict[str, str],
+        existing_device_attrs: Optional[Dict[str, str]] = None,
     ) -> ConfigAction:
         """Determine what action to take for an existing device.
 
         Matches Perl scstadmin behavior: checks if any [key]-marked creation attributes
         exist in current device but not in config, which requires device recreation.
 
+        Args:
+            existing_device_attrs: Current attributes from
+                _bulk_snapshot_devices(); sysfs is read when not given
+
         Returns:
             ConfigAction.SKIP: Device already matches configuration
             ConfigAction.UPDATE: Only post-creation attributes need updating
             ConfigAction.RECREATE: Creation attributes differ, device must be recreated
         """
         # Get all possible creation parameters for this handler type
-        all_creation_params = (
-            device_config._CREATION_PARAMS
-            if hasattr(device_config, "_CREATION_PARAMS")
-            else set()
-        )
+        all_creation_params = self._creation_params_of(device_config)
 
         # Read current attributes - check all creation params, not just ones in config
         # This matches Perl's behavior of checking ALL device attributes
-        config_attrs_to_check = all_creation_params | set(post_creation_attrs.keys())
-        existing_device_attrs = self.config_reader._get_current_device_attrs(
-            handler, device_name, config_attrs_to_check
-        )
+        if existing_device_attrs is None:
+            config_attrs_to_check = all_creation_params | set(
+                post_creation_attrs.keys()
+            )
+            existing_device_attrs = self.config_reader._get_current_device_attrs(
+                handler, device_name, config_attrs_to_check
+            )
 
         # Check for [key]-marked creation attributes that exist in device but not in config
         # This matches Perl's compareToKeyAttribute() logic (lines 2949-2951)
@@ -230,6 +243,19 @@ class DeviceWriter:
         self.logger.debug(
             "Applying device configurations. Found %s devices", len(config.devices)
         )
+        # Read the attributes of every configured device up front, overlapping
+        # the sysfs reads; devices that do not exist yet just come back empty
+        current_attrs = self.config_reader._bulk_snapshot_devices(
+            {
+                device_name: (
+                    device_config.handler_type,
+                    self._creation_params_of(device_config)
+                    | set(device_config.post_creation_attributes.keys()),
+                )
+                for device_name, device_config in config.devices.items()
+            }
+        )
+
         for device_name, device_config in config.devices.items():
             handler = device_config.handler_type
 
@@ -245,6 +271,7 @@ class DeviceWriter:
                     device_config,
                     creation_params,
                     post_creation_attrs,
+                    existing_device_attrs=current_attrs.get(device_name),
                 )
                 if action == ConfigAction.SKIP:
                     self.logger.debug(
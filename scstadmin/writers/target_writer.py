@@ -8,18 +8,70 @@ import glob
 import os
 import time
 import logging
-from pathlib import Path
-from typing import Dict, Any, Optional, TYPE_CHECKING
-
-from ..sysfs import SCSTSysfs
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Any,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ..sysfs import SCSTSysfs, map_reads
 from ..exceptions import SCSTError
 from ..constants import SCSTConstants
-from .utils import attrs_config_differs, entity_exists
+from ..config import _DATACLASS_SLOTS
+from ..readers.target_reader import parse_target_mgmt_content
+from .utils import (
+    attrs_config_differs,
+    enable_sysfs_entities,
+    entity_exists,
+    snapshot_driver_tree,
+    unescape_initiator,
+)
 
 if TYPE_CHECKING:
     from ..config import TargetConfig, SCSTConfig, InitiatorGroupConfig, DriverConfig
 
 
+class TargetPaths(NamedTuple):
+    """Sysfs paths of a single target, built once and shared by the helpers
+    that reconcile its LUNs and initiator groups."""
+
+    target: str  # /sys/kernel/scst_tgt/targets/{driver}/{target}
+    luns: str
+    luns_mgmt: str
+    ini_groups: str
+    ini_groups_mgmt: str
+
+    def group(self, group_name: str) -> str:
+        """Path of an initiator group directory under this target"""
+        return self.ini_groups + "/" + group_name
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class GroupSnapshot:
+    """Initiators and LUN-to-device assignments of one initiator group"""
+
+    initiators: Set[str] = field(default_factory=set)  # Names as listed in sysfs
+    luns: Dict[str, str] = field(default_factory=dict)  # {lun_number: device}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class TargetSnapshot:
+    """LUN and initiator group layout of a target, read in a single pass.
+
+    LUNs whose device link is missing or broken map to an empty device name.
+    """
+
+    direct_luns: Dict[str, str] = field(default_factory=dict)  # {lun_number: device}
+    groups: Dict[str, GroupSnapshot] = field(default_factory=dict)
+
+
 class TargetWriter:
     """Handles target-specific SCST write operations"""
 
@@ -28,6 +80,34 @@ class TargetWriter:
         self.config_reader = config_reader
         self.logger = logger or logging.getLogger("scstadmin.writers.target")
 
+        # Per-target sysfs paths, see _paths_for()
+        self._target_paths: Dict[Tuple[str, str], TargetPaths] = {}
+        # "k1=v1;k2=v2" creation parameter strings, see _format_params()
+        self._params_str_cache: Dict[Tuple[Tuple[str, str], ...], str] = {}
+
+    def _paths_for(self, driver: str, target: str) -> TargetPaths:
+        """Return the sysfs paths of a target, building them on first use.
+        Args:
+            driver: SCST target driver name (e.g., 'iscsi')
+            target: Target name within the driver
+        Returns:
+            TargetPaths for the target
+        """
+        paths = self._target_paths.get((driver, target))
+        if paths is None:
+            target_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}"
+            luns = target_path + "/luns"
+            ini_groups = target_path + "/ini_groups"
+            paths = TargetPaths(
+                target=target_path,
+                luns=luns,
+                luns_mgmt=luns + "/mgmt",
+                ini_groups=ini_groups,
+                ini_groups_mgmt=ini_groups + "/mgmt",
+            )
+            self._target_paths[(driver, target)] = paths
+        return paths
+
     def set_target_attributes(
         self, driver_name: str, target_name: str, attributes: Dict[str, str]
     ) -> None:
@@ -255,33 +335,11 @@ class TargetWriter:
             driver_mgmt = f"{self.sysfs.SCST_TARGETS}/{driver_name}/mgmt"
             target_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}/{target_name}"
 
-            # Find all numbered variants of this attribute
-            variants_to_remove = []
-
-            # Check base attribute (e.g., IncomingUser)
-            base_attr_path = os.path.join(target_path, attr_name)
-            if os.path.isfile(base_attr_path):
-                try:
-                    value = self.sysfs.read_sysfs_attribute(base_attr_path)
-                    if value:
-                        variants_to_remove.append((attr_name, value))
-                except SCSTError:
-                    pass  # Skip unreadable attributes
-
-            # Check numbered variants (e.g., IncomingUser1, IncomingUser2, etc.)
-            counter = 1
-            while True:
-                numbered_attr_path = os.path.join(target_path, f"{attr_name}{counter}")
-                if os.path.isfile(numbered_attr_path):
-                    try:
-                        value = self.sysfs.read_sysfs_attribute(numbered_attr_path)
-                        if value:
-                            variants_to_remove.append((f"{attr_name}{counter}", value))
-                    except SCSTError:
-                        pass  # Skip unreadable attributes
-                    counter += 1
-                else:
-                    break
+            # Find the base attribute and all numbered variants of it
+            # (e.g., IncomingUser, IncomingUser1, IncomingUser2, ...)
+            variants_to_remove = self.sysfs.read_attribute_variants(
+                target_path, attr_name
+            )
 
             # Remove all found variants
             for variant_name, value in variants_to_remove:
@@ -350,37 +408,18 @@ class TargetWriter:
             if not self.sysfs.valid_path(driver_mgmt):
                 return result
             mgmt_content = self.sysfs.read_sysfs(driver_mgmt)
-
-            # Parse different types of available attributes/parameters
-            for line in mgmt_content.splitlines():
-                if "The following parameters available:" in line:
-                    _, params_str = line.split(":", 1)
-                    params_str = params_str.strip().rstrip(".")
-                    for param in params_str.split(","):
-                        param = param.strip()
-                        if param:
-                            result["create_params"].add(param)
-                elif "The following target driver attributes available:" in line:
-                    _, attrs_str = line.split(":", 1)
-                    attrs_str = attrs_str.strip().rstrip(".")
-                    for attr in attrs_str.split(","):
-                        attr = attr.strip()
-                        if attr:
-                            result["driver_attributes"].add(attr)
-                elif "The following target attributes available:" in line:
-                    _, attrs_str = line.split(":", 1)
-                    attrs_str = attrs_str.strip().rstrip(".")
-                    for attr in attrs_str.split(","):
-                        attr = attr.strip()
-                        if attr:
-                            result["target_attributes"].add(attr)
+            result = parse_target_mgmt_content(mgmt_content)
         except SCSTError:
             # If we can't read mgmt interface, return empty sets
             pass
         return result
 
     def _direct_lun_assignments_differ(
-        self, driver: str, target: str, target_config: "TargetConfig"
+        self,
+        driver: str,
+        target: str,
+        target_config: "TargetConfig",
+        snapshot: Optional[TargetSnapshot] = None,
     ) -> bool:
         """Check if current direct LUN assignments differ from desired configuration.
         Compares current direct target LUN assignments (under target/luns/) against
@@ -389,22 +428,20 @@ class TargetWriter:
             driver: SCST target driver name (e.g., 'iscsi')
             target: Target name within the driver
             target_config: Target configuration containing 'luns'
+            snapshot: Target layout from _snapshot_target(); taken here when
+                     not supplied
         Returns:
             True if direct LUN assignments differ, False if they match.
             Returns True if sysfs cannot be read (assumes difference for safety).
         """
         try:
+            if snapshot is None:
+                snapshot = self._snapshot_target(driver, target)
+
             # Get current direct LUN assignments
-            current_direct_luns = {}
-            luns_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/luns"
-            if os.path.exists(luns_path):
-                for lun_item in os.listdir(luns_path):
-                    if self.sysfs.is_valid_sysfs_directory(luns_path, lun_item):
-                        device = self.config_reader._get_current_lun_device(
-                            driver, target, lun_item
-                        )
-                        if device:
-                            current_direct_luns[lun_item] = device
+            current_direct_luns = {
+                lun: device for lun, device in snapshot.direct_luns.items() if device
+            }
 
             # Get desired direct LUN assignments
             desired_direct_luns = {}
@@ -420,41 +457,33 @@ class TargetWriter:
             return True
 
     def _group_lun_assignments_differ(
-        self, driver: str, target: str, target_config: "TargetConfig"
+        self,
+        driver: str,
+        target: str,
+        target_config: "TargetConfig",
+        snapshot: Optional[TargetSnapshot] = None,
     ) -> bool:
         """Check if initiator group LUN assignments need updating.
         Compares current vs desired LUN assignments within each group to determine
         if updates are needed for access control changes.
+        Args:
+            snapshot: Target layout from _snapshot_target(); taken here when
+                     not supplied
         Returns:
             True if any group's LUN assignments differ, False if all match
         """
         try:
+            if snapshot is None:
+                snapshot = self._snapshot_target(driver, target)
+
             # Get current group LUN assignments (organized by group)
             current_group_luns = {}
-            ini_groups_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups"
-            if os.path.exists(ini_groups_path):
-                for group_name in os.listdir(ini_groups_path):
-                    group_path = os.path.join(ini_groups_path, group_name)
-                    if group_name != self.sysfs.MGMT_INTERFACE and os.path.isdir(
-                        group_path
-                    ):
-                        group_luns_path = f"{ini_groups_path}/{group_name}/luns"
-                        if os.path.exists(group_luns_path):
-                            group_luns = {}
-                            for lun_item in os.listdir(group_luns_path):
-                                if (
-                                    lun_item != self.sysfs.MGMT_INTERFACE
-                                    and os.path.isdir(
-                                        os.path.join(group_luns_path, lun_item)
-                                    )
-                                ):
-                                    device = self.config_reader._get_current_group_lun_device(
-                                        driver, target, group_name, lun_item
-                                    )
-                                    if device:
-                                        group_luns[lun_item] = device
-                            if group_luns:
-                                current_group_luns[group_name] = group_luns
+            for group_name, group_snapshot in snapshot.groups.items():
+                group_luns = {
+                    lun: device for lun, device in group_snapshot.luns.items() if device
+                }
+                if group_luns:
+                    current_group_luns[group_name] = group_luns
 
             # Get desired group LUN assignments
             desired_group_luns = {}
@@ -474,7 +503,11 @@ class TargetWriter:
             return True
 
     def _group_assignments_differ(
-        self, driver: str, target: str, target_config: "TargetConfig"
+        self,
+        driver: str,
+        target: str,
+        target_config: "TargetConfig",
+        snapshot: Optional[TargetSnapshot] = None,
     ) -> bool:
         """Check if current initiator group assignments differ from desired configuration.
         Performs comprehensive comparison of initiator group configuration including
@@ -490,6 +523,8 @@ class TargetWriter:
             target: Target name within the driver
             target_config: Target configuration containing 'groups' section:
                           {'groups': {group_name: {group_config}}}
+            snapshot: Target layout from _snapshot_target(); taken here when
+                     not supplied
         Returns:
             True if initiator groups differ in membership OR configuration
             False if all groups exist with matching configurations
@@ -502,18 +537,14 @@ class TargetWriter:
             - Cannot read current group state from sysfs
         Note:
             This is a comprehensive check covering both group existence and contents.
-            It delegates to _group_config_matches() for detailed group comparison.
+            It delegates to _group_snapshot_matches() for detailed group comparison.
         """
         try:
+            if snapshot is None:
+                snapshot = self._snapshot_target(driver, target)
+
             # Get current groups
-            current_groups = set()
-            groups_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups"
-            if os.path.exists(groups_path):
-                for group_item in os.listdir(groups_path):
-                    if group_item != self.sysfs.MGMT_INTERFACE and os.path.isdir(
-                        os.path.join(groups_path, group_item)
-                    ):
-                        current_groups.add(group_item)
+            current_groups = set(snapshot.groups)
 
             # Get desired groups
             desired_groups = set(target_config.groups.keys())
@@ -524,33 +555,50 @@ class TargetWriter:
 
             # Check if any existing group configurations differ
             for group_name in desired_groups:
-                if self._group_exists(driver, target, group_name):
-                    group_config = target_config.groups[group_name]
-                    if not self._group_config_matches(
-                        driver, target, group_name, group_config
-                    ):
-                        return True
+                if not self._group_snapshot_matches(
+                    snapshot.groups[group_name], target_config.groups[group_name]
+                ):
+                    return True
             return False
         except (OSError, IOError):
             # If we can't read current state, assume they differ
             return True
 
     def _update_target_groups(
-        self, driver: str, target: str, target_config: "TargetConfig"
+        self,
+        driver: str,
+        target: str,
+        target_config: "TargetConfig",
+        snapshot: Optional[TargetSnapshot] = None,
     ) -> None:
         """Update initiator groups for fine-grained client access control.
         Enables different client groups to see different devices or LUN mappings.
         Only updates groups that have actually changed for optimal performance.
         Args:
             target_config: {'groups': {group_name: {'luns': {...}, 'initiators': [...]}}}
+            snapshot: Target layout from _snapshot_target(); taken here when
+                     not supplied
         """
+        if snapshot is None:
+            try:
+                snapshot = self._snapshot_target(driver, target)
+            except (OSError, IOError) as e:
+                self.logger.warning(
+                    "Cannot read groups of %s/%s, skipping group update: %s",
+                    driver,
+                    target,
+                    e,
+                )
+                return
+        paths = self._paths_for(driver, target)
+        mgmt_path = paths.ini_groups_mgmt
         for group_name, group_config in target_config.groups.items():
-            mgmt_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/mgmt"
+            group_snapshot = snapshot.groups.get(group_name)
 
             # Check if group exists
-            if self._group_exists(driver, target, group_name):
+            if group_snapshot is not None:
                 # Group exists - check if config actually matches
-                if self._group_config_matches(driver, target, group_name, group_config):
+                if self._group_snapshot_matches(group_snapshot, group_config):
                     self.logger.debug(
                         "Group %s for %s/%s already exists with matching config, skipping",
                         group_name,
@@ -566,7 +614,14 @@ class TargetWriter:
                         target,
                     )
                     # Update the group configuration incrementally
-                    self._update_group_config(driver, target, group_name, group_config)
+                    self._update_group_config(
+                        driver,
+                        target,
+                        group_name,
+                        group_config,
+                        already_checked=True,
+                        group_snapshot=group_snapshot,
+                    )
                     continue
             else:
                 # Group doesn't exist - create it
@@ -587,14 +642,12 @@ class TargetWriter:
                 pass  # Group might already exist
 
             # Add initiators to the group
-            group_initiators_path = (
-                f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/"
-                f"{group_name}/initiators/mgmt"
-            )
+            group_path = paths.group(group_name)
+            group_initiators_path = group_path + "/initiators/mgmt"
             for initiator in group_config.initiators:  # InitiatorGroupConfig object
                 try:
                     # Remove config file escape characters for sysfs
-                    clean_initiator = initiator.replace("\\#", "#").replace("\\*", "*")
+                    clean_initiator = unescape_initiator(initiator)
                     self.sysfs.write_sysfs(
                         group_initiators_path, f"add {clean_initiator}"
                     )
@@ -610,7 +663,7 @@ class TargetWriter:
                     )
 
             # Add LUN assignments to the group
-            group_luns_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/{group_name}/luns/mgmt"
+            group_luns_path = group_path + "/luns/mgmt"
             for (
                 lun_number,
                 lun_config,
@@ -640,15 +693,27 @@ class TargetWriter:
         target: str,
         group_name: str,
         group_config: "InitiatorGroupConfig",
+        already_checked: bool = False,
+        group_snapshot: Optional[GroupSnapshot] = None,
     ) -> None:
         """Update initiator group membership and LUN assignments incrementally.
         Updates both initiator membership (which clients can access) and LUN assignments
         (which devices they see). Only changes what's actually different for performance.
         Args:
             group_config: InitiatorGroupConfig object with initiators and luns
+            already_checked: True if the caller has just seen the group config
+                            comparison fail, so it is not repeated
+            group_snapshot: Current initiators and LUNs of the group, already read
+                           by the caller; taken here when not supplied
         """
+        paths = self._paths_for(driver, target)
+        if group_snapshot is None:
+            group_snapshot = self._snapshot_group(paths, group_name)
+
         # Check if the group configuration actually needs updating
-        if self._group_config_matches(driver, target, group_name, group_config):
+        if not already_checked and self._group_snapshot_matches(
+            group_snapshot, group_config
+        ):
             self.logger.debug(
                 "Group %s configuration already matches, skipping update", group_name
             )
@@ -656,52 +721,69 @@ class TargetWriter:
         self.logger.debug("Updating group %s configuration incrementally", group_name)
 
         # For now, implement basic updates by checking what differs
-        group_path = (
-            f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/{group_name}"
-        )
+        group_path = paths.group(group_name)
 
         # Phase 1: Update initiator membership (sysfs: ini_groups/{group}/initiators/{name})
-        existing_initiators = set()
-        initiators_path = f"{group_path}/initiators"
-        if os.path.exists(initiators_path):
-            try:
-                for initiator_file in os.listdir(initiators_path):
-                    if initiator_file != self.sysfs.MGMT_INTERFACE and os.path.isfile(
-                        os.path.join(initiators_path, initiator_file)
-                    ):
-                        existing_initiators.add(initiator_file)
-            except (OSError, IOError):
-                pass
-        desired_initiators = set(group_config.initiators)
+        group_initiators_mgmt = group_path + "/initiators/mgmt"
         # Handle config file escaping: \\# and \\* in config become # and * in sysfs
-        normalized_existing = {init.replace("\\", "") for init in existing_initiators}
-        normalized_desired = {init.replace("\\", "") for init in desired_initiators}
+        normalized_existing = {
+            init.replace("\\", "") for init in group_snapshot.initiators
+        }
+        normalized_desired = {
+            init.replace("\\", "") for init in group_config.initiators
+        }
+        extra_initiators = normalized_existing - normalized_desired
+        if (
+            len(extra_initiators) > 1
+            and len(extra_initiators) == len(normalized_existing)
+            and self._initiators_mgmt_supports(driver, group_initiators_mgmt, "clear")
+        ):
+            # Every current initiator goes away - one "clear" instead of a "del" each.
+            # No initiator is kept, so clearing ahead of the adds cuts nobody off.
+            try:
+                self.sysfs.write_sysfs(group_initiators_mgmt, "clear")
+                self.logger.debug(
+                    "Cleared %s initiators from group %s",
+                    len(extra_initiators),
+                    group_name,
+                )
+                extra_initiators = set()
+            except SCSTError as e:
+                self.logger.warning(
+                    "Failed to clear initiators from group %s, removing individually: %s",
+                    group_name,
+                    e,
+                )
+
         # Add missing initiators
         missing_initiators = normalized_desired - normalized_existing
         for initiator in missing_initiators:
-            group_initiators_mgmt = f"{group_path}/initiators/mgmt"
             self.sysfs.mgmt_operation(
                 group_initiators_mgmt,
                 "add",
                 initiator,
-                f"Added initiator {initiator} to group {group_name}",
-                f"Failed to add initiator {initiator} to group {group_name}",
+                "Added initiator %s to group %s",
+                "Failed to add initiator %s to group %s",
+                initiator,
+                group_name,
             )
 
         # Remove extra initiators
-        extra_initiators = normalized_existing - normalized_desired
         for initiator in extra_initiators:
-            group_initiators_mgmt = f"{group_path}/initiators/mgmt"
             self.sysfs.mgmt_operation(
                 group_initiators_mgmt,
                 "del",
                 initiator,
-                f"Removed initiator {initiator} from group {group_name}",
-                f"Failed to remove initiator {initiator} from group {group_name}",
+                "Removed initiator %s from group %s",
+                "Failed to remove initiator %s from group %s",
+                initiator,
+                group_name,
             )
 
         # Update LUN assignments within the group
-        self._update_group_lun_assignments(driver, target, group_name, group_config)
+        self._update_group_lun_assignments(
+            driver, target, group_name, group_config, current_luns=group_snapshot.luns
+        )
 
     def _update_group_lun_assignments(
         self,
@@ -709,6 +791,7 @@ class TargetWriter:
         target: str,
         group_name: str,
         group_config: "InitiatorGroupConfig",
+        current_luns: Optional[Dict[str, str]] = None,
     ) -> None:
         """Update LUN-to-device assignments for an initiator group.
         Enables access control by allowing different groups to see different devices
@@ -716,27 +799,22 @@ class TargetWriter:
         have actually changed for optimal performance.
         Args:
             group_config: InitiatorGroupConfig object with luns property
+            current_luns: Current {lun_number: device} of the group, already read by
+                         the caller (e.g., GroupSnapshot.luns); read from sysfs when
+                         not supplied
         """
-        group_luns_path = (
-            f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/{group_name}/luns"
-        )
-        group_luns_mgmt = f"{group_luns_path}/mgmt"
+        group_luns_path = self._paths_for(driver, target).group(group_name) + "/luns"
+        group_luns_mgmt = group_luns_path + "/mgmt"
 
         # Read current LUN assignments from sysfs: /sys/.../ini_groups/{group}/luns/{lun_num}/
-        current_group_luns = {}
-        if os.path.exists(group_luns_path):
+        if current_luns is None:
             try:
-                for lun_item in os.listdir(group_luns_path):
-                    if lun_item != self.sysfs.MGMT_INTERFACE and os.path.isdir(
-                        os.path.join(group_luns_path, lun_item)
-                    ):
-                        device = self.config_reader._get_current_group_lun_device(
-                            driver, target, group_name, lun_item
-                        )
-                        if device:
-                            current_group_luns[lun_item] = device
+                current_luns = self._read_lun_devices(group_luns_path)
             except (OSError, IOError):
-                pass
+                current_luns = {}
+        current_group_luns = {
+            lun: device for lun, device in current_luns.items() if device
+        }
 
         # Extract desired assignments from config: {lun_number: device_name}
         desired_group_luns = {}
@@ -746,7 +824,31 @@ class TargetWriter:
                 desired_group_luns[lun_number] = device
 
         # Phase 1: Remove obsolete LUN assignments (mgmt command: "del {lun_number}")
-        luns_to_remove = set(current_group_luns.keys()) - set(desired_group_luns.keys())
+        # Steady state: every current LUN is still wanted, skip building the sets
+        if len(current_group_luns) <= len(desired_group_luns) and all(
+            lun in desired_group_luns for lun in current_group_luns
+        ):
+            luns_to_remove = ()
+        else:
+            luns_to_remove = current_group_luns.keys() - desired_group_luns.keys()
+        if (
+            len(luns_to_remove) > 1
+            and len(luns_to_remove) == len(current_group_luns)
+            and self._lun_mgmt_supports(driver, group_luns_mgmt, "clear")
+        ):
+            # Every current LUN goes away - one "clear" instead of a "del" per LUN
+            try:
+                self.sysfs.write_sysfs(group_luns_mgmt, "clear")
+                self.logger.debug(
+                    "Cleared %s LUNs from group %s", len(luns_to_remove), group_name
+                )
+                luns_to_remove = ()
+            except SCSTError as e:
+                self.logger.warning(
+                    "Failed to clear LUNs from group %s, removing individually: %s",
+                    group_name,
+                    e,
+                )
         for lun_number in luns_to_remove:
             try:
                 self.sysfs.write_sysfs(group_luns_mgmt, f"del {lun_number}")
@@ -766,9 +868,14 @@ class TargetWriter:
             current_device = current_group_luns.get(lun_number)
             if current_device != device:
                 # LUN doesn't exist or has wrong device - add/update it
+                verb = "add"
+                if current_device and self._lun_mgmt_supports(
+                    driver, group_luns_mgmt, "replace"
+                ):
+                    verb = "replace"
                 try:
                     self.sysfs.write_sysfs(
-                        group_luns_mgmt, f"add {device} {lun_number}"
+                        group_luns_mgmt, f"{verb} {device} {lun_number}"
                     )
                     if current_device:
                         self.logger.debug(
@@ -798,8 +905,9 @@ class TargetWriter:
         self, driver: str, target: str, lun_number: str, attributes: Dict[str, str]
     ) -> None:
         """Set LUN attributes after assignment"""
+        lun_prefix = self._paths_for(driver, target).luns + "/" + lun_number + "/"
         for attr_name, attr_value in attributes.items():
-            attr_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/luns/{lun_number}/{attr_name}"
+            attr_path = lun_prefix + attr_name
             try:
                 self.sysfs.write_sysfs(attr_path, attr_value, check_result=False)
             except SCSTError as e:
@@ -812,10 +920,29 @@ class TargetWriter:
                     e,
                 )
 
+    @staticmethod
+    def _read_lun_device_fast(lun_dir_path: str) -> str:
+        """Resolve the device assigned to a LUN directory from its device symlink.
+        Reads the symlink directly instead of the exists/islink/readlink sequence
+        used by the config reader helpers, costing two syscalls instead of three.
+        Args:
+            lun_dir_path: LUN directory, e.g. /sys/.../luns/0 or .../ini_groups/g/luns/0
+        Returns:
+            Device name (basename of the link target), or "" if the LUN has no
+            device link or the link is broken
+        """
+        device_path = f"{lun_dir_path}/device"
+        try:
+            link_target = os.readlink(device_path)
+            # A dangling link means a stale assignment - report it as no device
+            os.stat(device_path)
+        except OSError:
+            return ""
+        return os.path.basename(link_target)
+
     def _target_exists(self, driver: str, target_name: str) -> bool:
         """Check if a target already exists under a driver"""
-        target_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target_name}"
-        return entity_exists(target_path)
+        return entity_exists(self._paths_for(driver, target_name).target)
 
     def _target_config_differs(
         self,
@@ -831,17 +958,9 @@ class TargetWriter:
             entity_type="Target",
         )
 
-    def _lun_exists(self, driver: str, target: str, lun_number: str) -> bool:
-        """Check if a LUN already exists for a target"""
-        lun_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/luns/{lun_number}"
-        return entity_exists(lun_path)
-
     def _group_exists(self, driver: str, target: str, group_name: str) -> bool:
         """Check if an initiator group already exists for a target"""
-        group_path = (
-            f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/{group_name}"
-        )
-        return entity_exists(group_path)
+        return entity_exists(self._paths_for(driver, target).group(group_name))
 
     def _group_config_matches(
         self,
@@ -867,72 +986,130 @@ class TargetWriter:
             - Returns False on any sysfs read errors for safety
         """
         try:
-            group_path = (
-                f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/{group_name}"
-            )
-            if not os.path.exists(group_path):
+            group_path = self._paths_for(driver, target).group(group_name)
+            if not entity_exists(group_path):
                 return False
 
-            # Check initiators
-            existing_initiators = set()
-            initiators_path = f"{group_path}/initiators"
-            if os.path.exists(initiators_path):
-                try:
-                    for initiator_file in os.listdir(initiators_path):
-                        if (
-                            initiator_file != self.sysfs.MGMT_INTERFACE
-                            and os.path.isfile(
-                                os.path.join(initiators_path, initiator_file)
-                            )
-                        ):
-                            existing_initiators.add(initiator_file)
-                except (OSError, IOError):
-                    pass
-            desired_initiators = set(group_config.initiators)
-
-            # Normalize both sets to handle backslash escaping differences
-            normalized_existing = {
-                init.replace("\\", "") for init in existing_initiators
-            }
-            normalized_desired = {init.replace("\\", "") for init in desired_initiators}
-            if normalized_existing != normalized_desired:
+            # Check initiators first - a mismatch decides without scanning LUNs
+            existing_initiators = []
+            try:
+                existing_initiators = self.sysfs.list_files(group_path + "/initiators")
+            except (OSError, IOError):
+                pass
+
+            if not self._initiators_match(existing_initiators, group_config):
                 return False
 
             # Check LUN assignments
-            existing_luns = {}
-            luns_path = f"{group_path}/luns"
-            if os.path.exists(luns_path):
-                try:
-                    for lun_item in os.listdir(luns_path):
-                        if lun_item != self.sysfs.MGMT_INTERFACE:
-                            lun_path = os.path.join(luns_path, lun_item)
-                            if os.path.isdir(lun_path):
-                                existing_luns[lun_item] = {}
-                except (OSError, IOError):
-                    pass
-            desired_luns = group_config.luns
-            if set(existing_luns.keys()) != set(desired_luns.keys()):
+            existing_luns = set()
+            try:
+                existing_luns.update(
+                    self.sysfs.list_subdirectories(group_path + "/luns")
+                )
+            except (OSError, IOError):
+                pass
+            if existing_luns != set(group_config.luns.keys()):
                 return False
             return True
         except (OSError, IOError):
             return False
 
+    @staticmethod
+    def _initiators_match(
+        existing_initiators, group_config: "InitiatorGroupConfig"
+    ) -> bool:
+        """Compare a group's sysfs initiator names with its configured initiators"""
+        # Normalize both sets to handle backslash escaping differences
+        normalized_existing = {init.replace("\\", "") for init in existing_initiators}
+        normalized_desired = {
+            init.replace("\\", "") for init in group_config.initiators
+        }
+        return normalized_existing == normalized_desired
+
+    def _group_snapshot_matches(
+        self, group_snapshot: GroupSnapshot, group_config: "InitiatorGroupConfig"
+    ) -> bool:
+        """Snapshot counterpart of _group_config_matches(): compare initiators
+        (escaping-insensitive) and LUN numbers without reading sysfs"""
+        return self._initiators_match(
+            group_snapshot.initiators, group_config
+        ) and set(group_snapshot.luns) == set(group_config.luns.keys())
+
+    def _snapshot_target(self, driver: str, target: str) -> TargetSnapshot:
+        """Read a target's LUN and initiator group layout in a single walk.
+        Lists target/luns and every ini_groups/{group}/{luns,initiators}
+        directory once and resolves each LUN's device symlink, so the
+        assignment comparisons in apply_config_assignments() run against
+        memory instead of re-listing overlapping sysfs paths.
+        Args:
+            driver: SCST target driver name (e.g., 'iscsi')
+            target: Target name within the driver
+        Returns:
+            TargetSnapshot of the target
+        Raises:
+            OSError: If a sysfs directory exists but cannot be read
+        """
+        paths = self._paths_for(driver, target)
+        snapshot = TargetSnapshot(direct_luns=self._read_lun_devices(paths.luns))
+        for group_name in self.sysfs.list_subdirectories(paths.ini_groups):
+            snapshot.groups[group_name] = self._snapshot_group(paths, group_name)
+        return snapshot
+
+    def _snapshot_group(self, paths: TargetPaths, group_name: str) -> GroupSnapshot:
+        """Read the initiators and LUN assignments of one initiator group.
+        A missing group reads as an empty GroupSnapshot.
+        Raises:
+            OSError: If a sysfs directory exists but cannot be read
+        """
+        group_path = paths.group(group_name)
+        return GroupSnapshot(
+            initiators=set(self.sysfs.list_files(group_path + "/initiators")),
+            luns=self._read_lun_devices(group_path + "/luns"),
+        )
+
+    def _read_lun_devices(self, luns_path: str) -> Dict[str, str]:
+        """Map each LUN under a luns/ directory to its device, "" when unassigned.
+        Raises:
+            OSError: If the directory exists but cannot be read
+        """
+        lun_prefix = luns_path + "/"
+        read_device = self._read_lun_device_fast
+        return {
+            lun: read_device(lun_prefix + lun)
+            for lun in self.sysfs.list_subdirectories(luns_path)
+        }
+
     def apply_config_assignments(self, config: "SCSTConfig") -> None:
         """Apply target configurations with optimized incremental updates.
 
         Creates targets, updates attributes, and configures LUN/group assignments.
         Only updates components that have actually changed for optimal performance.
         """
+        # LUN and initiator mgmt help may differ after module reloads between runs
+        self.config_reader.clear_mgmt_help_cache()
+        # Parameter strings are only reused within a run
+        self._params_str_cache.clear()
+
         for driver_name, driver_config in config.drivers.items():
             driver_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}"
 
+            # Read the layout of this driver's existing targets up front; applying
+            # one target does not change another's LUNs or groups, and the
+            # reads can overlap while all writes below stay sequential
+            existing_targets = [
+                target_name
+                for target_name in driver_config.targets
+                if self._target_exists(driver_name, target_name)
+            ]
+            snapshots = self._prefetch_snapshots(driver_name, existing_targets)
+
             # Process each target in the driver configuration
             for target_name, target_config in driver_config.targets.items():
                 mgmt_path = f"{driver_path}/mgmt"
                 target_attrs = target_config.attributes
 
                 # Existing target: perform incremental updates (attributes, LUNs, groups)
-                if self._target_exists(driver_name, target_name):
+                if target_name in snapshots:
                     # Get mgmt info to identify removable attributes
                     mgmt_info = self.config_reader._get_target_mgmt_info(driver_name)
 
@@ -974,17 +1151,21 @@ class TargetWriter:
                         )
 
                     # Phase 2: Check all assignment types (independent of attribute changes)
+                    # The prefetched layout serves all three checks;
+                    # without a snapshot each check reads sysfs on its own
+                    snapshot = snapshots[target_name]
+
                     # Three types of LUN/access assignments that can change independently:
                     direct_luns_differ = self._direct_lun_assignments_differ(
-                        driver_name, target_name, target_config
+                        driver_name, target_name, target_config, snapshot=snapshot
                     )  # Target-level LUNs
 
                     group_luns_differ = self._group_lun_assignments_differ(
-                        driver_name, target_name, target_config
+                        driver_name, target_name, target_config, snapshot=snapshot
                     )  # Group-specific LUNs
 
                     groups_differ = self._group_assignments_differ(
-                        driver_name, target_name, target_config
+                        driver_name, target_name, target_config, snapshot=snapshot
                     )  # Group membership
 
                     if direct_luns_differ:
@@ -1004,7 +1185,7 @@ class TargetWriter:
                             target_name,
                         )
                         self._update_target_groups(
-                            driver_name, target_name, target_config
+                            driver_name, target_name, target_config, snapshot=snapshot
                         )
 
                     if not (
@@ -1034,9 +1215,7 @@ class TargetWriter:
                     )
 
                 if creation_params:
-                    params_str = ";".join(
-                        [f"{k}={v}" for k, v in creation_params.items()]
-                    )
+                    params_str = self._format_params(creation_params)
                     command = f"add_target {target_name} {params_str}"
                 else:
                     command = f"add_target {target_name}"
@@ -1058,6 +1237,41 @@ class TargetWriter:
                 # Apply group assignments
                 self.apply_group_assignments(driver_name, target_name, target_config)
 
+    def _prefetch_snapshots(
+        self, driver: str, targets: List[str]
+    ) -> Dict[str, Optional[TargetSnapshot]]:
+        """Snapshot several targets of a driver, overlapping the sysfs reads.
+        The walks only read sysfs, so they go through map_reads(); the writes
+        that follow are never parallelized.
+        Args:
+            driver: SCST target driver name (e.g., 'iscsi')
+            targets: Names of existing targets of the driver
+        Returns:
+            {target: TargetSnapshot}, None for targets that could not be read
+        """
+
+        def snapshot_or_none(target: str) -> Optional[TargetSnapshot]:
+            try:
+                return self._snapshot_target(driver, target)
+            except OSError as e:
+                self.logger.debug("Could not snapshot %s/%s: %s", driver, target, e)
+                return None
+
+        return map_reads(snapshot_or_none, targets)
+
+    def _snapshot_drivers(self, drivers: List[str]) -> Dict[str, Dict[str, str]]:
+        """Read the attributes of several drivers, overlapping the sysfs reads.
+        Like _prefetch_snapshots(), only the reads go through map_reads(); the
+        attribute writes that follow stay serial.
+        Args:
+            drivers: Names of loaded target drivers
+        Returns:
+            {driver: snapshot_driver_tree() result}
+        """
+        return map_reads(
+            lambda driver: snapshot_driver_tree(self.sysfs, driver), drivers
+        )
+
     def cleanup_copy_manager_duplicates(self, config: "SCSTConfig") -> None:
         """Remove duplicate copy_manager LUN assignments to prevent conflicts.
 
@@ -1088,40 +1302,34 @@ class TargetWriter:
 
         # Scan current sysfs LUNs to find auto-created duplicates
         # copy_manager automatically creates LUNs which may conflict with explicit config
-        luns_path = "/sys/kernel/scst_tgt/targets/copy_manager/copy_manager_tgt/luns"
-        if not os.path.exists(luns_path):
-            return
+        paths = self._paths_for("copy_manager", "copy_manager_tgt")
+        lun_prefix = paths.luns + "/"
 
         try:
             luns_to_remove = []
-            for lun_item in os.listdir(luns_path):
-                if lun_item != self.sysfs.MGMT_INTERFACE and os.path.isdir(
-                    f"{luns_path}/{lun_item}"
-                ):
-                    # Get device assigned to this LUN number
-                    device = self.config_reader._get_current_lun_device(
-                        "copy_manager", "copy_manager_tgt", lun_item
-                    )
+            for lun_item in self.sysfs.list_subdirectories(paths.luns):
+                # Get device assigned to this LUN number
+                device = self._read_lun_device_fast(lun_prefix + lun_item)
+
+                # If device is NOT in explicit config, leave it alone - copy_manager can have
+                # auto-created LUNs for devices not explicitly listed in the config
+                expected = explicit_devices.get(device)
+                if expected is None or expected == lun_item:
+                    continue
 
-                    if device in explicit_devices:
-                        # Check if this device should be at a different LUN number
-                        if explicit_devices[device] != lun_item:
-                            # Duplicate found: same device at wrong LUN number
-                            # Keep the explicit assignment, remove the auto-created one
-                            luns_to_remove.append(lun_item)
-                            expected = explicit_devices[device]
-                            self.logger.debug(
-                                "Found duplicate LUN %s for device %s (expected: %s)",
-                                lun_item,
-                                device,
-                                expected,
-                            )
-                    # If device is NOT in explicit config, leave it alone - copy_manager can have
-                    # auto-created LUNs for devices not explicitly listed in the config
+                # Duplicate found: same device at wrong LUN number
+                # Keep the explicit assignment, remove the auto-created one
+                luns_to_remove.append(lun_item)
+                self.logger.debug(
+                    "Found duplicate LUN %s for device %s (expected: %s)",
+                    lun_item,
+                    device,
+                    expected,
+                )
 
             # Clean up duplicates using SCST management interface
             if luns_to_remove:
-                mgmt_path = f"{luns_path}/mgmt"
+                mgmt_path = paths.luns_mgmt
                 for lun_num in luns_to_remove:
                     try:
                         # Management command: "del {lun_number}"
@@ -1145,52 +1353,50 @@ class TargetWriter:
         Hardware targets (FC, SAS) require explicit enabling to become accessible.
         Only updates targets that aren't already enabled for optimal performance.
         """
+        # Only targets configured as enabled can need enabling - decide from
+        # the configuration before touching sysfs at all
+        targets_to_enable = {
+            target_name
+            for target_name, target_config in driver_config.targets.items()
+            if target_config.attributes.get("enabled", "0") == "1"
+        }
+        if not targets_to_enable:
+            return
+
         try:
-            # Scan existing targets in driver sysfs directory
+            # Scan existing targets in driver sysfs directory; d_type filters out
+            # attribute files, and a missing driver directory lists as empty
             driver_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}"
-            if not self.sysfs.valid_path(driver_path):
-                return  # Driver not loaded or doesn't exist
-
-            existing_targets = self.sysfs.list_directory(driver_path)
+            existing_targets = self.sysfs.list_subdirectories(driver_path)
             driver_attrs = SCSTConstants.DRIVER_ATTRIBUTES.get(driver_name, set())
 
             for target in existing_targets:
-                # Filter out driver-level attributes and management interfaces
-                if target in driver_attrs or target == self.sysfs.MGMT_INTERFACE:
+                # Filter out driver-level attributes and unconfigured targets
+                # Default to disabled ('0') if not explicitly configured
+                if target in driver_attrs or target not in targets_to_enable:
                     continue
 
-                target_path = f"{driver_path}/{target}"
-                if not os.path.isdir(target_path):
-                    continue  # Skip non-directory entries
-
                 # Hardware target detection: check for 'hw_target' attribute
                 # Hardware targets (FC WWPNs, SAS addresses) vs software targets (iSCSI IQNs)
-                hw_target_path = f"{target_path}/hw_target"
-                if not self.sysfs.valid_path(hw_target_path):
-                    continue  # Software target, no enabling needed
-
+                target_path = f"{driver_path}/{target}"
                 try:
-                    hw_target_value = self.sysfs.read_sysfs_attribute(hw_target_path)
-                    if hw_target_value != "1":
-                        continue  # hw_target exists but not set to "1"
+                    hw_target_value = self.sysfs.read_sysfs_attribute_fast(
+                        f"{target_path}/hw_target"
+                    )
                 except SCSTError:
-                    continue  # Can't read hw_target attribute
+                    continue  # Software target (no hw_target) or unreadable
+                if hw_target_value != "1":
+                    continue  # hw_target exists but not set to "1"
 
                 # Read current enabled state from sysfs
                 enabled_path = f"{target_path}/enabled"
                 try:
-                    current_enabled = self.sysfs.read_sysfs_attribute(enabled_path)
+                    current_enabled = self.sysfs.read_sysfs_attribute_fast(enabled_path)
                 except SCSTError:
                     continue  # Can't read enabled attribute
 
-                # Determine desired state from configuration
-                # Default to disabled ('0') if not explicitly configured
-                target_config = driver_config.targets.get(target)
-                target_attrs = target_config.attributes if target_config else {}
-                should_be_enabled = target_attrs.get("enabled", "0") == "1"
-
                 # Enable hardware target if it should be enabled but currently isn't
-                if should_be_enabled and current_enabled != "1":
+                if current_enabled != "1":
                     self.logger.debug(
                         "Enabling hardware target %s/%s for virtual target creation",
                         driver_name,
@@ -1206,7 +1412,7 @@ class TargetWriter:
                             e,
                         )
 
-        except SCSTError as e:
+        except (SCSTError, OSError) as e:
             self.logger.warning(
                 "Failed to check hardware targets for %s: %s", driver_name, e
             )
@@ -1218,33 +1424,51 @@ class TargetWriter:
 
         Creates LUN assignments with proper parameter handling and device verification.
         Only updates LUNs that have different device assignments for performance.
+        Returns without touching sysfs further when every LUN already points at its
+        desired device and no LUN carries attributes.
         """
         # Target LUN management path: /sys/.../targets/{driver}/{target}/luns/mgmt
-        luns_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/luns/mgmt"
+        paths = self._paths_for(driver, target)
+        luns_path = paths.luns_mgmt
 
-        # For copy_manager: pre-build mappings to avoid O(n^2) complexity during duplicate detection
+        # One pass over luns/ resolves every current assignment up front:
+        # current_lun_devices answers the per-LUN existence and device checks below,
+        # "" marks a LUN whose device symlink is broken/stale.
+        # A missing directory yields no entries - no existing LUNs
+        current_lun_devices = {}  # {lun_number: device}
+        try:
+            lun_prefix = paths.luns + "/"
+            for existing_lun in self.sysfs.list_subdirectories(paths.luns):
+                current_lun_devices[existing_lun] = self._read_lun_device_fast(
+                    lun_prefix + existing_lun
+                )
+        except OSError as e:
+            self.logger.debug("Cannot list LUNs of %s/%s: %s", driver, target, e)
+
+        # Short-circuit the common incremental case: everything already in place
+        desired_lun_devices = {
+            lun_number: lun_config.device
+            for lun_number, lun_config in target_config.luns.items()
+            if lun_config.device
+        }
+        if current_lun_devices == desired_lun_devices and not any(
+            lun_config.attributes for lun_config in target_config.luns.values()
+        ):
+            self.logger.debug(
+                "All %s LUNs for %s/%s already assigned, skipping",
+                len(desired_lun_devices),
+                driver,
+                target,
+            )
+            return
+
+        # For copy_manager: pre-build mapping to avoid O(n^2) complexity during duplicate detection
         # existing_lun_map: tracks which LUN each device is currently assigned to
-        # current_lun_devices: enables fast lookup of current device assignments without sysfs reads
         existing_lun_map = {}  # {device: lun_number}
-        current_lun_devices = {}  # {lun_number: device}
         if driver == "copy_manager" and target == "copy_manager_tgt":
-            luns_dir = Path(self.sysfs.SCST_TARGETS) / driver / target / "luns"
-            try:
-                for lun_path in luns_dir.iterdir():
-                    existing_lun = lun_path.name
-                    if existing_lun != self.sysfs.MGMT_INTERFACE and lun_path.is_dir():
-                        existing_device = self.config_reader._get_current_lun_device(
-                            driver, target, existing_lun
-                        )
-                        if existing_device:
-                            existing_lun_map[existing_device] = existing_lun
-                            current_lun_devices[existing_lun] = existing_device
-            except FileNotFoundError:
-                pass  # Directory doesn't exist, no existing LUNs to map
-
-        # Cache LUN create params lookup - same for all LUNs with same driver/target (performance)
-        # This avoids reading mgmt file 100 times for 100 LUNs
-        lun_create_params_cache = {}
+            for existing_lun, existing_device in current_lun_devices.items():
+                if existing_device:
+                    existing_lun_map[existing_device] = existing_lun
 
         for lun_number, lun_config in target_config.luns.items():
             device = lun_config.device  # LunConfig object
@@ -1266,23 +1490,16 @@ class TargetWriter:
                         self.sysfs.write_sysfs(luns_path, f"del {existing_lun}")
                         # Update maps since we removed it
                         del existing_lun_map[device]
-                        if existing_lun in current_lun_devices:
-                            del current_lun_devices[existing_lun]
+                        current_lun_devices.pop(existing_lun, None)
                     except SCSTError as e:
                         self.logger.warning(
                             "Failed to remove existing LUN %s: %s", existing_lun, e
                         )
 
             # Optimization: check if LUN assignment already correct (avoid unnecessary operations)
-            lun_exists = self._lun_exists(driver, target, lun_number)
-            if lun_exists:
-                # For copy_manager, use cached device mapping; otherwise read from sysfs
-                if driver == "copy_manager" and target == "copy_manager_tgt":
-                    current_device = current_lun_devices.get(lun_number, "")
-                else:
-                    current_device = self.config_reader._get_current_lun_device(
-                        driver, target, lun_number
-                    )
+            replace_existing = False
+            current_device = current_lun_devices.get(lun_number)
+            if current_device is not None:
                 if current_device == device:
                     # LUN already correctly assigned, skip this LUN
                     self.logger.debug(
@@ -1313,6 +1530,17 @@ class TargetWriter:
                             e,
                         )
                         # Continue anyway - the new assignment might still work
+                elif self._lun_mgmt_supports(driver, luns_path, "replace"):
+                    # LUN points to wrong device - swap it in a single mgmt write
+                    replace_existing = True
+                    self.logger.debug(
+                        "LUN %s for %s/%s assigned to different device (%s vs %s), replacing",
+                        lun_number,
+                        driver,
+                        target,
+                        current_device,
+                        device,
+                    )
                 else:
                     # LUN exists but points to wrong device - must recreate assignment
                     self.logger.debug(
@@ -1338,20 +1566,11 @@ class TargetWriter:
 
             # Separate creation-time vs post-creation LUN parameters
             # Some attributes must be set during LUN creation, others can be set afterward
-            # Use cached create params if available (same for all LUNs with same driver/target)
-            if not lun_create_params_cache:
-                lun_create_params_cache["params"] = (
-                    self.config_reader._get_lun_create_params(
-                        driver, target, lun_config.attributes
-                    )
+            lun_create_params = {}
+            if lun_config.attributes:
+                lun_create_params = self.config_reader._get_lun_create_params(
+                    driver, target, lun_config.attributes
                 )
-
-            # Filter for this LUN's specific create params
-            lun_create_params = {
-                k: v
-                for k, v in lun_config.attributes.items()
-                if k in lun_create_params_cache.get("params", {})
-            }
             lun_post_params = {
                 k: v
                 for k, v in lun_config.attributes.items()
@@ -1360,14 +1579,13 @@ class TargetWriter:
 
             # Build SCST management command with creation-time parameters
             # Format: "add {device} {lun_number} param1=value1;param2=value2;"
+            verb = "replace" if replace_existing else "add"
             if lun_create_params:
-                params_str = ";".join(
-                    [f"{k}={v}" for k, v in lun_create_params.items()]
-                )
-                command = f"add {device} {lun_number} {params_str};"
+                params_str = self._format_params(lun_create_params)
+                command = f"{verb} {device} {lun_number} {params_str};"
             else:
                 # Simple assignment with no creation parameters
-                command = f"add {device} {lun_number}"
+                command = f"{verb} {device} {lun_number}"
 
             # Execute LUN assignment command
             self.sysfs.write_sysfs(luns_path, command)
@@ -1376,6 +1594,45 @@ class TargetWriter:
             if lun_post_params:
                 self._set_lun_attributes(driver, target, lun_number, lun_post_params)
 
+    def _lun_mgmt_supports(self, driver: str, luns_mgmt: str, command: str) -> bool:
+        """Check whether SCST LUN mgmt interfaces accept an optional command.
+        Used for commands that save mgmt writes:
+        - "replace {device} {lun}" swaps the device behind an existing LUN in
+          one write instead of "del {lun}" followed by "add {device} {lun}"
+        - "clear" removes every LUN in one write instead of one "del" per LUN
+        The parsed luns/mgmt help is cached per driver by the config reader.
+        Args:
+            driver: SCST target driver name
+            luns_mgmt: Any target or initiator group luns/mgmt path of the driver
+            command: Command name to look for (e.g., 'replace', 'clear')
+        Returns:
+            True if the mgmt help text lists the command
+        """
+        lun_mgmt_info = self.config_reader._get_lun_mgmt_info(driver, luns_mgmt)
+        return lun_mgmt_info is not None and command in lun_mgmt_info["commands"]
+
+    def _initiators_mgmt_supports(
+        self, driver: str, initiators_mgmt: str, command: str
+    ) -> bool:
+        """Check whether initiator group initiators/mgmt accepts an optional
+        command (e.g., 'clear'); see _lun_mgmt_supports()"""
+        commands = self.config_reader._get_initiators_mgmt_commands(
+            driver, initiators_mgmt
+        )
+        return commands is not None and command in commands
+
+    def _format_params(self, params: Dict[str, str]) -> str:
+        """Join creation parameters into SCST's "k1=v1;k2=v2" mgmt syntax.
+        Bulk provisioning repeats the same parameters for many targets or LUNs,
+        so each distinct parameter set is formatted once and reused.
+        """
+        key = tuple(params.items())
+        params_str = self._params_str_cache.get(key)
+        if params_str is None:
+            params_str = ";".join(f"{k}={v}" for k, v in key)
+            self._params_str_cache[key] = params_str
+        return params_str
+
     def apply_group_assignments(
         self, driver: str, target: str, target_config: Dict[str, Any]
     ) -> None:
@@ -1384,10 +1641,12 @@ class TargetWriter:
         Creates groups with initiator membership and LUN assignments. Uses optimized
         checks to only update groups that have different configurations.
         """
+        # Initiator group management path: /sys/.../targets/{driver}/{target}/ini_groups/mgmt
+        paths = self._paths_for(driver, target)
+        mgmt_path = paths.ini_groups_mgmt
+
         # Process each initiator group configuration for this target
         for group_name, group_config in target_config.groups.items():
-            # Initiator group management path: /sys/.../targets/{driver}/{target}/ini_groups/mgmt
-            mgmt_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/mgmt"
 
             # Optimization: skip groups that already have correct configuration
             if self._group_exists(driver, target, group_name):
@@ -1419,42 +1678,48 @@ class TargetWriter:
 
             # Phase 1: Configure initiator membership within the group
             # Each group defines which clients (initiators) can access through this path
-            group_initiators_path = (
-                f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/"
-                f"{group_name}/initiators/mgmt"
-            )
-            for initiator in group_config.initiators:  # InitiatorGroupConfig object
-                try:
+            group_path = paths.group(group_name)
+            self._add_group_members(
+                group_path + "/initiators/mgmt",
+                [
                     # Handle config file escaping: \\# and \\* become # and * in sysfs
-                    clean_initiator = initiator.replace("\\#", "#").replace("\\*", "*")
-                    # Management command: "add {initiator_name}"
-                    self.sysfs.write_sysfs(
-                        group_initiators_path, f"add {clean_initiator}"
-                    )
-                    self.logger.debug(
-                        "Added initiator %s to group %s", clean_initiator, group_name
-                    )
-                except SCSTError:
-                    pass  # Initiator addition might fail if already exists
+                    "add " + unescape_initiator(initiator)
+                    for initiator in group_config.initiators
+                ],
+                group_name,
+            )
 
             # Phase 2: Configure LUN assignments within the group
             # Each group can have different device visibility (different LUN mappings)
-            group_luns_path = f"{self.sysfs.SCST_TARGETS}/{driver}/{target}/ini_groups/{group_name}/luns/mgmt"
-            for lun_number, lun_config in group_config.luns.items():
-                device_name = lun_config.device  # LunConfig object
-                try:
-                    # Management command: "add {device} {lun_number}"
-                    self.sysfs.write_sysfs(
-                        group_luns_path, f"add {device_name} {lun_number}"
-                    )
-                    self.logger.debug(
-                        "Added LUN %s (%s) to group %s",
-                        lun_number,
-                        device_name,
-                        group_name,
-                    )
-                except SCSTError:
-                    pass  # LUN assignment might fail if already exists
+            self._add_group_members(
+                group_path + "/luns/mgmt",
+                [
+                    f"add {lun_config.device} {lun_number}"
+                    for lun_number, lun_config in group_config.luns.items()
+                ],
+                group_name,
+            )
+
+    def _add_group_members(
+        self, mgmt_path: str, commands: List[str], group_name: str
+    ) -> None:
+        """Write a group's "add" commands to one of its mgmt files.
+        SCST takes one command per write(), so the commands are still written
+        one by one, but write_sysfs_batch() opens the mgmt file once for all of
+        them. Failures are not fatal: the member might already exist.
+        Args:
+            mgmt_path: initiators/mgmt or luns/mgmt path of the group
+            commands: Management commands ("add {initiator}", "add {device} {lun}")
+        """
+        if not commands:
+            return
+        try:
+            failures = self.sysfs.write_sysfs_batch(mgmt_path, commands)
+        except SCSTError as e:
+            self.logger.debug("Cannot open %s: %s", mgmt_path, e)
+            return
+        for command, e in failures:
+            self.logger.debug("'%s' failed for group %s: %s", command, group_name, e)
 
     def apply_config_enable_targets(self, config: "SCSTConfig") -> None:
         """Activate configured targets to begin serving storage to initiators.
@@ -1462,28 +1727,13 @@ class TargetWriter:
         Targets must be explicitly enabled after configuration to start accepting
         connections and serving LUNs to SCSI initiators.
         """
+        enabled_paths = []
         for driver_name, driver_config in config.drivers.items():
+            driver_base = f"{self.sysfs.SCST_TARGETS}/{driver_name}/"
             for target_name, target_config in driver_config.targets.items():
-                enabled = target_config.attributes.get("enabled", "0")
-                if enabled == "1":
-                    enabled_path = (
-                        f"{self.sysfs.SCST_TARGETS}/{driver_name}/{target_name}/enabled"
-                    )
-                    try:
-                        # Avoid unnecessary sysfs writes for performance
-                        current_value = self.sysfs.read_sysfs(enabled_path)
-                        if current_value != "1":
-                            self.sysfs.write_sysfs(
-                                enabled_path, "1", check_result=False
-                            )
-                    except SCSTError:
-                        # Fallback: attempt enable even if current state unknown
-                        try:
-                            self.sysfs.write_sysfs(
-                                enabled_path, "1", check_result=False
-                            )
-                        except SCSTError:
-                            pass
+                if target_config.attributes.get("enabled", "0") == "1":
+                    enabled_paths.append(f"{driver_base}{target_name}/enabled")
+        enable_sysfs_entities(self.sysfs, enabled_paths)
 
     def apply_config_enable_drivers(self, config: "SCSTConfig") -> None:
         """Activate SCST protocol drivers to accept initiator connections.
@@ -1491,21 +1741,15 @@ class TargetWriter:
         Drivers like iSCSI, FC, and SRP must be enabled to process protocol-specific
         requests and present targets to the network.
         """
-        for driver_name, driver_config in config.drivers.items():
-            enabled = driver_config.attributes.get("enabled", "0")
-            if enabled == "1":
-                enabled_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}/enabled"
-                try:
-                    # Avoid unnecessary sysfs writes for performance
-                    current_value = self.sysfs.read_sysfs(enabled_path)
-                    if current_value != "1":
-                        self.sysfs.write_sysfs(enabled_path, "1", check_result=False)
-                except SCSTError:
-                    # Fallback: attempt enable even if current state unknown
-                    try:
-                        self.sysfs.write_sysfs(enabled_path, "1", check_result=False)
-                    except SCSTError:
-                        pass
+        targets_base = self.sysfs.SCST_TARGETS
+        enable_sysfs_entities(
+            self.sysfs,
+            [
+                f"{targets_base}/{driver_name}/enabled"
+                for driver_name, driver_config in config.drivers.items()
+                if driver_config.attributes.get("enabled", "0") == "1"
+            ],
+        )
 
     def apply_config_driver_attributes(self, config: "SCSTConfig") -> None:
         """Configure protocol driver parameters for optimal performance and behavior.
@@ -1518,6 +1762,9 @@ class TargetWriter:
         1. Management commands (add_attribute) - for IncomingUser, OutgoingUser, etc.
         2. Direct sysfs writes - for regular attributes like iSNSServer, link_local, etc.
         """
+        # Pass 1: find loaded drivers and which of them have regular attributes
+        loaded_drivers = []
+        snapshot_drivers = []
         for driver_name, driver_config in config.drivers.items():
             driver_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}"
 
@@ -1529,69 +1776,81 @@ class TargetWriter:
             # Get mgmt interface info to identify mgmt-controlled attributes
             mgmt_info = self.config_reader._get_target_mgmt_info(driver_name)
             driver_mgmt_attrs = mgmt_info.get("driver_attributes", set())
+            loaded_drivers.append(
+                (driver_name, driver_path, driver_config, driver_mgmt_attrs)
+            )
+            if any(
+                attr_name != "enabled" and attr_name not in driver_mgmt_attrs
+                for attr_name in driver_config.attributes
+            ):
+                snapshot_drivers.append(driver_name)
 
-            # Apply configuration attributes (enabled handled separately for proper sequencing)
-            for attr_name, attr_value in driver_config.attributes.items():
-                if attr_name == "enabled":
-                    continue  # Skip enabled - must be set after other attributes
-
-                # Check if this is a mgmt-controlled driver attribute
-                if attr_name in driver_mgmt_attrs:
-                    # Use incremental update for driver mgmt attributes (matches Perl behavior)
-                    # Compare current vs desired values and only add/remove what changed
-                    self._update_driver_mgmt_attribute(
-                        driver_name, attr_name, attr_value
-                    )
-                else:
-                    # Use direct sysfs write for regular attributes
-                    attr_path = f"{driver_path}/{attr_name}"
-
-                    # Skip read-only attributes to avoid errors
-                    if (
-                        not os.access(attr_path, os.W_OK)
-                        if os.path.exists(attr_path)
-                        else True
-                    ):
-                        if os.path.exists(attr_path):
-                            self.logger.debug(
-                                "Skipping non-writable attribute %s.%s",
-                                driver_name,
-                                attr_name,
-                            )
-                            continue
+        # Pass 2: read current values of all regular driver attributes, one walk
+        # per driver, with the walks overlapped across drivers
+        driver_snapshots = self._snapshot_drivers(snapshot_drivers)
+
+        # Pass 3: apply the changes serially
+        for driver_name, driver_path, driver_config, mgmt_attrs in loaded_drivers:
+            current_attrs = driver_snapshots.get(driver_name, {})
+            driver_fd = None  # Opened on the first write, anchors the openat() calls
+
+            try:
+                # Apply configuration attributes (enabled handled separately for proper sequencing)
+                for attr_name, attr_value in driver_config.attributes.items():
+                    if attr_name == "enabled":
+                        continue  # Skip enabled - must be set after other attributes
+
+                    # Check if this is a mgmt-controlled driver attribute
+                    if attr_name in mgmt_attrs:
+                        # Use incremental update for driver mgmt attributes (matches Perl behavior)
+                        # Compare current vs desired values and only add/remove what changed
+                        self._update_driver_mgmt_attribute(
+                            driver_name, attr_name, attr_value
+                        )
+                        continue
 
+                    # Avoid unnecessary sysfs writes for performance
+                    if current_attrs.get(attr_name) == attr_value:
+                        continue
+
+                    # No writability pre-check: kernfs refuses a write open of a
+                    # read-only attribute with EACCES, even for root
                     try:
-                        # Avoid unnecessary sysfs writes for performance
-                        if self.sysfs.valid_path(attr_path):
-                            current_value = self.sysfs.read_sysfs_attribute(attr_path)
-                            if current_value != attr_value:
-                                self.sysfs.write_sysfs(
-                                    attr_path, attr_value, check_result=False
-                                )
-                                self.logger.debug(
-                                    "Set driver attribute %s.%s = %s",
-                                    driver_name,
-                                    attr_name,
-                                    attr_value,
-                                )
-                        else:
-                            # Fallback: attempt write even if path validation failed
-                            self.sysfs.write_sysfs(
-                                attr_path, attr_value, check_result=False
-                            )
+                        if driver_fd is None:
+                            driver_fd = self._open_driver_directory(driver_path)
+                        self.sysfs.write_sysfs_attribute_fast(
+                            attr_name, attr_value, dir_fd=driver_fd
+                        )
+                        self.logger.debug(
+                            "Set driver attribute %s.%s = %s",
+                            driver_name,
+                            attr_name,
+                            attr_value,
+                        )
+                    except SCSTError as e:
+                        if isinstance(e.__cause__, PermissionError):
                             self.logger.debug(
-                                "Set driver attribute %s.%s = %s",
+                                "Skipping non-writable attribute %s.%s",
                                 driver_name,
                                 attr_name,
-                                attr_value,
                             )
-                    except SCSTError as e:
+                            continue
                         self.logger.warning(
                             "Failed to set driver attribute %s.%s: %s",
                             driver_name,
                             attr_name,
                             e,
                         )
+            finally:
+                if driver_fd is not None:
+                    os.close(driver_fd)
+
+    def _open_driver_directory(self, driver_path: str) -> int:
+        """Open a driver directory so its attributes are written with openat()"""
+        try:
+            return self.sysfs.open_directory(driver_path)
+        except OSError as e:
+            raise SCSTError(f"Cannot open driver directory {driver_path}: {e}")
 
     def _disable_target_if_possible(self, driver_name: str, target_name: str) -> None:
         """Disable target to prevent new connections if it has an enabled attribute"""
@@ -1655,29 +1914,9 @@ class TargetWriter:
             return False
 
         # Wait for sessions to close (up to timeout seconds)
-        start_time = time.time()
-        remaining_sessions = force_closable_sessions.copy()
-
-        while remaining_sessions and (time.time() - start_time) < timeout:
-            # Check which sessions have actually closed
-            try:
-                current_sessions = set(self.sysfs.list_directory(sessions_path))
-                current_sessions = {
-                    s for s in current_sessions if s != self.sysfs.MGMT_INTERFACE
-                }
-
-                # Remove sessions that are no longer active
-                closed_sessions = remaining_sessions - current_sessions
-                for session in closed_sessions:
-                    remaining_sessions.remove(session)
-                    self.logger.debug("Session %s has closed", session)
-
-                if remaining_sessions:
-                    time.sleep(1)  # Wait 1 second before checking again
-
-            except SCSTError:
-                # If we can't read the sessions directory, assume sessions have closed
-                break
+        remaining_sessions = self._wait_for_sessions_closed(
+            sessions_path, force_closable_sessions, timeout
+        )
 
         if remaining_sessions:
             self.logger.warning(
@@ -1692,10 +1931,64 @@ class TargetWriter:
         )
         return True
 
+    def _wait_for_sessions_closed(
+        self, sessions_path: str, sessions: Set[str], timeout: float
+    ) -> Set[str]:
+        """Poll a target's sessions directory until the given sessions are gone.
+        Most sessions close within tens of milliseconds, so polling starts at
+        SESSION_POLL_MIN and backs off by 1.5x up to SESSION_POLL_MAX. The
+        deadline is taken from the monotonic clock and the last sleep is cut
+        short at it, so a wait returns at the timeout rather than up to a whole
+        poll interval after it.
+        Args:
+            sessions_path: Target sessions directory
+            sessions: Session names expected to disappear
+            timeout: Maximum number of seconds to wait
+        Returns:
+            Sessions still present when the wait ended (empty if all closed)
+        """
+        remaining_sessions = set(sessions)
+        deadline = time.monotonic() + timeout
+        delay = SCSTConstants.SESSION_POLL_MIN
+
+        # Keep the sessions directory open across polls; each poll re-lists it
+        # through the fd instead of resolving the path again
+        try:
+            sessions_fd = os.open(sessions_path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            # Directory vanished with the last session
+            return set()
+
+        try:
+            while remaining_sessions:
+                # Keep only the sessions still listed in the directory
+                waiting = len(remaining_sessions)
+                try:
+                    with os.scandir(sessions_fd) as entries:
+                        remaining_sessions &= {entry.name for entry in entries}
+                except OSError:
+                    # If we can't read the sessions directory, assume sessions have closed
+                    break
+                if len(remaining_sessions) != waiting:
+                    self.logger.debug(
+                        "%s sessions closed, %s remaining",
+                        waiting - len(remaining_sessions),
+                        len(remaining_sessions),
+                    )
+
+                time_left = deadline - time.monotonic()
+                if not remaining_sessions or time_left <= 0:
+                    break
+                time.sleep(min(delay, time_left))
+                delay = min(delay * 1.5, SCSTConstants.SESSION_POLL_MAX)
+        finally:
+            os.close(sessions_fd)
+        return remaining_sessions
+
     def remove_target(self, driver_name: str, target_name: str) -> None:
         """Remove a target and all its contents with session management"""
         try:
-            target_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}/{target_name}"
+            paths = self._paths_for(driver_name, target_name)
 
             # First, disable the target to prevent new connections
             self._disable_target_if_possible(driver_name, target_name)
@@ -1709,22 +2002,18 @@ class TargetWriter:
                 )
 
             # Clear all LUNs first
-            luns_mgmt = f"{target_path}/luns/mgmt"
-            if self.sysfs.valid_path(luns_mgmt):
-                self.sysfs.write_sysfs(luns_mgmt, "clear")
+            if self.sysfs.valid_path(paths.luns_mgmt):
+                self.sysfs.write_sysfs(paths.luns_mgmt, "clear")
 
             # Remove all initiator groups
-            groups_path = f"{target_path}/ini_groups"
+            groups_path = paths.ini_groups
             if self.sysfs.valid_path(groups_path):
-                groups_mgmt = f"{groups_path}/mgmt"
-                for group in self.sysfs.list_directory(groups_path):
-                    if group != self.sysfs.MGMT_INTERFACE:
-                        # Clear group LUNs first
-                        group_luns_mgmt = f"{groups_path}/{group}/luns/mgmt"
-                        if self.sysfs.valid_path(group_luns_mgmt):
-                            self.sysfs.write_sysfs(group_luns_mgmt, "clear")
-                        # Remove the group
-                        self.sysfs.write_sysfs(groups_mgmt, f"del {group}")
+                groups = [
+                    group
+                    for group in self.sysfs.list_directory(groups_path)
+                    if group != self.sysfs.MGMT_INTERFACE
+                ]
+                self._delete_groups(paths, groups)
 
             # Remove the target itself
             driver_mgmt = f"{self.sysfs.SCST_TARGETS}/{driver_name}/mgmt"
@@ -1744,16 +2033,14 @@ class TargetWriter:
     ) -> None:
         """Remove LUNs that are not in the new configuration"""
         try:
-            current_luns = set(current_target.luns.keys())
-            new_luns = set(new_target.luns.keys())
-            luns_to_remove = current_luns - new_luns
+            luns_to_remove = current_target.luns.keys() - new_target.luns.keys()
 
             if luns_to_remove:
-                luns_mgmt = (
-                    f"{self.sysfs.SCST_TARGETS}/{driver_name}/{target_name}/luns/mgmt"
+                luns_mgmt = self._paths_for(driver_name, target_name).luns_mgmt
+                # One open of luns/mgmt for all the "del" commands
+                self._write_batch(
+                    luns_mgmt, [f"del {lun_number}" for lun_number in luns_to_remove]
                 )
-                for lun_number in luns_to_remove:
-                    self.sysfs.write_sysfs(luns_mgmt, f"del {lun_number}")
 
         except SCSTError as e:
             self.logger.warning("Failed to remove obsolete LUNs: %s", e)
@@ -1767,26 +2054,46 @@ class TargetWriter:
     ) -> None:
         """Remove initiator groups that are not in the new configuration"""
         try:
-            current_groups = set(current_target.groups.keys())
-            new_groups = set(new_target.groups.keys())
-            groups_to_remove = current_groups - new_groups
+            groups_to_remove = current_target.groups.keys() - new_target.groups.keys()
 
             if groups_to_remove:
-                groups_mgmt = f"{self.sysfs.SCST_TARGETS}/{driver_name}/{target_name}/ini_groups/mgmt"
-                for group_name in groups_to_remove:
-                    # Clear group LUNs first
-                    group_luns_mgmt = (
-                        f"{self.sysfs.SCST_TARGETS}/{driver_name}/{target_name}"
-                        f"/ini_groups/{group_name}/luns/mgmt"
-                    )
-                    if self.sysfs.valid_path(group_luns_mgmt):
-                        self.sysfs.write_sysfs(group_luns_mgmt, "clear")
-                    # Remove the group
-                    self.sysfs.write_sysfs(groups_mgmt, f"del {group_name}")
+                self._delete_groups(
+                    self._paths_for(driver_name, target_name), groups_to_remove
+                )
 
         except SCSTError as e:
             self.logger.warning("Failed to remove obsolete groups: %s", e)
 
+    def _write_batch(self, mgmt_path: str, commands: List[str]) -> int:
+        """Write commands to one mgmt file through a single open fd.
+        Failed commands are logged and do not stop the rest of the batch.
+        Returns:
+            Number of commands that failed
+        Raises:
+            SCSTError: If the mgmt file cannot be opened
+        """
+        failed = self.sysfs.write_sysfs_batch(mgmt_path, commands)
+        for command, e in failed:
+            self.logger.warning("Failed to write '%s' to %s: %s", command, mgmt_path, e)
+        return len(failed)
+
+    def _delete_groups(self, paths: TargetPaths, groups: Iterable[str]) -> None:
+        """Delete initiator groups of a target, clearing each group's LUNs first.
+        All groups are emptied before any is deleted, so the "del" commands form
+        one batch on ini_groups/mgmt.
+        Raises:
+            SCSTError: If a clear fails or ini_groups/mgmt cannot be opened
+        """
+        groups = list(groups)
+        for group_name in groups:
+            group_luns_mgmt = paths.group(group_name) + "/luns/mgmt"
+            if self.sysfs.valid_path(group_luns_mgmt):
+                self.sysfs.write_sysfs(group_luns_mgmt, "clear")
+        if groups:
+            self._write_batch(
+                paths.ini_groups_mgmt, [f"del {group_name}" for group_name in groups]
+            )
+
     def _remove_obsolete_driver_attributes(
         self, current_config: "SCSTConfig", new_config: "SCSTConfig"
     ) -> None:
@@ -1797,13 +2104,12 @@ class TargetWriter:
             if new_driver_config is None:
                 continue
 
-            current_attributes = current_driver_config.attributes
-            new_attributes = new_driver_config.attributes
-
             # Find attributes that exist in current but not in new config
-            for attr_name in current_attributes:
-                if attr_name not in new_attributes:
-                    self._remove_driver_attribute(driver_name, attr_name)
+            for attr_name in (
+                current_driver_config.attributes.keys()
+                - new_driver_config.attributes.keys()
+            ):
+                self._remove_driver_attribute(driver_name, attr_name)
 
     def _update_driver_mgmt_attribute(
         self, driver_name: str, attr_name: str, desired_value: str
@@ -1903,10 +2209,8 @@ class TargetWriter:
             # For regular sysfs attributes, reset to default value
             attr_path = f"{self.sysfs.SCST_TARGETS}/{driver_name}/{attr_name}"
 
-            # Skip if attribute file doesn't exist or isn't writable
-            if not self.sysfs.valid_path(attr_path) or not os.access(
-                attr_path, os.W_OK
-            ):
+            # Skip if attribute file doesn't exist or isn't readable and writable
+            if not os.access(attr_path, os.R_OK | os.W_OK):
                 self.logger.debug(
                     "Cannot remove driver attribute %s.%s: not accessible",
                     driver_name,
@@ -1920,7 +2224,7 @@ class TargetWriter:
             )
 
             if default_value is not None:
-                current_value = self.sysfs.read_sysfs_attribute(attr_path)
+                current_value = self.sysfs.read_sysfs_attribute_fast(attr_path)
                 if current_value != default_value:
                     self.sysfs.write_sysfs(attr_path, default_value, check_result=False)
                     self.logger.info(
@@ -4,21 +4,99 @@ Utility functions for SCST writers
 
 import os
 import logging
-from typing import Dict, Set, Optional
+from typing import Dict, Iterable, Set, Optional
 
 from ..constants import SCSTConstants
+from ..exceptions import SCSTError
+from ..sysfs import SCSTSysfs
 
 logger = logging.getLogger("scstadmin.writers.utils")
 
 
 def entity_exists(entity_path: str) -> bool:
-    """Generic function to check if a sysfs entity exists with error handling"""
+    """Generic function to check if a sysfs entity exists with error handling.
+    Uses access(F_OK) rather than os.path.exists(): callers only need a
+    boolean, so there is no stat result to fill in and discard.
+    """
     try:
-        return os.path.exists(entity_path)
-    except (OSError, IOError):
+        return os.access(entity_path, os.F_OK)
+    except (OSError, ValueError):
         return False
 
 
+def unescape_initiator(initiator: str) -> str:
+    """Turn a config file initiator name into its sysfs form.
+    Config files escape '#' and '*' as \\# and \\*. Most names contain no
+    backslash at all, so those are returned as-is without the replace passes.
+    """
+    if "\\" not in initiator:
+        return initiator
+    return initiator.replace("\\#", "#").replace("\\*", "*")
+
+
+def enable_sysfs_entities(sysfs: SCSTSysfs, enabled_paths: Iterable[str]) -> int:
+    """Switch a batch of 'enabled' attributes on, skipping ones already set.
+    Callers gather every enabled path first and hand them over in one go, so
+    the read-compare-write sequence lives in one place for drivers and targets.
+    The current value is read with a single raw open/read/close; only entities
+    that are not already enabled are written.
+    Args:
+        sysfs: SCSTSysfs instance used for the reads and writes
+        enabled_paths: Absolute paths of 'enabled' attributes to set to "1"
+    Returns:
+        Number of attributes written
+    """
+    written = 0
+    for enabled_path in enabled_paths:
+        try:
+            # Avoid unnecessary sysfs writes for performance
+            if sysfs.read_sysfs_attribute_fast(enabled_path) == "1":
+                continue
+        except SCSTError:
+            pass  # Fallback: attempt enable even if current state unknown
+        try:
+            sysfs.write_sysfs(enabled_path, "1", check_result=False)
+            written += 1
+        except SCSTError as e:
+            logger.warning("Failed to enable %s: %s", enabled_path, e)
+    return written
+
+
+def snapshot_driver_tree(sysfs: SCSTSysfs, driver_name: str) -> Dict[str, str]:
+    """Read every attribute of a target driver directory in one walk.
+    Lets callers compare many desired driver attributes in memory instead of
+    probing and reading each attribute path separately. Only regular files
+    are read (targets are subdirectories); the mgmt interface and attributes
+    that cannot be read (e.g., write-only) are left out.
+    Args:
+        sysfs: SCSTSysfs instance providing the paths and raw reads
+        driver_name: SCST driver name (e.g., 'iscsi')
+    Returns:
+        {attribute_name: value} without the SCST '[key]' marker; empty if the
+        driver directory does not exist or cannot be listed
+    """
+    snapshot = {}
+    driver_path = f"{sysfs.SCST_TARGETS}/{driver_name}"
+    try:
+        attr_names = sysfs.list_files(driver_path)
+        # Resolve the driver directory once; each attribute is then an openat()
+        dir_fd = sysfs.open_directory(driver_path)
+    except OSError as e:
+        logger.debug("Cannot list attributes of driver %s: %s", driver_name, e)
+        return snapshot
+    try:
+        for attr_name in attr_names:
+            try:
+                snapshot[attr_name] = sysfs.read_sysfs_attribute_fast(
+                    attr_name, dir_fd=dir_fd
+                )
+            except SCSTError:
+                pass
+    finally:
+        os.close(dir_fd)
+    return snapshot
+
+
 def attrs_config_differs(
     desired_attrs: Dict[str, str],
     current_attrs: Dict[str, str],
@@ -55,30 +133,41 @@ def attrs_config_differs(
         current = {'read_only': '0', 'rotational': None}  # rotational not set, defaults to 0
         -> Returns True (read_only differs, rotational matches default)
     """
-    if skip_attrs is None:
-        skip_attrs = set()
-
-    # Compare each desired attribute
-    for attr, desired_value in desired_attrs.items():
-        if attr in skip_attrs:
-            continue
-
-        current_value = current_attrs.get(attr)
-
-        # Skip comparison if current value is undefined and desired is "0"
-        if current_value is None and desired_value == SCSTConstants.SUCCESS_RESULT:
-            continue
+    if skip_attrs:
+        compared_attrs = {
+            attr: value
+            for attr, value in desired_attrs.items()
+            if attr not in skip_attrs
+        }
+    else:
+        compared_attrs = desired_attrs
+
+    # Fast path: every compared attribute is present with the desired value.
+    # The items-view subset test runs entirely in C, without a Python-level
+    # branch per attribute; only a mismatch falls through to the detailed walk
+    if not compared_attrs.items() <= current_attrs.items():
+        for attr, desired_value in compared_attrs.items():
+            current_value = current_attrs.get(attr)
+            if current_value == desired_value:
+                continue
+
+            # Skip comparison if current value is undefined and desired is "0"
+            if current_value is None and desired_value == SCSTConstants.SUCCESS_RESULT:
+                continue
 
-        if current_value != desired_value:
             logger.debug(
-                f"{entity_type} attribute '{attr}' differs: current='{current_value}', desired='{desired_value}'"
+                "%s attribute '%s' differs: current='%s', desired='%s'",
+                entity_type,
+                attr,
+                current_value,
+                desired_value,
             )
             return True
 
     # Check for removable attributes that exist in current but not in desired
     if removable_attrs:
-        for attr in removable_attrs:
-            if attr not in desired_attrs and current_attrs.get(attr) is not None:
+        for attr in removable_attrs - desired_attrs.keys():
+            if current_attrs.get(attr) is not None:
                 return True
 
     return False
@@ -2,15 +2,43 @@
 Pytest configuration and shared fixtures for SCST Python Configurator tests.
 """
 
+import hashlib
+import pickle
 import pytest
 import sys
 from pathlib import Path
+from unittest.mock import Mock
 
 # Add the package to Python path for testing
 test_dir = Path(__file__).parent
 package_root = test_dir.parent  # This is now pyscstadmin/
 sys.path.insert(0, str(package_root))
 
+from scstadmin.parser import SCSTConfigParser  # noqa: E402
+from scstadmin.sysfs import SCSTSysfs  # noqa: E402
+
+# Plain class attributes a specced Mock would otherwise turn into child mocks
+_SYSFS_CONSTANTS = (
+    "SCST_ROOT",
+    "SCST_HANDLERS",
+    "SCST_DEVICES",
+    "SCST_TARGETS",
+    "SCST_DEV_GROUPS",
+    "SCST_QUEUE_RES",
+    "MGMT_INTERFACE",
+    "ENABLED_ATTR",
+    "HANDLER_SYSTEM_ATTRS",
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        help="Reuse parsed sample configurations pickled in .pytest_cache by "
+        "an earlier --cached run",
+    )
+
 
 @pytest.fixture(scope="session")
 def project_root():
@@ -19,9 +47,59 @@ def project_root():
 
 
 @pytest.fixture(scope="session")
-def fixtures_dir():
-    """Path to the test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+def parser():
+    """Parser instance shared by the whole session; parsing keeps no state on it."""
+    return SCSTConfigParser()
+
+
+@pytest.fixture
+def mock_sysfs():
+    """SCSTSysfs mock carrying the real sysfs paths and interface names.
+
+    Methods stay specced mocks (unknown names raise AttributeError); only the
+    constants are copied over, so tests need not set them one by one.
+    """
+    mock = Mock(spec=SCSTSysfs)
+    for name in _SYSFS_CONSTANTS:
+        setattr(mock, name, getattr(SCSTSysfs, name))
+    return mock
+
+
+@pytest.fixture(scope="session")
+def cached_parse(pytestconfig, parser):
+    """Parse configuration text once per session, optionally across runs.
+
+    Returns a function taking (name, text). With --cached the parsed
+    SCSTConfig is pickled to .pytest_cache and loaded from there on later
+    runs; without it nothing is written. The pickle file name carries a hash
+    of the text and of the parser and config sources, so editing either
+    makes a stale pickle miss instead of being loaded. Callers must not
+    mutate the result, as it is shared.
+    """
+    use_cache = pytestconfig.getoption("--cached")
+    sources = hashlib.sha256()
+    for module in ("parser.py", "config.py"):
+        sources.update((package_root / "scstadmin" / module).read_bytes())
+    parsed = {}
+
+    def parse(name, text):
+        digest = sources.copy()
+        digest.update(text.encode())
+        key = f"{name}-{digest.hexdigest()[:16]}"
+        if key in parsed:
+            return parsed[key]
+        cache_file = None
+        if use_cache:
+            cache_file = pytestconfig.cache.mkdir("parsed") / f"{key}.pkl"
+            if cache_file.exists():
+                parsed[key] = pickle.loads(cache_file.read_bytes())
+                return parsed[key]
+        parsed[key] = parser.parse_config_text(text)
+        if cache_file is not None:
+            cache_file.write_bytes(pickle.dumps(parsed[key]))
+        return parsed[key]
+
+    return parse
 
 
 @pytest.fixture
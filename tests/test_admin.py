@@ -5,18 +5,22 @@ This tests the implementation of rel_tgt_id and other target attributes
 for ALUA configurations.
 """
 
-import sys
 import os
 import tempfile
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, call, patch
 
 # Imports handled by conftest.py
 from scstadmin.admin import SCSTAdmin
-from scstadmin.config import TargetGroupConfig
-from scstadmin.parser import SCSTConfigParser
+from scstadmin.config import (
+    SCSTConfig,
+    TargetGroupConfig,
+    VdiskBlockioDeviceConfig,
+    VdiskFileioDeviceConfig,
+)
 
 
-def test_parser_target_group_parsing():
+def test_parser_target_group_parsing(parser):
     """Test parsing of TARGET blocks with attributes using the parser module"""
 
     config_text = """
@@ -31,12 +35,8 @@ DEVICE_GROUP controller_A {
 }
 """
 
-    parser = SCSTConfigParser()
     config = parser.parse_config_text(config_text)
 
-    print("Test 1 - Target group parsing with parser:")
-    print("  Input config includes TARGET blocks with attributes")
-
     # Verify device group was parsed
     assert "controller_A" in config.device_groups
     dg = config.device_groups["controller_A"]
@@ -59,11 +59,6 @@ DEVICE_GROUP controller_A {
     # Verify group attributes were parsed
     assert tg.attributes["cpu_mask"] == "fff"
 
-    print(f"  ✓ Targets: {tg.targets}")
-    print(f"  ✓ Target attributes: {dict(tg.target_attributes)}")
-    print(f"  ✓ Group attributes: {dict(tg.attributes)}")
-    print()
-
 
 def test_target_group_config_comparison():
     """Test that target group configurations are compared correctly"""
@@ -93,9 +88,7 @@ def test_target_group_config_comparison():
     new_config = TargetGroupConfig.from_config_dict("tg1", new_config_dict)
 
     matches = scst.group_writer.target_group_config_matches("dg1", "tg1", new_config)
-    print("Test 2 - Identical target group configs:")
-    print(f"  Should match: True, Got: {matches}")
-    print()
+    assert matches is True
 
     # Test different target attributes (should not match)
     different_config_dict = {
@@ -110,9 +103,7 @@ def test_target_group_config_comparison():
     matches = scst.group_writer.target_group_config_matches(
         "dg1", "tg1", different_config
     )
-    print("Test 3 - Different target attributes:")
-    print(f"  Should match: False, Got: {matches}")
-    print()
+    assert matches is False
 
 
 def test_target_attribute_setting():
@@ -121,46 +112,34 @@ def test_target_attribute_setting():
     scst = SCSTAdmin()
     scst.sysfs = Mock()
     scst.logger = Mock()
+    scst.group_writer.sysfs = Mock(SCST_DEV_GROUPS="/sys/kernel/scst_tgt/device_groups")
 
     # Mock os.path.isdir to return True for directory targets (with attributes)
     with patch("os.path.isdir") as mock_isdir:
         mock_isdir.return_value = True
 
         # Create a mock target config with attributes
-        target_config = Mock()
-        target_config.attributes = {"rel_tgt_id": "1", "preferred": "1"}
+        target_config = SimpleNamespace(
+            attributes={"rel_tgt_id": "1", "preferred": "1"}
+        )
 
         # Test setting target attributes using the group writer
         scst.group_writer._set_target_group_target_attributes(
             "dg1", "tg1", "iqn.2023-01.example.com:test", target_config.attributes
         )
 
-        print("Test 4 - Setting target attributes:")
-        print(f"  Target config: {target_config.attributes}")
-
         # Check that sysfs.write_sysfs was called correctly
-        expected_calls = [
-            (
-                "/sys/kernel/scst_tgt/device_groups/dg1/target_groups/tg1/iqn.2023-01.example.com:test/rel_tgt_id",
-                "1",
-            ),
-            (
-                "/sys/kernel/scst_tgt/device_groups/dg1/target_groups/tg1/iqn.2023-01.example.com:test/preferred",
-                "1",
-            ),
+        target_path = (
+            "/sys/kernel/scst_tgt/device_groups/dg1/target_groups/tg1/"
+            "iqn.2023-01.example.com:test"
+        )
+        assert scst.group_writer.sysfs.write_sysfs.call_args_list == [
+            call(f"{target_path}/rel_tgt_id", "1", check_result=False),
+            call(f"{target_path}/preferred", "1", check_result=False),
         ]
 
-        actual_calls = [call[0] for call in scst.sysfs.write_sysfs.call_args_list]
-        print(f"  Expected sysfs writes: {len(expected_calls)}")
-        print(f"  Actual sysfs writes: {len(actual_calls)}")
-        for i, call in enumerate(actual_calls):
-            print(
-                f"    Call {i + 1}: write_sysfs('{call[0]}', '{call[1]}', check_result=False)"
-            )
-        print()
-
 
-def test_config_file_parsing_integration():
+def test_config_file_parsing_integration(parser):
     """Test end-to-end configuration file parsing with target attributes"""
 
     config_text = """
@@ -181,52 +160,39 @@ DEVICE_GROUP controller_A {
         temp_file = f.name
 
     try:
-        parser = SCSTConfigParser()
         config = parser.parse_config_file(temp_file)
 
-        print("Test 5 - End-to-end config file parsing:")
-        print("  ✓ Config file successfully parsed")
-
         # Verify the structure
         dg = config.device_groups["controller_A"]
         tg = dg.target_groups["disk_volumes"]
 
-        print("  ✓ Device group 'controller_A' found")
-        print("  ✓ Target group 'disk_volumes' found")
-        print(f"  ✓ Targets: {tg.targets}")
-        print(f"  ✓ Target attributes: {dict(tg.target_attributes)}")
-        print(f"  ✓ Group attributes: {dict(tg.attributes)}")
-        print()
+        assert set(tg.targets) == {
+            "iqn.2023-01.example.com:test1",
+            "iqn.2023-01.example.com:test2",
+        }
+        assert tg.target_attributes == {
+            "iqn.2023-01.example.com:test2": {"rel_tgt_id": "1"}
+        }
+        assert tg.attributes == {"cpu_mask": "fff"}
 
     finally:
         os.unlink(temp_file)
 
 
-def main():
-    """Run all tests"""
-    print("Testing SCST Target Attribute Functionality")
-    print("=" * 50)
-    print()
-
-    try:
-        test_parser_target_group_parsing()
-        test_target_group_config_comparison()
-        test_target_attribute_setting()
-        test_config_file_parsing_integration()
-
-        print("All tests completed!")
-        print("Note: These are basic functionality tests. Full integration testing")
-        print("      would require a live SCST system with sysfs available.")
-
-    except Exception as e:
-        print(f"Test failed with error: {e}")
-        import traceback
 
-        traceback.print_exc()
-        return 1
-
-    return 0
+def test_remove_conflicting_devices_use_known_handler():
+    """Test obsolete devices are removed through the handler read from sysfs"""
+    scst = SCSTAdmin()
+    scst.device_writer = Mock()
+    current_config = SCSTConfig(
+        devices={
+            "disk1": VdiskFileioDeviceConfig(name="disk1", filename="/tmp/d1"),
+            "disk2": VdiskBlockioDeviceConfig(name="disk2", filename="/dev/sdb"),
+        }
+    )
+    new_config = SCSTConfig(devices={"disk1": current_config.devices["disk1"]})
 
+    scst._remove_conflicting_config(current_config, new_config)
 
-if __name__ == "__main__":
-    sys.exit(main())
+    scst.device_writer.remove_device.assert_called_once_with("vdisk_blockio", "disk2")
+    scst.device_writer.remove_device_by_name.assert_not_called()
@@ -8,6 +8,8 @@ them into the larger codebase.
 
 import sys
 
+import pytest
+
 # Imports handled by conftest.py
 
 from scstadmin.config import (
@@ -15,13 +17,16 @@ from scstadmin.config import (
     VdiskFileioDeviceConfig,
     VdiskBlockioDeviceConfig,
     DevDiskDeviceConfig,
+    DriverConfig,
+    InitiatorGroupConfig,
+    LunConfig,
+    TargetConfig,
 )
+from scstadmin.writers.target_writer import GroupSnapshot, TargetSnapshot
 
 
 def test_vdisk_fileio():
     """Test VdiskFileioDeviceConfig creation and properties."""
-    print("Testing VdiskFileioDeviceConfig...")
-
     device = VdiskFileioDeviceConfig(
         name="disk1", filename="/path/to/disk1.img", blocksize="4096", readonly="0"
     )
@@ -33,13 +38,9 @@ def test_vdisk_fileio():
     assert device.readonly == "0"
     assert isinstance(device.attributes, dict)
 
-    print("✓ VdiskFileioDeviceConfig works correctly")
-
 
 def test_vdisk_blockio():
     """Test VdiskBlockioDeviceConfig creation and properties."""
-    print("Testing VdiskBlockioDeviceConfig...")
-
     device = VdiskBlockioDeviceConfig(
         name="block_disk", filename="/dev/sdb", nv_cache="1", o_direct="1"
     )
@@ -50,13 +51,9 @@ def test_vdisk_blockio():
     assert device.nv_cache == "1"
     assert device.o_direct == "1"
 
-    print("✓ VdiskBlockioDeviceConfig works correctly")
-
 
 def test_dev_disk():
     """Test DevDiskDeviceConfig creation and properties."""
-    print("Testing DevDiskDeviceConfig...")
-
     device = DevDiskDeviceConfig(name="real_disk", filename="/dev/sda", readonly="1")
 
     assert device.name == "real_disk"
@@ -64,57 +61,71 @@ def test_dev_disk():
     assert device.filename == "/dev/sda"
     assert device.readonly == "1"
 
-    print("✓ DevDiskDeviceConfig works correctly")
-
 
 def test_validation():
     """Test validation logic."""
-    print("Testing validation...")
-
-    try:
-        # Empty name should fail
+    # Empty name should fail
+    with pytest.raises(ValueError):
         VdiskFileioDeviceConfig(name="", filename="/path")
-        assert False, "Should have raised ValueError for empty name"
-    except ValueError:
-        print("✓ Empty name validation works")
 
 
-def test_polymorphism():
-    """Test that all configs work as DeviceConfig instances."""
-    print("Testing polymorphism...")
-
-    devices = [
+@pytest.mark.parametrize(
+    "device",
+    [
         VdiskFileioDeviceConfig(name="file_dev", filename="/tmp/file.img"),
         VdiskBlockioDeviceConfig(name="block_dev", filename="/dev/sdb"),
         DevDiskDeviceConfig(name="real_dev", filename="/dev/sda"),
-    ]
-
-    for device in devices:
-        assert isinstance(device, DeviceConfig)
-        assert device.name  # Should have a name
-        assert device.handler_type  # Should have a handler type
-        print(f"✓ {device.__class__.__name__} is a DeviceConfig")
-
-
-def main():
-    """Run all tests."""
-    try:
-        test_vdisk_fileio()
-        test_vdisk_blockio()
-        test_dev_disk()
-        test_validation()
-        test_polymorphism()
-
-        print("\n🎉 All DeviceConfig tests passed!")
-        return 0
+    ],
+    ids=lambda device: type(device).__name__,
+)
+def test_polymorphism(device):
+    """Test that all configs work as DeviceConfig instances."""
+    assert isinstance(device, DeviceConfig)
+    assert device.name  # Should have a name
+    assert device.handler_type  # Should have a handler type
+
+
+@pytest.mark.parametrize(
+    "device_cls,fields",
+    [
+        (VdiskFileioDeviceConfig, {"blocksize": "4096", "removable": "0"}),
+        (VdiskBlockioDeviceConfig, {"nv_cache": "1", "o_direct": "1"}),
+        (DevDiskDeviceConfig, {"readonly": "1", "rotational": "0"}),
+    ],
+    ids=lambda value: getattr(value, "__name__", ""),
+)
+def test_from_attributes_splits_known_fields(device_cls, fields):
+    """Test that known keys land on dataclass fields and only there."""
+    attrs = {"filename": "/dev/sdb", "t10_vend_id": "TrueNAS", **fields}
 
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
+    device = device_cls.from_attributes("disk1", attrs)
 
-        traceback.print_exc()
-        return 1
+    assert device.filename == "/dev/sdb"
+    for key, value in fields.items():
+        assert getattr(device, key) == value
+    assert device.attributes == {"t10_vend_id": "TrueNAS"}
 
 
-if __name__ == "__main__":
-    sys.exit(main())
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+"
+)
+@pytest.mark.parametrize(
+    "obj",
+    [
+        VdiskFileioDeviceConfig(name="disk1", filename="/path/to/disk1.img"),
+        VdiskBlockioDeviceConfig(name="block_disk", filename="/dev/sdb"),
+        DevDiskDeviceConfig(name="sda", filename="/dev/sda"),
+        LunConfig(lun_number="0", device="disk1"),
+        InitiatorGroupConfig(name="group1"),
+        TargetConfig(name="iqn.2024-01.com.example:test"),
+        DriverConfig(name="iscsi"),
+        GroupSnapshot(),
+        TargetSnapshot(),
+    ],
+    ids=lambda obj: type(obj).__name__,
+)
+def test_config_objects_use_slots(obj):
+    """Test that per-item config and snapshot objects carry no __dict__."""
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.misspelled_attribute = "value"
@@ -5,30 +5,9 @@ Test script to demonstrate logging improvements
 
 import logging
 
-# Imports handled by conftest.py
-from scstadmin.parser import SCSTConfigParser
+import pytest
 
-
-def setup_test_logging(level="INFO"):
-    """Setup logging for testing"""
-    logging.basicConfig(
-        level=getattr(logging, level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%H:%M:%S",
-    )
-
-
-def test_logging_levels():
-    """Test different logging scenarios"""
-    print("=== Testing Logging Improvements ===")
-    print()
-
-    # Test parsing with INFO level
-    print("1. Testing Configuration Parsing (INFO level):")
-    setup_test_logging("INFO")
-    parser = SCSTConfigParser()
-
-    sample_config = """
+SAMPLE_CONFIG = """
 # Test config
 TARGET_DRIVER iscsi {
     enabled 1
@@ -38,42 +17,37 @@ TARGET_DRIVER iscsi {
 }
 """
 
-    try:
-        parser.parse_config_text(sample_config)
-        print("   ✅ Parsing completed")
-    except Exception as e:
-        print(f"   ❌ Parsing failed: {e}")
-
-    print()
-    print("2. Testing Default WARNING level (should show less output):")
-    setup_test_logging("WARNING")
-
-    try:
-        parser.parse_config_text(sample_config)
-        print("   ✅ Parsing completed (minimal output expected)")
-    except Exception as e:
-        print(f"   ❌ Parsing failed: {e}")
-
-    print()
-    print("3. Testing DEBUG level (should show detailed output):")
-    setup_test_logging("DEBUG")
-
-    try:
-        parser.parse_config_text(sample_config)
-        print("   ✅ Parsing completed (detailed output expected)")
-    except Exception as e:
-        print(f"   ❌ Parsing failed: {e}")
-
 
-if __name__ == "__main__":
-    test_logging_levels()
-    print()
-    print("=== Logging Test Summary ===")
-    print("✅ Default level changed to WARNING (clean output)")
-    print("✅ INFO level shows major operation milestones")
-    print("✅ DEBUG level shows detailed operation traces")
-    print()
-    print("Usage examples:")
-    print("  pyscstadmin -config /etc/scst.conf                    # WARNING (clean)")
-    print("  pyscstadmin -config /etc/scst.conf -log INFO          # Shows progress")
-    print("  pyscstadmin -config /etc/scst.conf -log DEBUG         # Full details")
+@pytest.fixture(scope="module")
+def sample_config_file(tmp_path_factory):
+    """Sample configuration written once for all logging levels."""
+    path = tmp_path_factory.mktemp("logging") / "scst.conf"
+    path.write_text(SAMPLE_CONFIG)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "level,expect_progress",
+    [
+        ("INFO", True),  # INFO level shows major operation milestones
+        ("WARNING", False),  # Default WARNING level keeps output clean
+        ("DEBUG", True),  # DEBUG level shows everything INFO does and more
+    ],
+)
+def test_logging_levels(
+    caplog, parser, cached_parse, sample_config_file, level, expect_progress
+):
+    """Test that parser progress messages follow the configured log level"""
+    with caplog.at_level(level, logger="scstadmin"):
+        config = parser.parse_config_file(sample_config_file)
+
+    # The log level must not change what gets parsed
+    assert config == cached_parse("logging_sample", SAMPLE_CONFIG)
+    progress = [r.getMessage() for r in caplog.records if r.levelno == logging.INFO]
+    if expect_progress:
+        assert progress == [
+            f"Parsing configuration file: {sample_config_file}",
+            "Configuration file parsed successfully",
+        ]
+    else:
+        assert progress == []
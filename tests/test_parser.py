@@ -6,9 +6,11 @@ a live SCST system. Tests cover valid configurations, error handling,
 edge cases, and parsing accuracy.
 """
 
-import pytest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 # Imports handled by conftest.py
 from scstadmin.parser import SCSTConfigParser
 from scstadmin.exceptions import SCSTError
@@ -19,29 +21,35 @@ from scstadmin.config import (
     VdiskBlockioDeviceConfig,
 )
 
+_FIXTURES = Path(__file__).parent / "fixtures"
+# Valid fixture configurations, keyed by file name
+VALID_CONFS = {
+    name: str(_FIXTURES / "valid_configs" / name)
+    for name in ("basic.conf", "complex.conf")
+}
+MISSING_BRACES_CONF = str(_FIXTURES / "invalid_configs" / "missing_braces.conf")
 
-class TestSCSTConfigParser:
-    """Test cases for SCSTConfigParser class."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return SCSTConfigParser()
+@pytest.fixture(scope="session")
+def parsed_configs(parser):
+    """Valid fixture configurations, each parsed once per session.
+
+    Keyed by file name (e.g. "basic.conf"). The tests only read the results.
+    """
+    return {name: parser.parse_config_file(path) for name, path in VALID_CONFS.items()}
 
-    @pytest.fixture
-    def fixtures_dir(self):
-        """Path to test fixtures directory."""
-        return Path(__file__).parent / "fixtures"
+
+class TestSCSTConfigParser:
+    """Test cases for SCSTConfigParser class."""
 
     def test_parser_initialization(self, parser):
         """Test parser initializes correctly."""
-        assert parser is not None
+        assert isinstance(parser, SCSTConfigParser)
         assert hasattr(parser, "logger")
 
-    def test_parse_basic_config(self, parser, fixtures_dir):
+    def test_parse_basic_config(self, parsed_configs):
         """Test parsing a basic valid configuration."""
-        config_path = fixtures_dir / "valid_configs" / "basic.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["basic.conf"]
 
         # Verify config structure
         assert isinstance(config, SCSTConfig)
@@ -52,10 +60,9 @@ class TestSCSTConfigParser:
         assert config.device_groups is not None
         assert config.scst_attributes is not None
 
-    def test_parse_handlers_section(self, parser, fixtures_dir):
+    def test_parse_handlers_section(self, parsed_configs):
         """Test parsing HANDLER blocks."""
-        config_path = fixtures_dir / "valid_configs" / "basic.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["basic.conf"]
 
         # Check handlers exist
         assert "vdisk_fileio" in config.handlers
@@ -78,10 +85,9 @@ class TestSCSTConfigParser:
         disk2 = config.devices["disk2"]
         assert disk2.filename == "/path with spaces/disk2.img"
 
-    def test_parse_target_drivers(self, parser, fixtures_dir):
+    def test_parse_target_drivers(self, parsed_configs):
         """Test parsing TARGET_DRIVER blocks."""
-        config_path = fixtures_dir / "valid_configs" / "basic.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["basic.conf"]
 
         # Check drivers
         assert "iscsi" in config.drivers
@@ -97,10 +103,9 @@ class TestSCSTConfigParser:
         target_names = list(targets.keys())
         assert len(target_names) >= 2  # Should have at least 2 targets
 
-    def test_parse_lun_assignments(self, parser, fixtures_dir):
+    def test_parse_lun_assignments(self, parsed_configs):
         """Test parsing LUN assignments within targets."""
-        config_path = fixtures_dir / "valid_configs" / "basic.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["basic.conf"]
 
         target = config.drivers["iscsi"].targets["iqn.2024-01.com.example:target1"]
 
@@ -119,10 +124,9 @@ class TestSCSTConfigParser:
         # Check LUN attributes are in the attributes dict
         assert lun_1.attributes["read_only"] == "1"
 
-    def test_parse_device_groups(self, parser, fixtures_dir):
+    def test_parse_device_groups(self, parsed_configs):
         """Test parsing DEVICE_GROUP blocks."""
-        config_path = fixtures_dir / "valid_configs" / "basic.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["basic.conf"]
 
         # Check device groups
         assert "group1" in config.device_groups
@@ -141,19 +145,17 @@ class TestSCSTConfigParser:
         # Note: LUNs in target groups may not be parsed the same way as target LUNs
         # Let's check if they exist, but don't require a specific structure for now
 
-    def test_parse_global_attributes(self, parser, fixtures_dir):
+    def test_parse_global_attributes(self, parsed_configs):
         """Test parsing global SCST attributes."""
-        config_path = fixtures_dir / "valid_configs" / "basic.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["basic.conf"]
 
         # Check global attributes
         assert config.scst_attributes["setup_id"] == "12345"
         assert config.scst_attributes["max_tasklet_cmd"] == "16"
 
-    def test_parse_complex_config(self, parser, fixtures_dir):
+    def test_parse_complex_config(self, parsed_configs):
         """Test parsing a complex configuration with edge cases."""
-        config_path = fixtures_dir / "valid_configs" / "complex.conf"
-        config = parser.parse_config_file(str(config_path))
+        config = parsed_configs["complex.conf"]
 
         # Check multiple handlers
         assert "vdisk_blockio" in config.handlers
@@ -186,6 +188,30 @@ class TestSCSTConfigParser:
         assert "production_group" in config.device_groups
         assert "test_group" in config.device_groups
 
+    @pytest.mark.parametrize("name", ["basic.conf", "complex.conf"])
+    def test_parse_file_matches_text(self, parser, parsed_configs, name):
+        """Test that streaming a file parses the same as parsing its text."""
+        with open(VALID_CONFS[name]) as f:
+            text = f.read()
+
+        assert parser.parse_config_text(text) == parsed_configs[name]
+
+    def test_concurrent_parses_share_parser(self, parser, parsed_configs):
+        """Test that one parser instance can serve several threads at once."""
+        texts = []
+        for name in ("basic.conf", "complex.conf"):
+            with open(VALID_CONFS[name]) as f:
+                texts.append(f.read())
+        texts *= 4
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(parser.parse_config_text, texts))
+
+        assert results == [
+            parsed_configs["basic.conf"],
+            parsed_configs["complex.conf"],
+        ] * 4
+
     def test_quote_stripping(self, parser):
         """Test quote handling in attribute values."""
         test_config = """
@@ -195,6 +221,9 @@ class TestSCSTConfigParser:
                 unquoted_path /unquoted/path
                 single_quotes '/single/quoted/path'
                 mixed_quotes "/mixed'quotes/path"
+                unbalanced_quotes "/unbalanced/path'
+                lone_quote "
+                spaced_equals = "/spaced/path"
             }
         }
         """
@@ -210,6 +239,10 @@ class TestSCSTConfigParser:
             device.attributes["single_quotes"] == "/single/quoted/path"
         )  # Single quotes not stripped
         assert device.attributes["mixed_quotes"] == "/mixed'quotes/path"
+        # Quotes are only removed as a matching pair around the whole value
+        assert device.attributes["unbalanced_quotes"] == "\"/unbalanced/path'"
+        assert device.attributes["lone_quote"] == '"'
+        assert device.attributes["spaced_equals"] == "/spaced/path"
 
     def test_comment_handling(self, parser):
         """Test that comments are properly ignored (simplified version without inline comments)."""
@@ -257,6 +290,41 @@ class TestSCSTConfigParser:
         assert empty_device.handler_type == "vdisk_fileio"
         assert empty_device.filename == ""  # Empty device should have empty filename
 
+    def test_nested_block_boundaries(self, parser):
+        """Test that nested blocks close at their own braces, not an outer one."""
+        test_config = """
+        HANDLER vdisk_fileio {
+            DEVICE disk1
+            {
+                filename /path/to/disk1
+            }
+            DEVICE disk2 {
+                filename /path/to/disk2
+            }
+        }
+        HANDLER vdisk_blockio {
+            DEVICE disk3 {
+                filename /dev/sdb
+            }
+        }
+        """
+        config = parser.parse_config_text(test_config)
+
+        assert config.devices["disk1"].filename == "/path/to/disk1"
+        assert config.devices["disk2"].filename == "/path/to/disk2"
+        assert config.devices["disk3"].handler_type == "vdisk_blockio"
+
+    def test_unclosed_outer_block(self, parser):
+        """Test that an outer block left open is reported even if inner ones close."""
+        test_config = """
+        HANDLER vdisk_fileio {
+            DEVICE disk1 {
+                filename /path/to/disk1
+            }
+        """
+        with pytest.raises(SCSTError, match="Unmatched braces in HANDLER vdisk_fileio"):
+            parser.parse_config_text(test_config)
+
     def test_missing_file_error(self, parser):
         """Test error handling for missing configuration files."""
         with pytest.raises(SCSTError) as exc_info:
@@ -266,12 +334,10 @@ class TestSCSTConfigParser:
             exc_info.value
         ) or "cannot find the file" in str(exc_info.value)
 
-    def test_syntax_error_reporting(self, parser, fixtures_dir):
+    def test_syntax_error_reporting(self, parser):
         """Test that syntax errors are reported with line numbers."""
-        config_path = fixtures_dir / "invalid_configs" / "missing_braces.conf"
-
         with pytest.raises(SCSTError) as exc_info:
-            parser.parse_config_file(str(config_path))
+            parser.parse_config_file(MISSING_BRACES_CONF)
 
         # Should include line number information
         error_msg = str(exc_info.value)
@@ -282,7 +348,11 @@ class TestSCSTConfigParser:
         test_config = """
         INVALID_BLOCK_TYPE test {
             some_attr value
+            NESTED_BLOCK inner {
+                nested_attr 1
+            }
         }
+        setup_id 0x1
         """
 
         # Parser should ignore unknown blocks and continue (lenient parsing)
@@ -292,6 +362,23 @@ class TestSCSTConfigParser:
         assert len(config.handlers) == 0
         assert len(config.devices) == 0
         assert len(config.drivers) == 0
+        # Nothing from inside the block leaks out as a global attribute
+        assert config.scst_attributes == {"setup_id": "0x1"}
+
+    def test_block_keyword_prefix_is_attribute(self, parser):
+        """Test that only an exact block keyword opens a block."""
+        test_config = """
+        HANDLER_threads 4
+        DEVICE_GROUPS=none
+        """
+        config = parser.parse_config_text(test_config)
+
+        assert config.scst_attributes == {
+            "HANDLER_threads": "4",
+            "DEVICE_GROUPS": "none",
+        }
+        assert len(config.handlers) == 0
+        assert len(config.device_groups) == 0
 
     def test_malformed_lun_assignment(self, parser):
         """Test error handling for malformed LUN assignments."""
@@ -303,16 +390,8 @@ class TestSCSTConfigParser:
         }
         """
 
-        # This should either parse gracefully or raise a clear error
-        # Depending on implementation, we might want to be more lenient
-        try:
-            config = parser.parse_config_text(test_config)
-            # If it parses, verify the structure
-            target = config.drivers["iscsi"].targets["iqn.test:target"]
-            assert hasattr(target, "luns")
-        except SCSTError as e:
-            # If it raises an error, it should be descriptive
-            assert "LUN" in str(e)
+        with pytest.raises(SCSTError, match="Malformed LUN line"):
+            parser.parse_config_text(test_config)
 
     def test_whitespace_handling(self, parser):
         """Test proper handling of various whitespace scenarios."""
@@ -460,6 +539,52 @@ class TestSCSTConfigParser:
         # Verify initiator was parsed too
         assert "iqn.2023-01.com.example:server1" in security_group.initiators
 
+    def test_repeated_names_share_one_string(self, parsed_configs):
+        """Test that device names are interned across their references."""
+        config = parsed_configs["basic.conf"]
+
+        device_name = next(name for name in config.devices if name == "disk1")
+        target = config.drivers["iscsi"].targets["iqn.2024-01.com.example:target1"]
+        group = config.device_groups["group1"]
+
+        assert config.devices["disk1"].name is device_name
+        assert target.luns["0"].device is device_name
+        assert next(d for d in group.devices if d == "disk1") is device_name
+
+    def test_parse_duplicate_group_devices(self, parser):
+        """Test that a repeated DEVICE line in a device group is kept once."""
+        test_config = """
+        DEVICE_GROUP group1 {
+            DEVICE disk2
+            DEVICE disk1
+            DEVICE disk2
+        }
+        """
+        config = parser.parse_config_text(test_config)
+
+        assert config.device_groups["group1"].devices == ["disk2", "disk1"]
+
+    def test_parse_duplicate_initiators(self, parser):
+        """Test that a repeated INITIATOR line is kept once, in file order."""
+        test_config = r"""
+        TARGET_DRIVER iscsi {
+            TARGET iqn.2024-01.com.example:target1 {
+                GROUP clients {
+                    INITIATOR iqn.2023-01.com.example:server2
+                    INITIATOR iqn.2023-01.com.example:server1\#10.0.0.1
+                    INITIATOR iqn.2023-01.com.example:server2
+                }
+            }
+        }
+        """
+        config = parser.parse_config_text(test_config)
+
+        target = config.drivers["iscsi"].targets["iqn.2024-01.com.example:target1"]
+        assert target.groups["clients"].initiators == [
+            "iqn.2023-01.com.example:server2",
+            "iqn.2023-01.com.example:server1\\#10.0.0.1",
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
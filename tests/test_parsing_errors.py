@@ -3,50 +3,78 @@
 Test script to verify configuration parsing error handling
 """
 
+import re
+
+import pytest
+
 # Imports handled by conftest.py
-from scstadmin.parser import SCSTConfigParser
 from scstadmin.exceptions import SCSTError
 
 
-def test_parsing_errors():
-    """Test various malformed configuration scenarios"""
-    parser = SCSTConfigParser()
-
-    test_cases = [
-        # Test case, expected error keyword
-        ("HANDLER", "Malformed HANDLER"),
-        ("TARGET_DRIVER", "Malformed TARGET_DRIVER"),
-        ("TARGET_DRIVER iscsi {\n    TARGET\n}", "Malformed TARGET"),
+@pytest.mark.parametrize(
+    "config_text,expected_error",
+    [
+        ("HANDLER vdisk_fileio {", "Unmatched braces in HANDLER vdisk_fileio"),
         (
-            "TARGET_DRIVER iscsi {\n    TARGET test {\n        LUN\n    }\n}",
-            "Malformed LUN",
+            "TARGET_DRIVER iscsi {\n    TARGET test {\n    }\n",
+            "Unmatched braces in TARGET_DRIVER iscsi",
         ),
         (
-            "invalid_global = value",
-            "Ignoring unrecognized",
-        ),  # This should be logged, not error
-        ("global_attr =", "Configuration parsing error"),  # This should fail
-    ]
-
-    print("Testing configuration parsing error handling...")
-
-    for i, (config_text, expected_error) in enumerate(test_cases, 1):
-        print(f"\n--- Test {i}: {config_text[:20]}...")
-
-        try:
-            parser.parse_config_text(config_text)
-            print("✅ Parsed successfully (unexpected for some tests)")
-        except SCSTError as e:
-            error_msg = str(e)
-            if expected_error.lower() in error_msg.lower():
-                print(f"✅ Correctly caught error: {error_msg}")
-            else:
-                print(
-                    f"❌ Wrong error type. Expected '{expected_error}', got: {error_msg}"
-                )
-        except Exception as e:
-            print(f"❌ Unexpected exception type: {type(e).__name__}: {e}")
-
-
-if __name__ == "__main__":
-    test_parsing_errors()
+            "HANDLER vdisk_nullio {\n    DEVICE disk1 {\n    }\n}",
+            "Unsupported handler type 'vdisk_nullio' for device 'disk1'",
+        ),
+        (
+            "VENDOR_BLOCK x {\n    attr 1\n",
+            "Unmatched braces in block starting at line 1",
+        ),
+    ],
+    ids=[
+        "unclosed_handler",
+        "unclosed_driver",
+        "unsupported_handler",
+        "unclosed_unknown_block",
+    ],
+)
+def test_parsing_error(parser, config_text, expected_error):
+    """Test that malformed configurations raise a descriptive SCSTError"""
+    with pytest.raises(SCSTError, match=re.escape(expected_error)):
+        parser.parse_config_text(config_text)
+
+
+@pytest.mark.parametrize(
+    "config_text,expected_attributes",
+    [
+        # Bare block keywords without a name are logged and skipped
+        ("HANDLER", {}),
+        ("TARGET_DRIVER", {}),
+        ("invalid_global = value", {"invalid_global": "value"}),
+        ("global_attr =", {"global_attr": ""}),
+    ],
+    ids=["bare_handler", "bare_target_driver", "spaced_global", "empty_global"],
+)
+def test_lenient_parsing(parser, config_text, expected_attributes):
+    """Test that questionable top-level lines are tolerated, not fatal"""
+    config = parser.parse_config_text(config_text)
+
+    assert config.scst_attributes == expected_attributes
+    assert config.handlers == {}
+    assert config.drivers == {}
+
+
+@pytest.mark.parametrize(
+    "config_text",
+    [
+        "TARGET_DRIVER iscsi {\n    TARGET\n}",
+        "TARGET_DRIVER iscsi {\n    TARGET test {\n        LUN\n    }\n}",
+    ],
+    ids=["bare_target", "bare_lun"],
+)
+def test_bare_nested_keywords_ignored(parser, config_text):
+    """Test that nameless TARGET/LUN lines inside a block add nothing"""
+    config = parser.parse_config_text(config_text)
+
+    driver = config.drivers["iscsi"]
+    assert driver.attributes == {}
+    for target in driver.targets.values():
+        assert target.luns == {}
+        assert target.attributes == {}
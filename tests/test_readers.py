@@ -31,33 +31,125 @@ import pytest
 from unittest.mock import Mock, patch
 
 from scstadmin.readers.device_reader import DeviceReader
-from scstadmin.readers.target_reader import TargetReader
+from scstadmin.readers.target_reader import (
+    TargetReader,
+    parse_lun_mgmt_content,
+    parse_mgmt_parameters,
+    parse_target_mgmt_content,
+)
 from scstadmin.readers.group_reader import DeviceGroupReader
 from scstadmin.readers.config_reader import SCSTConfigurationReader
-from scstadmin.sysfs import SCSTSysfs
+from scstadmin.constants import SCSTConstants
 from scstadmin.exceptions import SCSTError
 
 
+@pytest.mark.parametrize(
+    "reader_cls", [DeviceReader, TargetReader, SCSTConfigurationReader]
+)
+@pytest.mark.parametrize(
+    "read_effect,expected",
+    [
+        ("test_value", "test_value"),
+        (FileNotFoundError("No such file"), None),  # File doesn't exist
+        (SCSTError("Read failed"), None),
+        (OSError("File error"), None),
+    ],
+    ids=["ok", "missing", "scst_error", "os_error"],
+)
+def test_safe_read_attribute(mock_sysfs, reader_cls, read_effect, expected):
+    """Test every reader's _safe_read_attribute maps failures to None."""
+    reader = reader_cls(mock_sysfs)
+    if isinstance(read_effect, Exception):
+        mock_sysfs.read_sysfs_attribute.side_effect = read_effect
+    else:
+        mock_sysfs.read_sysfs_attribute.return_value = read_effect
+
+    with patch("os.path.isfile") as mock_isfile:
+        assert reader._safe_read_attribute("/path/to/attr") == expected
+
+    # The read itself reports a missing file; no stat() precheck
+    mock_isfile.assert_not_called()
+    mock_sysfs.read_sysfs_attribute.assert_called_once_with("/path/to/attr")
+
+
+@pytest.mark.parametrize("reader_cls", [DeviceReader, TargetReader])
+@pytest.mark.parametrize(
+    "mgmt_content,expected",
+    [
+        (
+            'Usage: echo "add_device dev_name [parameters]" >mgmt\n\n'
+            "The following parameters available: filename, blocksize, read_only.\n",
+            {"filename", "blocksize", "read_only"},
+        ),
+        (
+            'Usage: echo "add_device dev_name" >mgmt\nDevice management commands.\n',
+            set(),
+        ),
+        ("", set()),
+    ],
+    ids=["parameters", "no_parameters", "empty"],
+)
+def test_parse_mgmt_parameters(mock_sysfs, reader_cls, mgmt_content, expected):
+    """Test both readers parse mgmt help text the same way."""
+    assert reader_cls(mock_sysfs)._parse_mgmt_parameters(mgmt_content) == expected
+
+
+@pytest.mark.parametrize(
+    "mgmt_content,expected",
+    [
+        (
+            'Usage: echo "add lun [parameters]" >mgmt\n'
+            "The following parameters available: read_only.\n",
+            {"read_only"},
+        ),
+        # Last line without a trailing newline or full stop
+        (
+            "Usage: ...\nThe following parameters available: filename, blocksize",
+            {"filename", "blocksize"},
+        ),
+        # Only the parameters line is used, not the attribute sections
+        (
+            "The following parameters available: node_name, .\n"
+            "The following target attributes available: IncomingUser.\n",
+            {"node_name"},
+        ),
+        ('Usage: echo "del lun" >mgmt\n', set()),
+    ],
+    ids=["single", "no_trailing_newline", "stops_at_line_end", "absent"],
+)
+def test_parse_mgmt_parameters_function(mgmt_content, expected):
+    """Test the shared mgmt parameter parser on edge cases of the help text."""
+    assert parse_mgmt_parameters(mgmt_content) == expected
+
+
+def test_parse_lun_mgmt_content():
+    """Test luns/mgmt help parsing into accepted commands and creation params."""
+    mgmt_content = (
+        'Usage: echo "add H:C:I:L lun [parameters]" >mgmt\n'
+        '       echo "del lun" >mgmt\n'
+        '       echo "replace H:C:I:L lun [parameters]" >mgmt\n'
+        '       echo "clear" >mgmt\n'
+        "\n"
+        "The following parameters available: read_only.\n"
+    )
+    assert parse_lun_mgmt_content(mgmt_content) == {
+        "commands": {"add", "del", "replace", "clear"},
+        "create_params": {"read_only"},
+    }
+
+
 class TestDeviceReader:
     """Test DeviceReader functionality using real SCSTSysfs interface."""
 
-    def test_device_reader_initialization(self):
+    def test_device_reader_initialization(self, mock_sysfs):
         """Test DeviceReader can be initialized with sysfs interface."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = DeviceReader(mock_sysfs)
         assert reader.sysfs == mock_sysfs
 
-    def test_read_devices_basic(self):
+    def test_read_devices_basic(self, mock_sysfs):
         """Test reading devices using real sysfs interface."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-
         # Mock the actual interface that DeviceReader uses
-        mock_sysfs.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        mock_sysfs.list_directory.return_value = ["disk1", "disk2", "sda"]
-
-        # Mock os.path.islink for handler detection
-        def mock_islink(path):
-            return path.endswith("/handler")
+        mock_sysfs.list_subdirectories.return_value = ["disk1", "disk2", "sda"]
 
         # Mock os.readlink for handler type detection
         def mock_readlink(path):
@@ -68,7 +160,6 @@ class TestDeviceReader:
             return ""
 
         with (
-            patch("os.path.islink", side_effect=mock_islink),
             patch("os.readlink", side_effect=mock_readlink),
             patch("os.path.isfile", return_value=True),
         ):
@@ -97,220 +188,174 @@ class TestDeviceReader:
             assert "sda" in devices
 
             # Verify actual interface calls
-            mock_sysfs.list_directory.assert_called_once_with(
+            mock_sysfs.list_subdirectories.assert_called_once_with(
                 "/sys/kernel/scst_tgt/devices"
             )
 
-    def test_read_devices_empty_directory(self):
+    def test_read_devices_empty_directory(self, mock_sysfs):
         """Test reading when devices directory is empty."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        mock_sysfs.list_directory.return_value = []
+        mock_sysfs.list_subdirectories.return_value = []
 
         reader = DeviceReader(mock_sysfs)
         devices = reader.read_devices()
 
         assert devices == {}
-        mock_sysfs.list_directory.assert_called_once_with(
+        mock_sysfs.list_subdirectories.assert_called_once_with(
             "/sys/kernel/scst_tgt/devices"
         )
 
-    def test_read_devices_sysfs_error(self):
+    def test_read_devices_sysfs_error(self, mock_sysfs):
         """Test handling sysfs directory listing errors."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        mock_sysfs.list_directory.side_effect = SCSTError("Cannot access sysfs")
+        mock_sysfs.list_subdirectories.side_effect = SCSTError("Cannot access sysfs")
 
         reader = DeviceReader(mock_sysfs)
 
         with pytest.raises(SCSTError):
             reader.read_devices()
 
-    def test_get_current_device_attrs_filtered(self):
+    def test_get_device_handler_type(self, mock_sysfs, tmp_path, caplog):
+        """Test handler detection reads the handler symlink without probing it."""
+        mock_sysfs.SCST_DEVICES = str(tmp_path)
+        reader = DeviceReader(mock_sysfs)
+        (tmp_path / "disk1").mkdir()
+        (tmp_path / "disk1" / "handler").symlink_to("../../handlers/vdisk_fileio")
+        (tmp_path / "disk2").mkdir()
+        (tmp_path / "disk3").mkdir()
+        (tmp_path / "disk3" / "handler").write_text("")
+
+        assert reader._get_device_handler_type("disk1") == "vdisk_fileio"
+        # No handler link, or a regular file: quietly no handler
+        assert reader._get_device_handler_type("disk2") is None
+        assert reader._get_device_handler_type("disk3") is None
+        assert caplog.records == []
+
+    def test_get_current_device_attrs_filtered(self, mock_sysfs):
         """Test reading specific device attributes with filtering."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
         reader = DeviceReader(mock_sysfs)
+        mock_sysfs.read_many.return_value = {
+            "filename": "/tmp/test.img",
+            "blocksize": "4096",
+            "read_only": "0",
+        }
 
-        # Test filtered attribute reading
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.path.isfile", return_value=True),
-        ):
-
-            def mock_read_sysfs_attribute(path):
-                if path.endswith("/filename"):
-                    return "/tmp/test.img"
-                elif path.endswith("/blocksize"):
-                    return "4096"
-                elif path.endswith("/read_only"):
-                    return "0"
-                return None
-
-            mock_sysfs.read_sysfs_attribute.side_effect = mock_read_sysfs_attribute
-
-            # Test reading specific attributes
-            filter_attrs = {"filename", "blocksize", "read_only"}
-            result = reader._get_current_device_attrs(
-                "vdisk_fileio", "disk1", filter_attrs
-            )
+        # Test reading specific attributes
+        filter_attrs = {"filename", "blocksize", "read_only"}
+        result = reader._get_current_device_attrs(
+            "vdisk_fileio", "disk1", filter_attrs
+        )
 
-            # Should read the requested attributes (excluding 'handler')
-            assert "filename" in result
-            assert result["filename"] == "/tmp/test.img"
-            assert "blocksize" in result
-            assert result["blocksize"] == "4096"
-            assert "read_only" in result
-            assert result["read_only"] == "0"
+        # All requested attributes are read in one batch from the device directory
+        dir_path, names = mock_sysfs.read_many.call_args.args
+        assert dir_path == "/sys/kernel/scst_tgt/handlers/vdisk_fileio/disk1"
+        assert set(names) == filter_attrs
+        assert result == {
+            "filename": "/tmp/test.img",
+            "blocksize": "4096",
+            "read_only": "0",
+        }
 
-    def test_get_current_device_attrs_fallback_mode(self):
+    def test_get_current_device_attrs_fallback_mode(self, mock_sysfs):
         """Test device attribute reading fallback mode (no filter)."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
         reader = DeviceReader(mock_sysfs)
+        mock_sysfs.read_many.return_value = {
+            "filename": "/dev/sda1",
+            "blocksize": "512",
+            "read_only": "1",
+        }
 
         # Test fallback mode (reads all attributes)
-        with (
-            patch("os.path.exists", return_value=True),
-            patch(
-                "os.listdir",
-                return_value=["filename", "blocksize", "read_only", "handler"],
-            ),
-            patch("os.path.isfile", return_value=True),
+        with patch(
+            "os.listdir",
+            return_value=["filename", "blocksize", "read_only", "handler", ".hidden"],
         ):
-
-            def mock_read_sysfs_attribute(path):
-                if path.endswith("/filename"):
-                    return "/dev/sda1"
-                elif path.endswith("/blocksize"):
-                    return "512"
-                elif path.endswith("/read_only"):
-                    return "1"
-                return None
-
-            mock_sysfs.read_sysfs_attribute.side_effect = mock_read_sysfs_attribute
-
-            # Test fallback mode (no filter_attrs)
             result = reader._get_current_device_attrs("dev_disk", "sda1", None)
 
-            # Should read all available attributes
-            assert "filename" in result
-            assert result["filename"] == "/dev/sda1"
-            assert "blocksize" in result
-            assert result["blocksize"] == "512"
-            assert "read_only" in result
-            assert result["read_only"] == "1"
+        # Every listed entry except dot-files and the handler link is read
+        dir_path, names = mock_sysfs.read_many.call_args.args
+        assert dir_path == "/sys/kernel/scst_tgt/handlers/dev_disk/sda1"
+        assert names == ["filename", "blocksize", "read_only"]
+        assert result == {"filename": "/dev/sda1", "blocksize": "512", "read_only": "1"}
 
-    def test_get_current_device_attrs_error_conditions(self):
+    def test_get_current_device_attrs_error_conditions(self, mock_sysfs):
         """Test device attribute reading error handling."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
         reader = DeviceReader(mock_sysfs)
 
         # Test device doesn't exist
-        with patch("os.path.exists", return_value=False):
+        with patch("os.listdir", side_effect=FileNotFoundError("No such device")):
             result = reader._get_current_device_attrs("vdisk_fileio", "missing_device")
             assert result == {}
 
-        # Test OSError during directory operations
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.listdir", side_effect=OSError("Permission denied")),
-        ):
-            result = reader._get_current_device_attrs("vdisk_fileio", "device1", None)
-            assert result == {}
+        # Test OSError while opening the device directory
+        mock_sysfs.read_many.side_effect = OSError("Permission denied")
+        result = reader._get_current_device_attrs(
+            "vdisk_fileio", "device1", {"filename"}
+        )
+        assert result == {}
 
-    def test_get_current_device_attrs_skip_handler_attribute(self):
+    def test_get_current_device_attrs_skip_handler_attribute(self, mock_sysfs):
         """Test that 'handler' attribute is properly skipped in filtered reading."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
-        reader = DeviceReader(mock_sysfs)
-
-        with patch("os.path.exists", return_value=True):
-            # Test that 'handler' attribute is skipped (line 115-116)
-            filter_attrs = {"handler", "filename"}
-            result = reader._get_current_device_attrs(
-                "vdisk_fileio", "disk1", filter_attrs
-            )
-
-            # Should skip 'handler' attribute via continue statement
-            assert "handler" not in result
-
-    def test_safe_read_attribute(self):
-        """Test safe attribute reading with various conditions."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = DeviceReader(mock_sysfs)
+        mock_sysfs.read_many.return_value = {}
 
-        # Test successful read
-        with patch("os.path.isfile", return_value=True):
-            mock_sysfs.read_sysfs_attribute.return_value = "test_value"
-            result = reader._safe_read_attribute("/path/to/attr")
-            assert result == "test_value"
-
-        # Test file doesn't exist
-        with patch("os.path.isfile", return_value=False):
-            result = reader._safe_read_attribute("/missing/file")
-            assert result is None
+        filter_attrs = {"handler", "filename"}
+        reader._get_current_device_attrs("vdisk_fileio", "disk1", filter_attrs)
 
-        # Test exception handling
-        with patch("os.path.isfile", return_value=True):
-            from scstadmin.exceptions import SCSTError
-
-            mock_sysfs.read_sysfs_attribute.side_effect = SCSTError("Read failed")
-            result = reader._safe_read_attribute("/error/path")
-            assert result is None
+        # The handler symlink is metadata and is never read
+        _, names = mock_sysfs.read_many.call_args.args
+        assert names == ["filename"]
 
-    def test_parse_mgmt_parameters(self):
-        """Test management interface parameter parsing."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
+    def test_bulk_snapshot(self, mock_sysfs):
+        """Test several devices are snapshotted with their own handler and filter."""
         reader = DeviceReader(mock_sysfs)
+        handlers_path = "/sys/kernel/scst_tgt/handlers"
+        current = {
+            f"{handlers_path}/vdisk_fileio/disk1": {"filename": "/tmp/disk1.img"},
+            f"{handlers_path}/vdisk_blockio/disk2": {"filename": "/dev/sdb"},
+        }
+        mock_sysfs.read_many.side_effect = lambda path, names: current.get(path, {})
+
+        result = reader._bulk_snapshot(
+            {
+                "disk1": ("vdisk_fileio", {"filename"}),
+                "disk2": ("vdisk_blockio", {"filename", "handler"}),
+                "missing": ("vdisk_fileio", {"filename"}),
+            }
+        )
 
-        # Test normal parameter parsing
-        mgmt_content = """Usage: echo "add_device dev_name [parameters]" >mgmt
-
-The following parameters available: filename, blocksize, read_only, rotational.
-        """
-
-        result = reader._parse_mgmt_parameters(mgmt_content)
-        expected = {"filename", "blocksize", "read_only", "rotational"}
-        assert result == expected
-
-        # Test no parameters available
-        mgmt_content_no_params = """Usage: echo "add_device dev_name" >mgmt
-Device management commands.
-        """
-        result = reader._parse_mgmt_parameters(mgmt_content_no_params)
-        assert result == set()
-
-        # Test empty content
-        result = reader._parse_mgmt_parameters("")
-        assert result == set()
+        # Every device is read from its own handler directory; devices that
+        # do not exist come back empty
+        assert result == {
+            "disk1": {"filename": "/tmp/disk1.img"},
+            "disk2": {"filename": "/dev/sdb"},
+            "missing": {},
+        }
+        assert sorted(
+            (c.args[0], list(c.args[1])) for c in mock_sysfs.read_many.call_args_list
+        ) == [
+            (f"{handlers_path}/vdisk_blockio/disk2", ["filename"]),
+            (f"{handlers_path}/vdisk_fileio/disk1", ["filename"]),
+            (f"{handlers_path}/vdisk_fileio/missing", ["filename"]),
+        ]
 
 
 class TestTargetReader:
     """Test TargetReader functionality using real SCSTSysfs interface."""
 
-    def test_target_reader_initialization(self):
+    def test_target_reader_initialization(self, mock_sysfs):
         """Test TargetReader can be initialized."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = TargetReader(mock_sysfs)
         assert reader.sysfs == mock_sysfs
 
-    def test_read_drivers_basic(self):
+    def test_read_drivers_basic(self, mock_sysfs):
         """Test reading target drivers using real interface."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-
-        # Mock the constants that TargetReader uses
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-
-        # Mock directory listing - provide enough responses for all calls
-        mock_sysfs.list_directory.side_effect = [
-            ["iscsi", "qla2x00t"],  # targets directory
-            ["iqn.2024-01.test:target1"],  # iscsi targets
-            [],  # iscsi target luns (empty)
-            ["21:00:00:24:ff:12:34:56"],  # qla2x00t targets
-            [],  # qla2x00t target luns (empty)
-        ]
+        # Mock directory listing - drivers, then the targets of each driver
+        # (keyed by path: the two drivers are read concurrently)
+        mock_sysfs.list_directory.return_value = ["iscsi", "qla2x00t"]
+        driver_targets = {
+            "/sys/kernel/scst_tgt/targets/iscsi": ["iqn.2024-01.test:target1"],
+            "/sys/kernel/scst_tgt/targets/qla2x00t": ["21:00:00:24:ff:12:34:56"],
+        }
+        mock_sysfs.list_subdirectories.side_effect = driver_targets.__getitem__
 
         # Mock path validation - TargetReader checks valid_path
         mock_sysfs.valid_path.return_value = True
@@ -338,19 +383,32 @@ class TestTargetReader:
             drivers = reader.read_drivers()
 
             # Verify we got the expected drivers
-            assert len(drivers) == 2
-            assert "iscsi" in drivers
-            assert "qla2x00t" in drivers
+            assert list(drivers) == ["iscsi", "qla2x00t"]
+
+            assert list(drivers["iscsi"].targets) == ["iqn.2024-01.test:target1"]
+            assert list(drivers["qla2x00t"].targets) == ["21:00:00:24:ff:12:34:56"]
 
             # Verify interface usage
-            assert mock_sysfs.list_directory.call_count >= 1
-            first_call = mock_sysfs.list_directory.call_args_list[0][0][0]
-            assert first_call == "/sys/kernel/scst_tgt/targets"
+            mock_sysfs.list_directory.assert_called_once_with(
+                "/sys/kernel/scst_tgt/targets"
+            )
+            assert sorted(
+                c.args[0] for c in mock_sysfs.list_subdirectories.mock_calls
+            ) == sorted(driver_targets)
+
+    def test_read_drivers_keeps_driver_attributes_constant(self, mock_sysfs):
+        """Test target detection does not add to the shared DRIVER_ATTRIBUTES sets."""
+        mock_sysfs.list_directory.return_value = ["iscsi"]
+        mock_sysfs.list_subdirectories.return_value = []
+        mock_sysfs.valid_path.return_value = False
+        before = set(SCSTConstants.DRIVER_ATTRIBUTES["iscsi"])
+
+        TargetReader(mock_sysfs).read_drivers()
 
-    def test_read_drivers_no_drivers(self):
+        assert SCSTConstants.DRIVER_ATTRIBUTES["iscsi"] == before
+
+    def test_read_drivers_no_drivers(self, mock_sysfs):
         """Test reading when no drivers exist."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         mock_sysfs.list_directory.return_value = []
 
         reader = TargetReader(mock_sysfs)
@@ -361,18 +419,12 @@ class TestTargetReader:
             "/sys/kernel/scst_tgt/targets"
         )
 
-    def test_read_drivers_with_luns(self):
+    def test_read_drivers_with_luns(self, mock_sysfs):
         """Test reading drivers with targets that have LUN assignments."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-
-        # Mock directory listing for targets
-        mock_sysfs.list_directory.side_effect = [
-            ["iscsi"],  # targets directory
-            [
-                "iqn.2024-01.test:storage"
-            ],  # iscsi targets (no mgmt, enabled since those are filtered)
-        ]
+        # Mock directory listing for drivers and targets
+        mock_sysfs.list_directory.return_value = ["iscsi"]
+        # iscsi targets (no mgmt, enabled since those are filtered)
+        mock_sysfs.list_subdirectories.return_value = ["iqn.2024-01.test:storage"]
 
         mock_sysfs.valid_path.return_value = True
 
@@ -394,10 +446,7 @@ class TestTargetReader:
 
         mock_sysfs.read_sysfs.side_effect = mock_read_sysfs
 
-        with (
-            patch("os.path.isfile", return_value=True),
-            patch("os.path.isdir", return_value=True),
-        ):
+        with patch("os.path.isfile", return_value=True):
             reader = TargetReader(mock_sysfs)
             drivers = reader.read_drivers()
 
@@ -414,10 +463,8 @@ class TestTargetReader:
             assert target.groups == {}
             assert target.attributes == {}
 
-    def test_parse_target_mgmt_interface(self):
+    def test_parse_target_mgmt_interface(self, mock_sysfs):
         """Test parsing of target management interface."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         mock_sysfs.valid_path.return_value = True
 
         # Mock mgmt interface content with actual SCST format
@@ -448,9 +495,33 @@ The following target attributes available: IncomingUser, OutgoingUser, allowed_p
         assert "enabled" in driver_attrs
         assert "trace_level" in driver_attrs
 
-    def test_read_attribute_if_non_default(self):
+    def test_parse_target_mgmt_content_all_sections(self):
+        """Test parsing mgmt help text containing all three attribute sections."""
+        mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
+       echo "del_target target_name" >mgmt
+
+   The following parameters available: node_name, parent_host.
+The following target driver attributes available: enabled, trace_level
+The following target attributes available: IncomingUser, allowed_portal.
+"""
+
+        result = parse_target_mgmt_content(mgmt_content)
+
+        assert result == {
+            "create_params": {"node_name", "parent_host"},
+            "driver_attributes": {"enabled", "trace_level"},
+            "target_attributes": {"IncomingUser", "allowed_portal"},
+        }
+
+        # Sections are optional; a missing one yields an empty set
+        assert parse_target_mgmt_content("Usage: nothing here") == {
+            "create_params": set(),
+            "driver_attributes": set(),
+            "target_attributes": set(),
+        }
+
+    def test_read_attribute_if_non_default(self, mock_sysfs):
         """Test reading attributes with [key] suffix handling."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = TargetReader(mock_sysfs)
 
         # Test attribute with [key] suffix (non-default value)
@@ -464,19 +535,15 @@ The following target attributes available: IncomingUser, OutgoingUser, allowed_p
         assert result is None
 
         # Test read error - _read_attribute_if_non_default catches SCSTError
-        from scstadmin.exceptions import SCSTError
-
         mock_sysfs.read_sysfs.side_effect = SCSTError("Read error")
         result = reader._read_attribute_if_non_default("/path/to/attr")
         assert result is None
 
-    def test_get_current_lun_device(self):
+    def test_get_current_lun_device(self, mock_sysfs):
         """Test LUN device mapping discovery."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = TargetReader(mock_sysfs)
 
         # Test successful LUN device reading - need to mock os operations
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         with (
             patch("os.path.exists", return_value=True),
             patch("os.path.islink", return_value=True),
@@ -490,10 +557,8 @@ The following target attributes available: IncomingUser, OutgoingUser, allowed_p
             device = reader._get_current_lun_device("iscsi", "iqn.test:target", "99")
             assert device == ""
 
-    def test_get_target_create_params(self):
+    def test_get_target_create_params(self, mock_sysfs):
         """Test target creation parameter building."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
         # Mock sysfs reads - let the real parsing logic run
@@ -551,44 +616,11 @@ The following parameters available: node_name, parent_host
         assert "invalid_param" not in qla_params
         assert qla_params["node_name"] == "20:00:00:24:ff:12:34:56"
 
-    def test_safe_read_attribute_error_handling(self):
-        """Test safe attribute reading with error conditions."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        reader = TargetReader(mock_sysfs)
-
-        # Test successful read - _safe_read_attribute checks os.path.isfile first
-        with patch("os.path.isfile", return_value=True):
-            mock_sysfs.read_sysfs_attribute.return_value = "success_value"
-            result = reader._safe_read_attribute("/valid/path")
-            assert result == "success_value"
-
-        # Test file doesn't exist
-        with patch("os.path.isfile", return_value=False):
-            result = reader._safe_read_attribute("/missing/path")
-            assert result is None
-
-        # Test read error - _safe_read_attribute catches OSError, IOError, SCSTError
-        with patch("os.path.isfile", return_value=True):
-            from scstadmin.exceptions import SCSTError
-
-            mock_sysfs.read_sysfs_attribute.side_effect = SCSTError("Read failed")
-            result = reader._safe_read_attribute("/invalid/path")
-            assert result is None
-
-        # Test OSError handling
-        with patch("os.path.isfile", return_value=True):
-            mock_sysfs.read_sysfs_attribute.side_effect = OSError("File error")
-            result = reader._safe_read_attribute("/invalid/path")
-            assert result is None
-
-    def test_get_lun_create_params(self):
+    def test_get_lun_create_params(self, mock_sysfs):
         """Test LUN creation parameter parsing."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
         # Test with valid LUN mgmt interface
-        mock_sysfs.valid_path.return_value = True
         lun_mgmt_content = """Usage: echo "assign lun_num device_name [parameters]" >mgmt
 
 The following parameters available: read_only, device_name.
@@ -608,23 +640,91 @@ The following parameters available: read_only, device_name.
         assert "device_name" in result
         assert "invalid_param" not in result
 
-        # Test with invalid mgmt path
-        mock_sysfs.valid_path.return_value = False
+        # Test with SCSTError during read (missing or unreadable mgmt file)
+        reader = TargetReader(mock_sysfs)
+        mock_sysfs.read_sysfs.side_effect = SCSTError("Read failed")
         result = reader._get_lun_create_params("iscsi", "target1", lun_attrs)
         assert result == {}
 
-        # Test with SCSTError during read
-        mock_sysfs.valid_path.return_value = True
-        from scstadmin.exceptions import SCSTError
+    def test_get_lun_create_params_cached_per_driver(self, mock_sysfs):
+        """
+        Test the luns mgmt interface is read once per driver
 
-        mock_sysfs.read_sysfs.side_effect = SCSTError("Read failed")
-        result = reader._get_lun_create_params("iscsi", "target1", lun_attrs)
-        assert result == {}
+        This test verifies that:
+        1. A second target of the same driver reuses the parsed help
+        2. Another driver reads its own luns mgmt interface
+        3. A failed read is not cached, so a later target can still succeed
+        4. clear_mgmt_help_cache() makes the next lookup read the help again
+        """
+        # Arrange
+        reader = TargetReader(mock_sysfs)
+
+        def read_sysfs(path):
+            if "/target0/" in path:
+                raise SCSTError(f"Cannot read from {path}")
+            return "The following parameters available: read_only.\n"
+
+        mock_sysfs.read_sysfs.side_effect = read_sysfs
+        lun_attrs = {"read_only": "1", "device_name": "disk1"}
+
+        # Act
+        missing = reader._get_lun_create_params("iscsi", "target0", lun_attrs)
+        results = [
+            reader._get_lun_create_params(driver, target, lun_attrs)
+            for driver, target in [
+                ("iscsi", "target1"),
+                ("iscsi", "target2"),
+                ("qla2x00t", "port1"),
+            ]
+        ]
+
+        # Assert
+        assert missing == {}
+        assert results == [{"read_only": "1"}] * 3
+        assert [c.args[0] for c in mock_sysfs.read_sysfs.call_args_list] == [
+            f"{mock_sysfs.SCST_TARGETS}/iscsi/target0/luns/mgmt",
+            f"{mock_sysfs.SCST_TARGETS}/iscsi/target1/luns/mgmt",
+            f"{mock_sysfs.SCST_TARGETS}/qla2x00t/port1/luns/mgmt",
+        ]
+
+        # Act & Assert: A new apply starts from a fresh read
+        reader.clear_mgmt_help_cache()
+        reader._get_lun_create_params("iscsi", "target2", lun_attrs)
+        assert mock_sysfs.read_sysfs.call_args.args[0] == (
+            f"{mock_sysfs.SCST_TARGETS}/iscsi/target2/luns/mgmt"
+        )
 
-    def test_get_current_group_lun_device(self):
+    def test_get_initiators_mgmt_commands_cached_per_driver(self, mock_sysfs):
+        """
+        Test initiators/mgmt help is parsed into commands once per driver
+
+        This test verifies that:
+        1. Quoted command names are extracted from the help text
+        2. A second group of the same driver reuses the parsed commands
+        3. An unreadable initiators/mgmt yields None and is not cached
+        """
+        # Arrange
+        reader = TargetReader(mock_sysfs)
+        mock_sysfs.read_sysfs.side_effect = [
+            SCSTError("Cannot read"),
+            'Usage: echo "add INITIATOR_NAME" >mgmt\n'
+            '       echo "del INITIATOR_NAME" >mgmt\n'
+            '       echo "clear" >mgmt\n',
+        ]
+        mgmt = f"{mock_sysfs.SCST_TARGETS}/iscsi/tgt/ini_groups/%s/initiators/mgmt"
+
+        # Act
+        missing = reader._get_initiators_mgmt_commands("iscsi", mgmt % "g0")
+        first = reader._get_initiators_mgmt_commands("iscsi", mgmt % "g1")
+        second = reader._get_initiators_mgmt_commands("iscsi", mgmt % "g2")
+
+        # Assert
+        assert missing is None
+        assert first == second == {"add", "del", "clear"}
+        assert mock_sysfs.read_sysfs.call_count == 2
+
+    def test_get_current_group_lun_device(self, mock_sysfs):
         """Test group LUN device mapping discovery."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
         # Test successful group LUN device reading
@@ -645,9 +745,8 @@ The following parameters available: read_only, device_name.
             )
             assert device == ""
 
-    def test_get_driver_attribute_default(self):
+    def test_get_driver_attribute_default(self, mock_sysfs):
         """Test driver attribute default value lookup."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = TargetReader(mock_sysfs)
 
         # Test known iSCSI defaults
@@ -663,249 +762,181 @@ The following parameters available: read_only, device_name.
             reader._get_driver_attribute_default("unknown_driver", "any_attr") is None
         )
 
-    def test_parse_mgmt_parameters(self):
-        """Test management interface parameter parsing."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
+    def test_get_current_target_attrs_comprehensive(self, mock_sysfs):
+        """Test comprehensive target attribute reading with multi-value attributes."""
         reader = TargetReader(mock_sysfs)
 
-        # Test normal parameter parsing
-        mgmt_content = """Usage: echo "add_device dev_name [parameters]" >mgmt
+        # Mock mgmt interface for attribute type detection
+        mock_sysfs.valid_path.return_value = True
+        mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
 
-The following parameters available: filename, blocksize, read_only.
+The following parameters available: node_name.
+The following target attributes available: IncomingUser, OutgoingUser, enabled.
         """
+        mock_sysfs.read_sysfs.return_value = mgmt_content
 
-        result = reader._parse_mgmt_parameters(mgmt_content)
-        expected = {"filename", "blocksize", "read_only"}
-        assert result == expected
+        # Multi-value attribute testing:
+        # SCST stores multi-value attributes like IncomingUser as:
+        # - /sys/.../IncomingUser (base attribute)
+        # - /sys/.../IncomingUser1 (numbered variants)
+        # - /sys/.../IncomingUser2, IncomingUser3, etc.
+        # The method should collect all values and join with semicolons
+        variants = {
+            "IncomingUser": [
+                ("IncomingUser", "user1:pass1"),
+                ("IncomingUser1", "user2:pass2"),
+                ("IncomingUser2", "user3:pass3"),
+            ],
+            "enabled": [("enabled", "1")],
+            "OutgoingUser": [],  # Only empty variants - nothing collected
+        }
+        mock_sysfs.read_attribute_variants.side_effect = (
+            lambda path, attr: variants[attr]
+        )
 
-        # Test no parameters available
-        mgmt_content_no_params = """Usage: echo "add_device dev_name" >mgmt
-        """
-        result = reader._parse_mgmt_parameters(mgmt_content_no_params)
-        assert result == set()
+        # Test reading specific multi-value attributes
+        filter_attrs = {"IncomingUser", "OutgoingUser", "enabled"}
+        result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
 
-    def test_get_current_target_attrs_comprehensive(self):
-        """Test comprehensive target attribute reading with multi-value attributes."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-        reader = TargetReader(mock_sysfs)
+        # Should collect multi-value IncomingUser entries
+        assert result["IncomingUser"] == "user1:pass1;user2:pass2;user3:pass3"
 
-        # Test filtered attribute reading with multi-value attributes
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.path.isfile", return_value=True),
-        ):
-            # Mock mgmt interface for attribute type detection
-            mock_sysfs.valid_path.return_value = True
-            mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
+        # Should include enabled (non-creation param)
+        assert result["enabled"] == "1"
 
-The following parameters available: node_name.
-The following target attributes available: IncomingUser, OutgoingUser, enabled.
-            """
-            mock_sysfs.read_sysfs.return_value = mgmt_content
-
-            # Multi-value attribute testing:
-            # SCST stores multi-value attributes like IncomingUser as:
-            # - /sys/.../IncomingUser (base attribute)
-            # - /sys/.../IncomingUser1 (numbered variants)
-            # - /sys/.../IncomingUser2, IncomingUser3, etc.
-            # The method should collect all values and join with semicolons
-            def mock_read_sysfs_attribute(path):
-                if path.endswith("/IncomingUser"):
-                    return "user1:pass1"
-                elif path.endswith("/IncomingUser1"):
-                    return "user2:pass2"
-                elif path.endswith("/IncomingUser2"):
-                    return "user3:pass3"
-                elif path.endswith("/enabled"):
-                    return "1"
-                elif path.endswith("/OutgoingUser"):
-                    return ""  # Empty value - will be filtered out
-                return None
-
-            mock_sysfs.read_sysfs_attribute.side_effect = mock_read_sysfs_attribute
-
-            # Test reading specific multi-value attributes
-            filter_attrs = {"IncomingUser", "OutgoingUser", "enabled"}
-            result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
-
-            # Should collect multi-value IncomingUser entries
-            assert "IncomingUser" in result
-            assert result["IncomingUser"] == "user1:pass1;user2:pass2;user3:pass3"
-
-            # Should include enabled (non-creation param)
-            assert "enabled" in result
-            assert result["enabled"] == "1"
-
-            # Should skip creation params (node_name not included)
-            assert "node_name" not in result
-
-            # OutgoingUser returns empty string, so gets filtered out (only non-empty values stored)
-            assert "OutgoingUser" not in result
-
-    def test_get_current_target_attrs_fallback_mode(self):
-        """Test target attribute reading fallback mode (no filter)."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-        reader = TargetReader(mock_sysfs)
+        # Should skip creation params (node_name not included)
+        assert "node_name" not in result
 
-        with (
-            patch("os.path.exists", return_value=True),
-            patch(
-                "os.listdir",
-                return_value=[
-                    "enabled",
-                    "luns",
-                    "ini_groups",
-                    "sessions",
-                    "trace_level",
-                ],
-            ),
-            patch("os.path.isfile") as mock_isfile,
-        ):
-            # Mock os.path.isfile to return True for attribute files, False for directories
-            def mock_isfile_func(path):
-                return path.endswith(("/enabled", "/trace_level"))
-
-            mock_isfile.side_effect = mock_isfile_func
-
-            def mock_read_sysfs_attribute(path):
-                if path.endswith("/enabled"):
-                    return "1"
-                elif path.endswith("/trace_level"):
-                    return "3"
-                return None
+        # OutgoingUser has no non-empty values, so it is not stored
+        assert "OutgoingUser" not in result
 
-            mock_sysfs.read_sysfs_attribute.side_effect = mock_read_sysfs_attribute
+        # Every variant is read from the target directory
+        for call in mock_sysfs.read_attribute_variants.call_args_list:
+            assert call.args[0] == f"{mock_sysfs.SCST_TARGETS}/iscsi/target1"
+        mock_sysfs.read_many.assert_not_called()
 
+    def test_get_current_target_attrs_fallback_mode(self, mock_sysfs):
+        """Test target attribute reading fallback mode (no filter)."""
+        reader = TargetReader(mock_sysfs)
+        mock_sysfs.read_many.return_value = {"enabled": "1", "trace_level": "3"}
+
+        with patch(
+            "os.listdir",
+            return_value=[
+                "enabled",
+                "luns",
+                "ini_groups",
+                "sessions",
+                "trace_level",
+                ".hidden",
+            ],
+        ):
             # Test fallback mode (no filter_attrs)
             result = reader._get_current_target_attrs("iscsi", "target1", None)
 
-            # Should read all available attributes (excluding directories)
-            assert "enabled" in result
-            assert result["enabled"] == "1"
-            assert "trace_level" in result
-            assert result["trace_level"] == "3"
+        # Should read all available attributes in one batch
+        assert result == {"enabled": "1", "trace_level": "3"}
 
-            # Should not include directory names
-            assert "luns" not in result
-            assert "ini_groups" not in result
+        # Should not ask for subdirectories or hidden entries
+        mock_sysfs.read_many.assert_called_once_with(
+            f"{mock_sysfs.SCST_TARGETS}/iscsi/target1", ["enabled", "trace_level"]
+        )
 
-    def test_get_current_target_attrs_error_conditions(self):
+    def test_get_current_target_attrs_error_conditions(self, mock_sysfs):
         """Test target attribute reading error handling."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
         # Test target doesn't exist
-        with patch("os.path.exists", return_value=False):
+        with patch("os.listdir", side_effect=FileNotFoundError("missing")):
             result = reader._get_current_target_attrs("iscsi", "missing_target")
             assert result == {}
 
         # Test OSError during directory operations
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.listdir", side_effect=OSError("Permission denied")),
-        ):
+        with patch("os.listdir", side_effect=OSError("Permission denied")):
             result = reader._get_current_target_attrs("iscsi", "target1", None)
             assert result == {}
 
-        # Test SCSTError during attribute reading
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.path.isfile", return_value=True),
-        ):
-            mock_sysfs.valid_path.return_value = True
-            mgmt_content = """The following target attributes available: enabled."""
-            mock_sysfs.read_sysfs.return_value = mgmt_content
-
-            from scstadmin.exceptions import SCSTError
-
-            mock_sysfs.read_sysfs_attribute.side_effect = SCSTError("Read failed")
+        # Test an unreadable target directory during a filtered read
+        mock_sysfs.valid_path.return_value = True
+        mgmt_content = """The following target attributes available: enabled."""
+        mock_sysfs.read_sysfs.return_value = mgmt_content
+        mock_sysfs.read_attribute_variants.side_effect = OSError("Permission denied")
 
-            filter_attrs = {"enabled"}
-            result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
+        filter_attrs = {"enabled"}
+        result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
 
-            # Should handle SCSTError gracefully and continue
-            assert result == {}
+        # Should handle the error gracefully
+        assert result == {}
 
-    def test_get_current_target_attrs_creation_param_skip(self):
-        """Test that creation parameters are skipped in filtered attribute reading - line 240.
+    def test_get_current_target_attrs_creation_param_skip(self, mock_sysfs):
+        """Test that creation parameters are skipped in filtered attribute reading.
 
         Creation parameters can only be set during target creation and cannot be
         read or modified afterward. This test ensures they're properly filtered out
         when reading current target state.
         """
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
-        with patch("os.path.exists", return_value=True):
-            # Mock mgmt interface with creation parameters
-            mock_sysfs.valid_path.return_value = True
-            mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
+        # Mock mgmt interface with creation parameters
+        mock_sysfs.valid_path.return_value = True
+        mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
 
 The following parameters available: node_name, parent_host.
 The following target attributes available: enabled.
-            """
-            mock_sysfs.read_sysfs.return_value = mgmt_content
+        """
+        mock_sysfs.read_sysfs.return_value = mgmt_content
+        mock_sysfs.read_attribute_variants.return_value = [("enabled", "1")]
 
-            # Request attributes including creation params - should skip them (line 240)
-            filter_attrs = {"node_name", "parent_host", "enabled"}
-            result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
+        # Request attributes including creation params - should skip them
+        filter_attrs = {"node_name", "parent_host", "enabled"}
+        result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
 
-            # Should skip creation params via continue statement on line 240
-            assert "node_name" not in result
-            assert "parent_host" not in result
+        assert result == {"enabled": "1"}
+        mock_sysfs.read_attribute_variants.assert_called_once_with(
+            f"{mock_sysfs.SCST_TARGETS}/iscsi/target1", "enabled"
+        )
+        mock_sysfs.read_many.assert_not_called()
 
-    def test_get_current_target_attrs_regular_attributes(self):
-        """Test reading regular (non-multi-value) attributes - lines 272-276.
+    def test_get_current_target_attrs_regular_attributes(self, mock_sysfs):
+        """Test reading regular (non-multi-value) attributes.
 
         Tests the code path for attributes that aren't listed in target_attributes
-        from the mgmt interface. These are read as single-value files rather than
-        being collected as multi-value attributes.
+        from the mgmt interface. These are read as single-value files in one
+        read_many() batch rather than being collected as multi-value attributes.
         """
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
-        with (
-            patch("os.path.exists", return_value=True),
-            patch("os.path.isfile", return_value=True),
-        ):
-            # Mock mgmt interface with target attributes
-            mock_sysfs.valid_path.return_value = True
-            mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
+        # Mock mgmt interface with target attributes
+        mock_sysfs.valid_path.return_value = True
+        mgmt_content = """Usage: echo "add_target target_name [parameters]" >mgmt
 
 The following target attributes available: IncomingUser.
-            """
-            mock_sysfs.read_sysfs.return_value = mgmt_content
-            mock_sysfs.read_sysfs_attribute.return_value = "debug_value"
+        """
+        mock_sysfs.read_sysfs.return_value = mgmt_content
+        mock_sysfs.read_many.return_value = {"trace_level": "debug_value"}
 
-            # Request attribute that's NOT in target_attributes - triggers regular path
-            filter_attrs = {"trace_level"}  # Not in target_attributes
-            result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
+        # Request attribute that's NOT in target_attributes - triggers regular path
+        filter_attrs = {"trace_level"}  # Not in target_attributes
+        result = reader._get_current_target_attrs("iscsi", "target1", filter_attrs)
 
-            # Should read via regular attribute path (lines 272-276)
-            assert "trace_level" in result
-            assert result["trace_level"] == "debug_value"
+        assert result == {"trace_level": "debug_value"}
+        mock_sysfs.read_many.assert_called_once_with(
+            f"{mock_sysfs.SCST_TARGETS}/iscsi/target1", ["trace_level"]
+        )
+        mock_sysfs.read_attribute_variants.assert_not_called()
 
-    def test_read_drivers_with_non_default_attributes(self):
+    def test_read_drivers_with_non_default_attributes(self, mock_sysfs):
         """Test driver attribute assignment when non-default values exist - line 392.
 
         Driver attributes are only stored in the configuration if they have
         non-default values (indicated by [key] suffix in sysfs). This test ensures
         the assignment logic works when such attributes are found.
         """
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
         reader = TargetReader(mock_sysfs)
 
         # Mock directory listing
-        mock_sysfs.list_directory.side_effect = [
-            ["iscsi"],  # targets directory
-            [],  # no targets in iscsi
-        ]
+        mock_sysfs.list_directory.return_value = ["iscsi"]  # targets directory
+        mock_sysfs.list_subdirectories.return_value = []  # no targets in iscsi
 
         mock_sysfs.valid_path.return_value = True
 
@@ -943,18 +974,14 @@ The following target attributes available: IncomingUser, OutgoingUser, allowed_p
 class TestDeviceGroupReader:
     """Test DeviceGroupReader functionality using real SCSTSysfs interface."""
 
-    def test_group_reader_initialization(self):
+    def test_group_reader_initialization(self, mock_sysfs):
         """Test DeviceGroupReader can be initialized."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = DeviceGroupReader(mock_sysfs)
         assert reader.sysfs == mock_sysfs
 
-    def test_read_device_groups_basic(self):
+    def test_read_device_groups_basic(self, mock_sysfs):
         """Test reading device groups using real interface."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-
         # Mock the constant that DeviceGroupReader uses
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
 
         # Mock directory listing - provide enough responses for all nested calls
         mock_sysfs.list_directory.side_effect = [
@@ -988,10 +1015,8 @@ class TestDeviceGroupReader:
             first_call = mock_sysfs.list_directory.call_args_list[0][0][0]
             assert first_call == "/sys/kernel/scst_tgt/device_groups"
 
-    def test_read_device_groups_empty(self):
+    def test_read_device_groups_empty(self, mock_sysfs):
         """Test reading when no device groups exist."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
         mock_sysfs.list_directory.return_value = []
 
         reader = DeviceGroupReader(mock_sysfs)
@@ -1002,11 +1027,8 @@ class TestDeviceGroupReader:
             "/sys/kernel/scst_tgt/device_groups"
         )
 
-    def test_read_device_groups_with_target_attributes(self):
+    def test_read_device_groups_with_target_attributes(self, mock_sysfs):
         """Test reading device groups with target groups that have target attributes."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
-
         # Mock directory listing for complex device group structure
         mock_sysfs.list_directory.side_effect = [
             ["production"],  # device groups
@@ -1073,11 +1095,8 @@ class TestDeviceGroupReader:
             assert target1_attrs["rel_tgt_id"] == "1"
             assert target2_attrs["rel_tgt_id"] == "2"
 
-    def test_read_device_groups_no_valid_path(self):
+    def test_read_device_groups_no_valid_path(self, mock_sysfs):
         """Test when device groups directory doesn't exist - line 40."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
-
         # Mock invalid path (device groups not available)
         mock_sysfs.valid_path.return_value = False
 
@@ -1090,11 +1109,8 @@ class TestDeviceGroupReader:
             "/sys/kernel/scst_tgt/device_groups"
         )
 
-    def test_read_device_groups_target_attribute_error_handling(self):
+    def test_read_device_groups_target_attribute_error_handling(self, mock_sysfs):
         """Test error handling during target attribute reading - lines 90-93."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
-
         # Mock directory listing
         mock_sysfs.list_directory.side_effect = [
             ["test_group"],  # device groups
@@ -1111,8 +1127,6 @@ class TestDeviceGroupReader:
             patch("os.path.isfile", return_value=True),
         ):
             # Mock SCSTError during attribute reading (line 90-91)
-            from scstadmin.exceptions import SCSTError
-
             mock_sysfs.read_sysfs_attribute.side_effect = SCSTError("Permission denied")
 
             reader = DeviceGroupReader(mock_sysfs)
@@ -1128,11 +1142,8 @@ class TestDeviceGroupReader:
             assert "iqn.test:target1" in test_tgroup.targets
             assert "iqn.test:target1" not in test_tgroup.target_attributes
 
-    def test_read_device_groups_target_directory_error(self):
+    def test_read_device_groups_target_directory_error(self, mock_sysfs):
         """Test OSError during target directory operations - lines 92-93."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
-
         # Mock directory listing
         mock_sysfs.list_directory.side_effect = [
             ["test_group"],  # device groups
@@ -1164,9 +1175,8 @@ class TestDeviceGroupReader:
 class TestSCSTConfigurationReader:
     """Test the main configuration reader orchestrator."""
 
-    def test_config_reader_initialization(self):
+    def test_config_reader_initialization(self, mock_sysfs):
         """Test SCSTConfigurationReader initialization."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
         reader = SCSTConfigurationReader(mock_sysfs)
 
         assert reader.sysfs == mock_sysfs
@@ -1182,16 +1192,9 @@ class TestSCSTConfigurationReader:
         mock_group_reader_class,
         mock_target_reader_class,
         mock_device_reader_class,
+        mock_sysfs,
     ):
         """Test full configuration reading integration."""
-        mock_sysfs = Mock(spec=SCSTSysfs)
-
-        # Mock constants that SCSTConfigurationReader uses
-        mock_sysfs.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
-        mock_sysfs.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        mock_sysfs.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-        mock_sysfs.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
-        mock_sysfs.SCST_ROOT = "/sys/kernel/scst_tgt"
 
         # Mock directory listing for config reader's direct sysfs calls
         mock_sysfs.list_directory.side_effect = [
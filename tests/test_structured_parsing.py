@@ -3,19 +3,16 @@
 Test script to verify structured DeviceConfig parsing works correctly.
 """
 
-import sys
 from pathlib import Path
 
 # Imports handled by conftest.py
-from scstadmin.parser import SCSTConfigParser
 from scstadmin.config import VdiskFileioDeviceConfig, DevDiskDeviceConfig
 
+BASIC_CONF = str(Path(__file__).parent / "fixtures" / "valid_configs" / "basic.conf")
 
-def test_structured_device_parsing():
-    """Test that parser creates proper DeviceConfig objects."""
-    print("Testing structured device parsing...")
 
-    parser = SCSTConfigParser()
+def test_structured_device_parsing(parser):
+    """Test that parser creates proper DeviceConfig objects."""
 
     # Test basic device config parsing
     config_text = """
@@ -65,54 +62,30 @@ def test_structured_device_parsing():
     assert physical_disk.filename == "/dev/sdb"
     assert physical_disk.readonly == "1"
 
-    print("✓ Structured device parsing works correctly")
-
     # Test with basic.conf fixture
-    fixtures_dir = Path(__file__).parent / "tests" / "fixtures" / "valid_configs"
-    if (fixtures_dir / "basic.conf").exists():
-        print("Testing with basic.conf fixture...")
-        config = parser.parse_config_file(str(fixtures_dir / "basic.conf"))
-
-        # Check the specific devices from basic.conf
-        assert "disk1" in config.devices
-        assert "disk2" in config.devices
-        assert "sda" in config.devices
-
-        disk1 = config.devices["disk1"]
-        disk2 = config.devices["disk2"]
-        sda = config.devices["sda"]
-
-        # Verify types
-        assert isinstance(disk1, VdiskFileioDeviceConfig)
-        assert isinstance(disk2, VdiskFileioDeviceConfig)
-        assert isinstance(sda, DevDiskDeviceConfig)
-
-        # Verify attributes
-        assert disk1.filename == "/path/to/disk1.img"
-        assert disk1.blocksize == "4096"
-        assert disk1.readonly == "0"
-
-        assert disk2.filename == "/path with spaces/disk2.img"
-        assert disk2.blocksize == "512"
-
-        assert sda.filename == "/dev/sda"
-        assert sda.handler_type == "dev_disk"
+    config = parser.parse_config_file(BASIC_CONF)
 
-        print("✓ basic.conf parsing works with structured objects")
+    # Check the specific devices from basic.conf
+    assert "disk1" in config.devices
+    assert "disk2" in config.devices
+    assert "sda" in config.devices
 
+    disk1 = config.devices["disk1"]
+    disk2 = config.devices["disk2"]
+    sda = config.devices["sda"]
 
-def main():
-    try:
-        test_structured_device_parsing()
-        print("\n🎉 All structured parsing tests passed!")
-        return 0
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
+    # Verify types
+    assert isinstance(disk1, VdiskFileioDeviceConfig)
+    assert isinstance(disk2, VdiskFileioDeviceConfig)
+    assert isinstance(sda, DevDiskDeviceConfig)
 
-        traceback.print_exc()
-        return 1
+    # Verify attributes
+    assert disk1.filename == "/path/to/disk1.img"
+    assert disk1.blocksize == "4096"
+    assert disk1.readonly == "0"
 
+    assert disk2.filename == "/path with spaces/disk2.img"
+    assert disk2.blocksize == "512"
 
-if __name__ == "__main__":
-    sys.exit(main())
+    assert sda.filename == "/dev/sda"
+    assert sda.handler_type == "dev_disk"
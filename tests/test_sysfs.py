@@ -0,0 +1,293 @@
+"""
+Test suite for the SCSTSysfs low-level interface
+
+These tests exercise the directory helpers against a temporary directory
+tree laid out like /sys/kernel/scst_tgt.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from scstadmin.exceptions import SCSTError
+from scstadmin.sysfs import SCSTSysfs, map_reads
+
+
+class TestSCSTSysfs:
+    """Test cases for SCSTSysfs directory and attribute helpers"""
+
+    @pytest.fixture
+    def sysfs(self):
+        """Create a real SCSTSysfs instance"""
+        return SCSTSysfs()
+
+    @pytest.fixture
+    def luns_dir(self, tmp_path):
+        """Create a luns/ directory with two LUNs, a mgmt file and an attribute"""
+        luns = tmp_path / "luns"
+        luns.mkdir()
+        (luns / "0").mkdir()
+        (luns / "1").mkdir()
+        (luns / "mgmt").write_text("")
+        (luns / "parameters").write_text("")
+        return luns
+
+    def test_list_subdirectories(self, sysfs, luns_dir):
+        """
+        Test list_subdirectories returns only entity directories
+
+        This test verifies that:
+        1. Subdirectories are returned by name
+        2. Attribute files and the mgmt interface are filtered out
+        """
+        assert sorted(sysfs.list_subdirectories(str(luns_dir))) == ["0", "1"]
+
+    def test_list_subdirectories_follows_symlinks(self, sysfs, tmp_path):
+        """
+        Test list_subdirectories treats symlinked entities as directories
+
+        SCST handler directories link to devices, so symlinks to directories
+        must be reported just like os.path.isdir() would.
+        """
+        (tmp_path / "devices" / "disk1").mkdir(parents=True)
+        handler = tmp_path / "vdisk_fileio"
+        handler.mkdir()
+        (handler / "disk1").symlink_to(tmp_path / "devices" / "disk1")
+
+        assert sysfs.list_subdirectories(str(handler)) == ["disk1"]
+
+    def test_list_subdirectories_include_mgmt(self, sysfs, tmp_path):
+        """Test a mgmt directory is only reported when exclude_mgmt is False"""
+        (tmp_path / "mgmt").mkdir()
+
+        assert sysfs.list_subdirectories(str(tmp_path)) == []
+        assert sysfs.list_subdirectories(str(tmp_path), exclude_mgmt=False) == [
+            "mgmt"
+        ]
+
+    def test_list_subdirectories_missing_path(self, sysfs, tmp_path):
+        """Test a missing directory yields an empty list instead of raising"""
+        assert sysfs.list_subdirectories(str(tmp_path / "missing")) == []
+
+    def test_list_files(self, sysfs, tmp_path):
+        """
+        Test list_files returns only regular files other than mgmt
+
+        SCST lists group initiators as files next to the mgmt interface.
+        """
+        (tmp_path / "iqn.example:client1").write_text("")
+        (tmp_path / "mgmt").write_text("")
+        (tmp_path / "subdir").mkdir()
+
+        assert sysfs.list_files(str(tmp_path)) == ["iqn.example:client1"]
+        assert sysfs.list_files(str(tmp_path / "missing")) == []
+
+    def test_read_attribute_variants(self, sysfs, tmp_path):
+        """
+        Test read_attribute_variants collects the base and numbered variants
+
+        This test verifies that:
+        1. The base attribute and consecutive numbered variants are read
+        2. Only the first line is returned (the SCST '[key]' marker is dropped)
+        3. Empty variants are skipped and discovery stops at the first gap
+        """
+        (tmp_path / "IncomingUser").write_text("user1 secret1\n[key]\n")
+        (tmp_path / "IncomingUser1").write_text("\n")
+        (tmp_path / "IncomingUser2").write_text("user2 secret2\n[key]\n")
+        (tmp_path / "IncomingUser4").write_text("user4 secret4\n[key]\n")
+
+        assert sysfs.read_attribute_variants(str(tmp_path), "IncomingUser") == [
+            ("IncomingUser", "user1 secret1"),
+            ("IncomingUser2", "user2 secret2"),
+        ]
+
+    def test_read_attribute_variants_numbered_only(self, sysfs, tmp_path):
+        """Test numbered variants are still found when the base attribute is absent"""
+        (tmp_path / "IncomingUser1").write_text("user1 secret1\n[key]\n")
+
+        assert sysfs.read_attribute_variants(str(tmp_path), "IncomingUser") == [
+            ("IncomingUser1", "user1 secret1"),
+        ]
+
+    def test_read_attribute_variants_missing_dir(self, sysfs, tmp_path):
+        """Test a missing entity directory yields no variants"""
+        assert (
+            sysfs.read_attribute_variants(str(tmp_path / "missing"), "IncomingUser")
+            == []
+        )
+
+    def test_read_many(self, sysfs, tmp_path):
+        """
+        Test read_many reads a set of attributes from one entity directory
+
+        This test verifies that:
+        1. Each readable attribute is returned without the '[key]' marker
+        2. Missing names and subdirectories are left out instead of raising
+        3. A missing entity directory yields an empty result
+        """
+        (tmp_path / "filename").write_text("/tmp/disk1.img\n[key]\n")
+        (tmp_path / "read_only").write_text("0\n")
+        (tmp_path / "exported").mkdir()
+
+        assert sysfs.read_many(
+            str(tmp_path), ["filename", "read_only", "exported", "missing"]
+        ) == {"filename": "/tmp/disk1.img", "read_only": "0"}
+        assert sysfs.read_many(str(tmp_path / "missing"), ["filename"]) == {}
+
+    def test_read_sysfs_attribute_fast(self, sysfs, tmp_path):
+        """
+        Test read_sysfs_attribute_fast matches read_sysfs_attribute
+
+        This test verifies that:
+        1. Only the value line is returned (the SCST '[key]' marker is dropped)
+        2. Values without a trailing newline are returned unchanged
+        3. A missing attribute raises SCSTError
+        """
+        keyed = tmp_path / "enabled"
+        keyed.write_text("1\n[key]\n")
+        plain = tmp_path / "hw_target"
+        plain.write_text("1")
+
+        assert sysfs.read_sysfs_attribute_fast(str(keyed)) == "1"
+        assert sysfs.read_sysfs_attribute_fast(str(keyed)) == (
+            sysfs.read_sysfs_attribute(str(keyed))
+        )
+        assert sysfs.read_sysfs_attribute_fast(str(plain)) == "1"
+        with pytest.raises(SCSTError):
+            sysfs.read_sysfs_attribute_fast(str(tmp_path / "missing"))
+
+    def test_read_sysfs_attribute_errors(self, sysfs, tmp_path):
+        """
+        Test read_sysfs_attribute reports unreadable paths as SCSTError
+
+        This test verifies that:
+        1. A missing attribute raises SCSTError from the open itself
+        2. A directory (e.g., a LUN entry) raises SCSTError instead of OSError
+        """
+        (tmp_path / "luns").mkdir()
+
+        with pytest.raises(SCSTError, match="Error reading from"):
+            sysfs.read_sysfs_attribute(str(tmp_path / "missing"))
+        with pytest.raises(SCSTError, match="Error reading from"):
+            sysfs.read_sysfs_attribute(str(tmp_path / "luns"))
+
+    def test_read_sysfs_attribute_fast_dir_fd(self, sysfs, tmp_path):
+        """
+        Test read_sysfs_attribute_fast reads relative to an open directory
+
+        This test verifies that:
+        1. open_directory() returns an fd usable as dir_fd
+        2. Attribute names are resolved relative to that directory
+        3. A missing relative attribute raises SCSTError
+        """
+        (tmp_path / "link_local").write_text("1\n[key]\n")
+
+        dir_fd = sysfs.open_directory(str(tmp_path))
+        try:
+            assert sysfs.read_sysfs_attribute_fast("link_local", dir_fd=dir_fd) == "1"
+            with pytest.raises(SCSTError):
+                sysfs.read_sysfs_attribute_fast("missing", dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def test_write_sysfs_attribute_fast_with_dir_fd(self, sysfs, tmp_path):
+        """
+        Test write_sysfs_attribute_fast writes an attribute relative to a directory fd
+
+        This test verifies that:
+        1. A name relative to an open directory fd is written through openat()
+        2. A missing attribute raises SCSTError instead of being created
+        """
+        (tmp_path / "link_local").write_text("0")
+
+        dir_fd = sysfs.open_directory(str(tmp_path))
+        try:
+            sysfs.write_sysfs_attribute_fast("link_local", "1", dir_fd=dir_fd)
+            with pytest.raises(SCSTError):
+                sysfs.write_sysfs_attribute_fast("missing", "1", dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+
+        assert (tmp_path / "link_local").read_text() == "1"
+        assert not (tmp_path / "missing").exists()
+
+    def test_write_sysfs_batch(self, sysfs, tmp_path):
+        """
+        Test write_sysfs_batch writes each command separately on one fd
+
+        This test verifies that:
+        1. Every command is written, in order, with its own write()
+        2. No failures are reported when every write succeeds
+        3. A file that cannot be opened raises SCSTError
+        """
+        mgmt = tmp_path / "mgmt"
+        mgmt.write_text("")
+        sysfs.SCST_QUEUE_RES = str(tmp_path / "no_result_file")
+
+        with patch("os.write", wraps=os.write) as mock_write:
+            failures = sysfs.write_sysfs_batch(str(mgmt), ["add a 0", "add b 1"])
+
+        assert failures == []
+        assert [c.args[1] for c in mock_write.call_args_list] == [
+            b"add a 0",
+            b"add b 1",
+        ]
+        assert mgmt.read_text() == "add a 0add b 1"
+        with pytest.raises(SCSTError):
+            sysfs.write_sysfs_batch(str(tmp_path / "missing"), ["add a 0"])
+
+    def test_mgmt_operation_deferred_messages(self, sysfs, caplog):
+        """
+        Test mgmt_operation formats its messages from %-style arguments
+
+        This test verifies that:
+        1. The success message is logged with its arguments applied
+        2. The failure message is formatted before being prefixed to the error
+        3. Messages without arguments are logged unchanged
+        """
+        sysfs.write_sysfs = lambda path, data: True
+        with caplog.at_level("DEBUG", logger="scstadmin.sysfs"):
+            assert sysfs.mgmt_operation(
+                "mgmt", "add", "iqn.a", "Added %s to %s", "Failed %s", "iqn.a", "g1"
+            )
+            assert sysfs.mgmt_operation("mgmt", "add", "x", "Added 100%", "Failed")
+        assert [r.getMessage() for r in caplog.records] == [
+            "Added iqn.a to g1",
+            "Added 100%",
+        ]
+
+        caplog.clear()
+
+        def fail(path, data):
+            raise SCSTError("busy")
+
+        sysfs.write_sysfs = fail
+        assert not sysfs.mgmt_operation(
+            "mgmt", "del", "iqn.a", "Removed %s", "Failed to remove %s", "iqn.a"
+        )
+        assert caplog.records[-1].getMessage() == "Failed to remove iqn.a: busy"
+
+
+@pytest.mark.parametrize("names", [[], ["a"], ["a", "b", "c"]])
+def test_map_reads(names):
+    """
+    Test map_reads maps every name to its read result in order
+
+    This test verifies that:
+    1. Each name is read exactly once, serially or on the pool
+    2. The result keeps the order of the given names
+    """
+    # Arrange: A read that records its calls
+    seen = []
+
+    def read(name):
+        seen.append(name)
+        return name.upper()
+
+    # Act: Read all names
+    result = map_reads(read, names)
+
+    # Assert: One read per name, results in input order
+    assert list(result.items()) == [(name, name.upper()) for name in names]
+    assert sorted(seen) == names
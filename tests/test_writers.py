@@ -5,31 +5,30 @@ This module provides comprehensive tests for the specialized writer classes
 that handle SCST configuration application.
 """
 
+import os
+import time
 import pytest
-from unittest.mock import Mock, call, patch
+from unittest.mock import ANY, Mock, call, patch
 import logging
 
 from scstadmin.writers.device_writer import DeviceWriter
-from scstadmin.writers.target_writer import TargetWriter
+from scstadmin.writers.target_writer import GroupSnapshot, TargetSnapshot, TargetWriter
 from scstadmin.writers.group_writer import GroupWriter
+from scstadmin.readers.target_reader import parse_lun_mgmt_content
+from scstadmin.writers.utils import (
+    attrs_config_differs,
+    snapshot_driver_tree,
+    unescape_initiator,
+)
 from scstadmin.sysfs import SCSTSysfs
 from scstadmin.exceptions import SCSTError
-from scstadmin.config import ConfigAction
+from scstadmin.constants import SCSTConstants
+from scstadmin.config import ConfigAction, InitiatorGroupConfig, LunConfig
 
 
 class TestDeviceWriter:
     """Test cases for DeviceWriter class"""
 
-    @pytest.fixture
-    def mock_sysfs(self):
-        """Create a mock SCSTSysfs instance for testing"""
-        mock = Mock(spec=SCSTSysfs)
-        # Set up common sysfs path constants that writers expect
-        mock.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
-        mock.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-        mock.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        return mock
-
     @pytest.fixture
     def mock_config_reader(self):
         """Create a mock configuration reader for testing"""
@@ -190,21 +189,21 @@ class TestDeviceWriter:
         This test verifies that:
         1. Correct sysfs path is constructed for device detection
         2. Method returns True when device path exists
-        3. Uses entity_exists utility function for path checking
+        3. Uses entity_exists utility function (access F_OK) for path checking
         """
         # Arrange: Set up test data
         handler = "vdisk_fileio"
         device_name = "test_disk"
 
         # Mock filesystem operation to return True (device exists)
-        with patch("os.path.exists", return_value=True) as mock_exists:
+        with patch("os.access", return_value=True) as mock_access:
             # Act: Call the method under test
             result = device_writer.device_exists(handler, device_name)
 
             # Assert: Verify result and proper path construction
             assert result is True
-            mock_exists.assert_called_once_with(
-                "/sys/kernel/scst_tgt/handlers/vdisk_fileio/test_disk"
+            mock_access.assert_called_once_with(
+                "/sys/kernel/scst_tgt/handlers/vdisk_fileio/test_disk", os.F_OK
             )
 
     def test_device_exists_false(self, device_writer, mock_sysfs):
@@ -220,14 +219,14 @@ class TestDeviceWriter:
         device_name = "nonexistent_disk"
 
         # Mock filesystem operation to return False (device doesn't exist)
-        with patch("os.path.exists", return_value=False) as mock_exists:
+        with patch("os.access", return_value=False) as mock_access:
             # Act: Call the method under test
             result = device_writer.device_exists(handler, device_name)
 
             # Assert: Verify result and proper path construction
             assert result is False
-            mock_exists.assert_called_once_with(
-                "/sys/kernel/scst_tgt/handlers/dev_disk/nonexistent_disk"
+            mock_access.assert_called_once_with(
+                "/sys/kernel/scst_tgt/handlers/dev_disk/nonexistent_disk", os.F_OK
             )
 
     def test_remove_device_success(self, device_writer, mock_sysfs, mock_logger):
@@ -774,6 +773,38 @@ class TestDeviceWriter:
             handler, device_name, expected_attrs_to_check
         )
 
+    def test_determine_device_action_uses_snapshot_attrs(
+        self, device_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test determine_device_action compares against pre-read attributes
+
+        This test verifies that:
+        1. Attributes passed from the bulk snapshot are used for the comparison
+        2. The config reader is not asked to read the device again
+        """
+        # Arrange: Set up a device whose snapshot differs in a post-creation attr
+        device_config = Mock()
+        device_config._CREATION_PARAMS = {"filename"}
+        creation_params = {"filename": "/dev/sda"}
+        post_creation_attrs = {"read_only": "1"}
+        snapshot_attrs = {"filename": "/dev/sda", "read_only": "0"}
+        mock_sysfs.read_sysfs.side_effect = SCSTError("File not found")
+
+        # Act: Call the method under test with the snapshot
+        result = device_writer.determine_device_action(
+            "vdisk_fileio",
+            "disk1",
+            device_config,
+            creation_params,
+            post_creation_attrs,
+            existing_device_attrs=snapshot_attrs,
+        )
+
+        # Assert: The snapshot drove the decision without another sysfs read
+        assert result == ConfigAction.UPDATE
+        mock_config_reader._get_current_device_attrs.assert_not_called()
+
     def test_apply_config_devices_comprehensive_workflow(
         self, device_writer, mock_sysfs, mock_config_reader, mock_logger
     ):
@@ -800,6 +831,7 @@ class TestDeviceWriter:
         # Configure device configurations
         for device_name, device_config in config.devices.items():
             device_config.handler_type = "vdisk_fileio"
+            device_config._CREATION_PARAMS = {"filename", "size_mb"}
             device_config.creation_attributes = {
                 "filename": f"/dev/{device_name}",
                 "size_mb": "1024",
@@ -813,9 +845,21 @@ class TestDeviceWriter:
         def mock_device_exists(handler, device_name):
             return device_name != "new_device"
 
+        # Mock the up-front attribute snapshot of every configured device
+        snapshot = {
+            device_name: {"filename": f"/dev/{device_name}"}
+            for device_name in config.devices
+        }
+        mock_config_reader._bulk_snapshot_devices.return_value = snapshot
+
         # Mock device action determination
         def mock_determine_device_action(
-            handler, device_name, device_config, creation_params, post_attrs
+            handler,
+            device_name,
+            device_config,
+            creation_params,
+            post_attrs,
+            existing_device_attrs=None,
         ):
             if device_name == "skip_device":
                 return ConfigAction.SKIP
@@ -837,6 +881,16 @@ class TestDeviceWriter:
         # Act: Call the method under test
         device_writer.apply_config_devices(config)
 
+        # Assert: Verify every device was snapshotted once, with all its
+        # creation parameters and its post-creation attributes
+        expected_snapshot_attrs = {"filename", "size_mb", "read_only", "rotational"}
+        mock_config_reader._bulk_snapshot_devices.assert_called_once_with(
+            {
+                device_name: ("vdisk_fileio", expected_snapshot_attrs)
+                for device_name in config.devices
+            }
+        )
+
         # Assert: Verify existence checks for all devices
         expected_exists_calls = [
             call("vdisk_fileio", "skip_device"),
@@ -856,6 +910,7 @@ class TestDeviceWriter:
                 config.devices["skip_device"],
                 config.devices["skip_device"].creation_attributes,
                 config.devices["skip_device"].post_creation_attributes,
+                existing_device_attrs=snapshot["skip_device"],
             ),
             call(
                 "vdisk_fileio",
@@ -863,6 +918,7 @@ class TestDeviceWriter:
                 config.devices["update_device"],
                 config.devices["update_device"].creation_attributes,
                 config.devices["update_device"].post_creation_attributes,
+                existing_device_attrs=snapshot["update_device"],
             ),
             call(
                 "vdisk_fileio",
@@ -870,6 +926,7 @@ class TestDeviceWriter:
                 config.devices["recreate_device"],
                 config.devices["recreate_device"].creation_attributes,
                 config.devices["recreate_device"].post_creation_attributes,
+                existing_device_attrs=snapshot["recreate_device"],
             ),
         ]
         device_writer.determine_device_action.assert_has_calls(
@@ -930,18 +987,6 @@ class TestDeviceWriter:
 class TestTargetWriter:
     """Test cases for TargetWriter class"""
 
-    @pytest.fixture
-    def mock_sysfs(self):
-        """Create a mock SCSTSysfs instance for testing"""
-        mock = Mock(spec=SCSTSysfs)
-        # Set up common sysfs path constants that writers expect
-        mock.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
-        mock.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-        mock.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        mock.MGMT_INTERFACE = "mgmt"
-        mock.ENABLED_ATTR = "enabled"
-        return mock
-
     @pytest.fixture
     def mock_config_reader(self):
         """Create a mock configuration reader for testing"""
@@ -951,6 +996,9 @@ class TestTargetWriter:
             "target_attributes": {"IncomingUser", "OutgoingUser"},
             "driver_attributes": {"MaxSessions"},
         }
+        # Unreadable luns/mgmt and initiators/mgmt: no optional commands
+        mock._get_lun_mgmt_info.return_value = None
+        mock._get_initiators_mgmt_commands.return_value = None
         return mock
 
     @pytest.fixture
@@ -1258,6 +1306,7 @@ class TestTargetWriter:
             "mgmt",
         ]  # Groups with mgmt
         mock_sysfs.write_sysfs.return_value = None
+        mock_sysfs.write_sysfs_batch.return_value = []
 
         # Mock the internal helper methods to return success
         with (
@@ -1306,21 +1355,11 @@ class TestTargetWriter:
                     "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups/group1/luns/mgmt",
                     "clear",
                 ),
-                # Remove group1
-                call(
-                    "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups/mgmt",
-                    "del group1",
-                ),
                 # Clear group2 LUNs
                 call(
                     "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups/group2/luns/mgmt",
                     "clear",
                 ),
-                # Remove group2
-                call(
-                    "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups/mgmt",
-                    "del group2",
-                ),
                 # Remove target itself
                 call(
                     "/sys/kernel/scst_tgt/targets/iscsi/mgmt",
@@ -1328,13 +1367,92 @@ class TestTargetWriter:
                 ),
             ]
             mock_sysfs.write_sysfs.assert_has_calls(expected_write_calls)
-            assert mock_sysfs.write_sysfs.call_count == 6
+            assert mock_sysfs.write_sysfs.call_count == 4
+
+            # Assert: Both emptied groups were deleted in one batch
+            mock_sysfs.write_sysfs_batch.assert_called_once_with(
+                "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups/mgmt",
+                ["del group1", "del group2"],
+            )
+            assert mock_sysfs.method_calls.index(
+                call.write_sysfs_batch(ANY, ANY)
+            ) < mock_sysfs.method_calls.index(
+                call.write_sysfs(
+                    "/sys/kernel/scst_tgt/targets/iscsi/mgmt",
+                    "del_target iqn.2023-01.example.com:test",
+                )
+            )
 
             # Assert: Verify directory listing for groups
             mock_sysfs.list_directory.assert_called_once_with(
                 "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups"
             )
 
+    def test_remove_obsolete_luns_and_groups_batched(
+        self, target_writer, mock_sysfs, mock_logger
+    ):
+        """
+        Test obsolete LUNs and groups are deleted with one batch per mgmt file
+
+        This test verifies that:
+        1. All obsolete LUN "del" commands go to luns/mgmt in a single batch
+        2. Obsolete groups are emptied first, then deleted in a single batch
+        3. A failed command in a batch is logged without aborting the removal
+        """
+        # Arrange: LUNs 1 and 2 and group old are gone from the new config
+        base = "/sys/kernel/scst_tgt/targets/iscsi/tgt"
+        current = Mock(
+            luns={"0": Mock(), "1": Mock(), "2": Mock()},
+            groups={"keep": Mock(), "old": Mock()},
+        )
+        new = Mock(luns={"0": Mock()}, groups={"keep": Mock()})
+        mock_sysfs.valid_path.return_value = True
+        mock_sysfs.write_sysfs_batch.side_effect = [
+            [("del 2", SCSTError("busy"))],
+            [],
+        ]
+
+        # Act: Remove obsolete LUNs, then obsolete groups
+        target_writer._remove_obsolete_luns("iscsi", "tgt", current, new)
+        target_writer._remove_obsolete_groups("iscsi", "tgt", current, new)
+
+        # Assert: One batch per mgmt file, group emptied before deletion
+        luns_call, groups_call = mock_sysfs.write_sysfs_batch.call_args_list
+        assert luns_call.args[0] == f"{base}/luns/mgmt"
+        assert sorted(luns_call.args[1]) == ["del 1", "del 2"]
+        assert groups_call == call(f"{base}/ini_groups/mgmt", ["del old"])
+        mock_sysfs.write_sysfs.assert_called_once_with(
+            f"{base}/ini_groups/old/luns/mgmt", "clear"
+        )
+        mock_logger.warning.assert_called_once()
+
+    def test_remove_obsolete_driver_attributes(self, target_writer):
+        """
+        Test _remove_obsolete_driver_attributes removes only dropped attributes
+
+        This test verifies that:
+        1. Attributes missing from the new driver config are removed
+        2. Attributes kept in the new config are left alone
+        3. Drivers absent from the new config are skipped entirely
+        """
+        # Arrange: iscsi drops link_local, srpt disappears from the config
+        current = Mock(
+            drivers={
+                "iscsi": Mock(attributes={"enabled": "1", "link_local": "1"}),
+                "srpt": Mock(attributes={"enabled": "1"}),
+            }
+        )
+        new = Mock(drivers={"iscsi": Mock(attributes={"enabled": "1"})})
+        target_writer._remove_driver_attribute = Mock()
+
+        # Act: Call the method under test
+        target_writer._remove_obsolete_driver_attributes(current, new)
+
+        # Assert: Only iscsi.link_local was removed
+        target_writer._remove_driver_attribute.assert_called_once_with(
+            "iscsi", "link_local"
+        )
+
     def test_remove_target_sysfs_error_handling(
         self, target_writer, mock_sysfs, mock_config_reader, mock_logger
     ):
@@ -1498,6 +1616,8 @@ class TestTargetWriter:
 
         # Mock helper methods with specific return values
         target_writer._target_exists = Mock(side_effect=mock_target_exists)
+        snapshot = TargetSnapshot()
+        target_writer._snapshot_target = Mock(return_value=snapshot)
         target_writer._target_config_differs = Mock(
             return_value=True
         )  # Attributes differ
@@ -1555,9 +1675,19 @@ class TestTargetWriter:
         # Assert: Verify existing target updates
         # Attributes should be updated (they differ)
         target_writer.update_target_attributes.assert_called_once()
+        # Assignment checks share one snapshot of the existing target
+        target_writer._snapshot_target.assert_called_once_with(
+            "iscsi", "existing_target"
+        )
+        target_writer._direct_lun_assignments_differ.assert_called_once_with(
+            "iscsi", "existing_target", existing_target, snapshot=snapshot
+        )
+        target_writer._group_assignments_differ.assert_called_once_with(
+            "iscsi", "existing_target", existing_target, snapshot=snapshot
+        )
         # Groups should be updated (they differ)
         target_writer._update_target_groups.assert_called_once_with(
-            "iscsi", "existing_target", existing_target
+            "iscsi", "existing_target", existing_target, snapshot=snapshot
         )
 
         # Assert: Verify new target creation
@@ -1599,21 +1729,21 @@ class TestTargetWriter:
         This test verifies that:
         1. Correct sysfs path is constructed for target detection
         2. Method returns True when target directory exists
-        3. Uses entity_exists utility which checks os.path.exists
+        3. Uses entity_exists utility which checks os.access(F_OK)
         """
         # Arrange: Set up test data
         driver = "iscsi"
         target_name = "iqn.2023-01.example.com:test"
 
         # Mock filesystem operation to return True (target exists)
-        with patch("os.path.exists", return_value=True) as mock_exists:
+        with patch("os.access", return_value=True) as mock_access:
             # Act: Call the method under test
             result = target_writer._target_exists(driver, target_name)
 
             # Assert: Verify result and proper path construction
             assert result is True
-            mock_exists.assert_called_once_with(
-                "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test"
+            mock_access.assert_called_once_with(
+                "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test", os.F_OK
             )
 
     def test_target_exists_false(self, target_writer, mock_sysfs):
@@ -1630,14 +1760,14 @@ class TestTargetWriter:
         target_name = "20:00:00:25:B5:00:00:00"
 
         # Mock filesystem operation to return False (target doesn't exist)
-        with patch("os.path.exists", return_value=False) as mock_exists:
+        with patch("os.access", return_value=False) as mock_access:
             # Act: Call the method under test
             result = target_writer._target_exists(driver, target_name)
 
             # Assert: Verify result and proper path construction
             assert result is False
-            mock_exists.assert_called_once_with(
-                "/sys/kernel/scst_tgt/targets/fc/20:00:00:25:B5:00:00:00"
+            mock_access.assert_called_once_with(
+                "/sys/kernel/scst_tgt/targets/fc/20:00:00:25:B5:00:00:00", os.F_OK
             )
 
     def test_group_config_matches_true(self, target_writer, mock_sysfs):
@@ -1645,7 +1775,7 @@ class TestTargetWriter:
         Test _group_config_matches returns True when group configuration matches
 
         This test verifies that:
-        1. Group existence checking via os.path.exists
+        1. Group existence checking via os.access(F_OK)
         2. Initiator list comparison with backslash normalization
         3. LUN assignment comparison (LUN numbers, not device mappings)
         4. Proper sysfs path construction for group components
@@ -1655,7 +1785,7 @@ class TestTargetWriter:
         driver = "iscsi"
         target = "iqn.2023-01.example.com:test"
         group_name = "windows_clients"
-        group_config = Mock()
+        group_config = InitiatorGroupConfig(name="clients")
         group_config.initiators = [
             "iqn.1991-05.com.microsoft:client1",
             "iqn.1991-05.com.microsoft:client2",
@@ -1666,35 +1796,23 @@ class TestTargetWriter:
         initiators_path = f"{group_path}/initiators"
         luns_path = f"{group_path}/luns"
 
-        # Mock filesystem operations
-        def mock_exists(path):
-            return path in [group_path, initiators_path, luns_path]
-
-        def mock_listdir(path):
-            if path == initiators_path:
-                return [
-                    "iqn.1991-05.com.microsoft:client1",
-                    "iqn.1991-05.com.microsoft:client2",
-                    "mgmt",
-                ]
-            elif path == luns_path:
-                return ["0", "1", "mgmt"]  # LUN directories
-            return []
-
-        def mock_isfile(path):
-            # Initiators are files, LUNs are directories
-            return "initiators/" in path and not path.endswith("/mgmt")
+        # Mock filesystem operations (mgmt already filtered by the sysfs helpers)
+        def mock_access(path, mode):
+            return path == group_path
 
-        def mock_isdir(path):
-            # LUN entries are directories, mgmt is excluded
-            return "luns/" in path and not path.endswith("/mgmt")
+        mock_sysfs.list_files.side_effect = lambda path: (
+            [
+                "iqn.1991-05.com.microsoft:client1",
+                "iqn.1991-05.com.microsoft:client2",
+            ]
+            if path == initiators_path
+            else []
+        )
+        mock_sysfs.list_subdirectories.side_effect = lambda path: (
+            ["0", "1"] if path == luns_path else []
+        )
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isfile", side_effect=mock_isfile),
-            patch("os.path.isdir", side_effect=mock_isdir),
-        ):
+        with patch("os.access", side_effect=mock_access):
             # Act: Call the method under test
             result = target_writer._group_config_matches(
                 driver, target, group_name, group_config
@@ -1730,26 +1848,19 @@ class TestTargetWriter:
         initiators_path = f"{group_path}/initiators"
 
         # Mock filesystem operations - different initiators in sysfs
-        def mock_exists(path):
-            return path in [group_path, initiators_path]
-
-        def mock_listdir(path):
-            if path == initiators_path:
-                return [
-                    "iqn.1993-08.org.debian:client1",
-                    "iqn.1993-08.org.debian:different_client",
-                    "mgmt",
-                ]
-            return []
+        def mock_access(path, mode):
+            return path == group_path
 
-        def mock_isfile(path):
-            return "initiators/" in path and not path.endswith("/mgmt")
+        mock_sysfs.list_files.side_effect = lambda path: (
+            [
+                "iqn.1993-08.org.debian:client1",
+                "iqn.1993-08.org.debian:different_client",
+            ]
+            if path == initiators_path
+            else []
+        )
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isfile", side_effect=mock_isfile),
-        ):
+        with patch("os.access", side_effect=mock_access):
             # Act: Call the method under test
             result = target_writer._group_config_matches(
                 driver, target, group_name, group_config
@@ -1758,6 +1869,9 @@ class TestTargetWriter:
         # Assert: Verify method returns False for differing initiators
         assert result is False
 
+        # Assert: LUNs were never scanned once initiators differed
+        mock_sysfs.list_subdirectories.assert_not_called()
+
     def test_group_config_matches_false_luns_differ(self, target_writer, mock_sysfs):
         """
         Test _group_config_matches returns False when LUN assignments differ
@@ -1781,32 +1895,19 @@ class TestTargetWriter:
         luns_path = f"{group_path}/luns"
 
         # Mock filesystem operations - matching initiators, different LUNs
-        def mock_exists(path):
-            return path in [group_path, initiators_path, luns_path]
+        def mock_access(path, mode):
+            return path == group_path
 
-        def mock_listdir(path):
-            if path == initiators_path:
-                return ["iqn.example:client1", "mgmt"]  # Matching initiators
-            elif path == luns_path:
-                return [
-                    "0",
-                    "2",
-                    "mgmt",
-                ]  # Current LUNs: 0, 2 (differs from desired 0, 1)
-            return []
-
-        def mock_isfile(path):
-            return "initiators/" in path and not path.endswith("/mgmt")
+        mock_sysfs.list_files.side_effect = lambda path: (
+            ["iqn.example:client1"] if path == initiators_path else []
+        )
 
-        def mock_isdir(path):
-            return "luns/" in path and not path.endswith("/mgmt")
+        # Current LUNs: 0, 2 (differs from desired 0, 1)
+        mock_sysfs.list_subdirectories.side_effect = lambda path: (
+            ["0", "2"] if path == luns_path else []
+        )
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isfile", side_effect=mock_isfile),
-            patch("os.path.isdir", side_effect=mock_isdir),
-        ):
+        with patch("os.access", side_effect=mock_access):
             # Act: Call the method under test
             result = target_writer._group_config_matches(
                 driver, target, group_name, group_config
@@ -1824,7 +1925,7 @@ class TestTargetWriter:
         This test verifies that:
         1. Current group membership is read from sysfs with mgmt filtering
         2. Group membership comparison (current vs desired group names)
-        3. Individual group configuration checking via _group_config_matches
+        3. Individual group configuration checking via _group_snapshot_matches
         4. Method returns False when all groups exist with matching configurations
         5. Proper delegation to helper methods
         """
@@ -1839,199 +1940,846 @@ class TestTargetWriter:
         )
 
         # Mock filesystem operations
-        def mock_exists(path):
-            return path == groups_path
-
-        def mock_listdir(path):
-            if path == groups_path:
-                return [
-                    "windows_clients",
-                    "linux_clients",
-                    "mgmt",
-                ]  # Current groups match desired
-            return []
-
-        def mock_isdir(path):
-            # All group entries are directories except mgmt
-            return not path.endswith("/mgmt")
+        mock_sysfs.list_subdirectories.side_effect = lambda path: (
+            ["windows_clients", "linux_clients"] if path == groups_path else []
+        )  # Current groups match desired
+        mock_sysfs.list_files.return_value = []
 
         # Mock helper methods to return matching configurations
-        target_writer._group_exists = Mock(return_value=True)
-        target_writer._group_config_matches = Mock(
+        target_writer._group_snapshot_matches = Mock(
             return_value=True
         )  # All groups match
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isdir", side_effect=mock_isdir),
-        ):
-            # Act: Call the method under test
-            result = target_writer._group_assignments_differ(
-                driver, target, target_config
-            )
+        # Act: Call the method under test
+        result = target_writer._group_assignments_differ(
+            driver, target, target_config
+        )
 
         # Assert: Verify method returns False for matching assignments
         assert result is False
 
-        # Assert: Verify group existence and config matching checks
-        expected_exists_calls = [
-            call(driver, target, "windows_clients"),
-            call(driver, target, "linux_clients"),
-        ]
-        target_writer._group_exists.assert_has_calls(
-            expected_exists_calls, any_order=True
-        )
-
+        # Assert: Every group snapshot is compared with its config
         expected_config_calls = [
-            call(
-                driver,
-                target,
-                "windows_clients",
-                target_config.groups["windows_clients"],
-            ),
-            call(
-                driver, target, "linux_clients", target_config.groups["linux_clients"]
-            ),
+            call(GroupSnapshot(), target_config.groups["windows_clients"]),
+            call(GroupSnapshot(), target_config.groups["linux_clients"]),
         ]
-        target_writer._group_config_matches.assert_has_calls(
+        target_writer._group_snapshot_matches.assert_has_calls(
             expected_config_calls, any_order=True
         )
 
-    def test_group_assignments_differ_true_group_membership_differs(
-        self, target_writer, mock_sysfs
-    ):
+    def test_remove_target_mgmt_attribute(self, target_writer, mock_sysfs):
         """
-        Test _group_assignments_differ returns True when group membership differs
+        Test _remove_target_mgmt_attribute deletes every discovered variant
 
         This test verifies that:
-        1. Group membership differences are detected (current vs desired group sets)
-        2. Method returns True early when group membership differs
-        3. Individual group config checking is skipped when membership differs
-        4. Proper sysfs path construction and directory filtering
+        1. Variants are discovered with one read_attribute_variants call
+        2. Each variant is removed via del_target_attribute on the driver mgmt
+        3. A failing removal does not stop the remaining removals
         """
-        # Arrange: Set up test data with different group membership
-        driver = "iscsi"
-        target = "iqn.2023-01.example.com:test"
-        target_config = Mock()
-        target_config.groups = {
-            "windows_clients": Mock(),
-            "mac_clients": Mock(),  # Desired: windows_clients, mac_clients
-        }
+        # Arrange: Two IncomingUser variants, the first removal fails
+        mock_sysfs.read_attribute_variants.return_value = [
+            ("IncomingUser", "user1 secret1"),
+            ("IncomingUser1", "user2 secret2"),
+        ]
+        mock_sysfs.write_sysfs.side_effect = [SCSTError("gone"), None]
 
-        groups_path = (
-            "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups"
+        # Act: Call the method under test
+        target_writer._remove_target_mgmt_attribute(
+            "iscsi", "iqn.2023-01.example.com:test", "IncomingUser"
         )
 
-        # Mock filesystem operations - different current groups
-        def mock_exists(path):
-            return path == groups_path
-
-        def mock_listdir(path):
-            if path == groups_path:
-                return [
-                    "windows_clients",
-                    "linux_clients",
-                    "mgmt",
-                ]  # Current: windows_clients, linux_clients
-            return []
+        # Assert: Variants were read from the target directory
+        mock_sysfs.read_attribute_variants.assert_called_once_with(
+            "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test",
+            "IncomingUser",
+        )
 
-        def mock_isdir(path):
-            return not path.endswith("/mgmt")
+        # Assert: Both variants were removed using the base attribute name
+        driver_mgmt = "/sys/kernel/scst_tgt/targets/iscsi/mgmt"
+        mock_sysfs.write_sysfs.assert_has_calls(
+            [
+                call(
+                    driver_mgmt,
+                    "del_target_attribute iqn.2023-01.example.com:test "
+                    "IncomingUser user1 secret1",
+                    check_result=False,
+                ),
+                call(
+                    driver_mgmt,
+                    "del_target_attribute iqn.2023-01.example.com:test "
+                    "IncomingUser user2 secret2",
+                    check_result=False,
+                ),
+            ]
+        )
 
-        # Mock helper methods (should not be called due to early return)
-        target_writer._group_exists = Mock()
-        target_writer._group_config_matches = Mock()
+    def test_paths_for(self, target_writer):
+        """
+        Test _paths_for builds a target's sysfs paths once
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isdir", side_effect=mock_isdir),
-        ):
-            # Act: Call the method under test
-            result = target_writer._group_assignments_differ(
-                driver, target, target_config
-            )
+        This test verifies that:
+        1. Target, LUN and initiator group paths are derived from SCST_TARGETS
+        2. Group directories are resolved through TargetPaths.group()
+        3. Repeated lookups for the same target reuse the same TargetPaths
+        """
+        # Act: Look up the same target twice
+        paths = target_writer._paths_for("iscsi", "tgt")
+        again = target_writer._paths_for("iscsi", "tgt")
+
+        # Assert: Paths are correct and cached
+        base = "/sys/kernel/scst_tgt/targets/iscsi/tgt"
+        assert paths.target == base
+        assert paths.luns == f"{base}/luns"
+        assert paths.luns_mgmt == f"{base}/luns/mgmt"
+        assert paths.ini_groups_mgmt == f"{base}/ini_groups/mgmt"
+        assert paths.group("clients") == f"{base}/ini_groups/clients"
+        assert again is paths
+
+    def test_snapshot_target(self, target_writer, mock_sysfs):
+        """
+        Test _snapshot_target captures a target's LUN and group layout
 
-        # Assert: Verify method returns True for differing group membership
-        assert result is True
+        This test verifies that:
+        1. Direct LUNs and group LUNs are listed once and resolved to devices
+        2. Group initiators are listed from the initiators directory
+        3. LUNs without a resolvable device are kept with an empty device
+        """
+        # Arrange: One direct LUN, one group with an initiator and two LUNs
+        base = "/sys/kernel/scst_tgt/targets/iscsi/tgt"
+        dirs = {
+            f"{base}/luns": ["0"],
+            f"{base}/ini_groups": ["clients"],
+            f"{base}/ini_groups/clients/luns": ["0", "1"],
+        }
+        devices = {
+            f"{base}/luns/0": "disk1",
+            f"{base}/ini_groups/clients/luns/0": "disk2",
+            f"{base}/ini_groups/clients/luns/1": "",
+        }
+        mock_sysfs.list_subdirectories.side_effect = lambda path: dirs[path]
+        mock_sysfs.list_files.return_value = ["iqn.client"]
+        target_writer._read_lun_device_fast = Mock(side_effect=devices.__getitem__)
 
-        # Assert: Verify helper methods were not called (early return)
-        target_writer._group_exists.assert_not_called()
-        target_writer._group_config_matches.assert_not_called()
+        # Act: Call the method under test
+        snapshot = target_writer._snapshot_target("iscsi", "tgt")
+
+        # Assert: Snapshot mirrors the sysfs layout
+        assert snapshot == TargetSnapshot(
+            direct_luns={"0": "disk1"},
+            groups={
+                "clients": GroupSnapshot(
+                    initiators={"iqn.client"}, luns={"0": "disk2", "1": ""}
+                )
+            },
+        )
+        mock_sysfs.list_files.assert_called_once_with(
+            f"{base}/ini_groups/clients/initiators"
+        )
 
-    def test_group_assignments_differ_true_group_config_differs(
-        self, target_writer, mock_sysfs
-    ):
+    def test_assignment_checks_use_snapshot(self, target_writer, mock_sysfs):
         """
-        Test _group_assignments_differ returns True when group configuration differs
+        Test the assignment comparisons run against a TargetSnapshot
 
         This test verifies that:
-        1. Group membership matches but individual group config differs
-        2. Method returns True when any group configuration doesn't match
-        3. Proper delegation to _group_config_matches for detailed comparison
-        4. Early return when first differing group is found
+        1. No sysfs listing happens when a snapshot is supplied
+        2. Deviceless LUNs are ignored for LUN-to-device comparisons
+        3. Group membership compares initiators (escaping-insensitive) and LUN numbers
         """
-        # Arrange: Set up test data with matching membership but differing config
-        driver = "iscsi"
-        target = "iqn.2023-01.example.com:test"
+        # Arrange: Snapshot matching the desired configuration
+        snapshot = TargetSnapshot(
+            direct_luns={"0": "disk1", "1": ""},
+            groups={
+                "clients": GroupSnapshot(
+                    initiators={"iqn.client#1"}, luns={"0": "disk2"}
+                )
+            },
+        )
+        group_config = InitiatorGroupConfig(name="clients")
+        group_config.initiators = ["iqn.client\\#1"]
+        group_config.luns = {"0": LunConfig(lun_number="0", device="disk2")}
         target_config = Mock()
-        target_config.groups = {"storage_group": Mock(), "backup_group": Mock()}
+        target_config.luns = {"0": LunConfig(lun_number="0", device="disk1")}
+        target_config.groups = {"clients": group_config}
 
-        groups_path = (
-            "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups"
+        # Act: Run all three comparisons against the snapshot
+        direct = target_writer._direct_lun_assignments_differ(
+            "iscsi", "tgt", target_config, snapshot=snapshot
+        )
+        group_luns = target_writer._group_lun_assignments_differ(
+            "iscsi", "tgt", target_config, snapshot=snapshot
+        )
+        groups = target_writer._group_assignments_differ(
+            "iscsi", "tgt", target_config, snapshot=snapshot
+        )
+        snapshot.groups["clients"].luns["1"] = "disk3"
+        groups_after_change = target_writer._group_assignments_differ(
+            "iscsi", "tgt", target_config, snapshot=snapshot
         )
 
-        # Mock filesystem operations - matching group membership
-        def mock_exists(path):
-            return path == groups_path
+        # Assert: Everything matches until the group gains an extra LUN
+        assert (direct, group_luns, groups) == (False, False, False)
+        assert groups_after_change is True
+        mock_sysfs.list_subdirectories.assert_not_called()
+        mock_sysfs.list_files.assert_not_called()
 
-        def mock_listdir(path):
-            if path == groups_path:
-                return [
-                    "storage_group",
-                    "backup_group",
-                    "mgmt",
-                ]  # Current groups match desired
-            return []
+    def test_update_target_groups_unreadable_target(
+        self, target_writer, mock_sysfs, mock_logger
+    ):
+        """
+        Test _update_target_groups when the target layout cannot be read
 
-        def mock_isdir(path):
-            return not path.endswith("/mgmt")
+        This test verifies that:
+        1. An OSError from _snapshot_target does not escape
+        2. No group writes are attempted and a warning is logged
+        """
+        # Arrange: The target walk fails
+        target_writer._snapshot_target = Mock(side_effect=PermissionError("denied"))
+        target_config = Mock()
+        target_config.groups = {"g1": Mock()}
 
-        # Mock helper methods - first group differs
-        target_writer._group_exists = Mock(return_value=True)
+        # Act: Update groups without a snapshot
+        target_writer._update_target_groups("iscsi", "tgt", target_config)
 
-        def mock_group_config_matches(driver, target, group_name, group_config):
-            if group_name == "storage_group":
-                return False  # First group differs
-            return True  # Other groups match (but shouldn't be checked due to early return)
+        # Assert: Group phase skipped with a warning
+        mock_sysfs.write_sysfs.assert_not_called()
+        mock_logger.warning.assert_called_once()
 
-        target_writer._group_config_matches = Mock(
-            side_effect=mock_group_config_matches
+    def test_cleanup_copy_manager_duplicates(self, target_writer, mock_sysfs):
+        """
+        Test cleanup_copy_manager_duplicates removes auto-created duplicate LUNs
+
+        This test verifies that:
+        1. copy_manager_tgt LUNs are enumerated once and resolved to devices
+        2. A configured device found at a different LUN number is deleted
+        3. LUNs at their configured number and unconfigured devices are kept
+        """
+        # Arrange: disk1 configured at LUN 0 but also auto-assigned at LUN 3
+        luns_path = "/sys/kernel/scst_tgt/targets/copy_manager/copy_manager_tgt/luns"
+        target_config = Mock()
+        target_config.luns = {"0": LunConfig(lun_number="0", device="disk1")}
+        config = Mock()
+        config.drivers = {"copy_manager": Mock(targets={"copy_manager_tgt": target_config})}
+        mock_sysfs.list_subdirectories.return_value = ["0", "3", "4"]
+        current = {"0": "disk1", "3": "disk1", "4": "disk9"}
+        target_writer._read_lun_device_fast = Mock(
+            side_effect=lambda lun_dir: current[lun_dir.rsplit("/", 1)[1]]
         )
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isdir", side_effect=mock_isdir),
-        ):
-            # Act: Call the method under test
-            result = target_writer._group_assignments_differ(
-                driver, target, target_config
-            )
+        # Act: Call the method under test
+        target_writer.cleanup_copy_manager_duplicates(config)
 
-        # Assert: Verify method returns True for differing group configuration
-        assert result is True
+        # Assert: Only the duplicate LUN was deleted
+        mock_sysfs.list_subdirectories.assert_called_once_with(luns_path)
+        mock_sysfs.write_sysfs.assert_called_once_with(f"{luns_path}/mgmt", "del 3")
 
-        # Assert: Verify method should return True when any group differs
-        # Note: Due to dictionary iteration order, either group could be checked first
-        # The key is that once a differing group is found, method returns True
+    def test_apply_config_assignments_rereads_target_attrs(
+        self, target_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test apply_config_assignments reconciles live target attribute drift
+
+        This test verifies that:
+        1. Target attributes are read from sysfs on every run
+        2. A value changed out of band since the last run is written back
+        """
+        # Arrange: One existing target with no LUNs or groups, in sync at first
+        target_config = Mock(luns={}, groups={})
+        target_config.attributes = {"HeaderDigest": "None"}
+        config = Mock()
+        config.drivers = {"iscsi": Mock(targets={"tgt": target_config})}
+        target_writer._target_exists = Mock(return_value=True)
+        target_writer._snapshot_target = Mock(return_value=TargetSnapshot())
+        mock_config_reader._get_target_mgmt_info.return_value = {
+            "create_params": set(),
+            "target_attributes": set(),
+        }
+        mock_config_reader._get_current_target_attrs.return_value = {
+            "HeaderDigest": "None"
+        }
+
+        # Act: Run once in sync, then again after a live edit of the attribute
+        target_writer.apply_config_assignments(config)
+        mock_sysfs.write_sysfs.assert_not_called()
+        mock_config_reader._get_current_target_attrs.return_value = {
+            "HeaderDigest": "CRC32C"
+        }
+        target_writer.apply_config_assignments(config)
+
+        # Assert: Both runs read the attributes and the drift was reverted
+        assert mock_config_reader._get_current_target_attrs.call_count == 2
+        mock_sysfs.write_sysfs.assert_called_once_with(
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/HeaderDigest",
+            "None",
+            check_result=False,
+        )
+
+    def test_ensure_hardware_targets_enabled(self, target_writer, mock_sysfs):
+        """
+        Test ensure_hardware_targets_enabled only enables configured hardware targets
+
+        This test verifies that:
+        1. Targets are enumerated with a single list_subdirectories call
+        2. Targets not configured as enabled are never read
+        3. Targets without a readable hw_target attribute are skipped
+        4. A disabled hardware target configured as enabled gets enabled
+        """
+        # Arrange: hw1 disabled, hw2 already enabled, sw1 software, idle unconfigured
+        driver_path = "/sys/kernel/scst_tgt/targets/qla2x00t"
+        mock_sysfs.list_subdirectories.return_value = ["hw1", "hw2", "sw1", "idle"]
+        values = {
+            f"{driver_path}/hw1/hw_target": "1",
+            f"{driver_path}/hw1/enabled": "0",
+            f"{driver_path}/hw2/hw_target": "1",
+            f"{driver_path}/hw2/enabled": "1",
+        }
+
+        def read_attribute(path):
+            if path not in values:
+                raise SCSTError(f"Cannot read from {path}")
+            return values[path]
+
+        mock_sysfs.read_sysfs_attribute_fast.side_effect = read_attribute
+        driver_config = Mock()
+        driver_config.targets = {
+            name: Mock(attributes={"enabled": enabled})
+            for name, enabled in (("hw1", "1"), ("hw2", "1"), ("sw1", "1"), ("idle", "0"))
+        }
+
+        # Act: Call the method under test
+        target_writer.ensure_hardware_targets_enabled("qla2x00t", driver_config)
+
+        # Assert: Only hw1 was enabled and idle was never read
+        mock_sysfs.list_subdirectories.assert_called_once_with(driver_path)
+        mock_sysfs.write_sysfs.assert_called_once_with(
+            f"{driver_path}/hw1/enabled", "1", check_result=False
+        )
+        read_paths = [
+            c.args[0] for c in mock_sysfs.read_sysfs_attribute_fast.call_args_list
+        ]
+        assert not any("/idle/" in path for path in read_paths)
+
+    def test_apply_config_enable_targets_and_drivers(self, target_writer, mock_sysfs):
+        """
+        Test the enable passes write only entities that are not yet enabled
+
+        This test verifies that:
+        1. Only targets and drivers configured with enabled=1 are considered
+        2. Entities already reading "1" are not written
+        3. An unreadable enabled attribute is still written as a fallback
+        """
+        # Arrange: t1 disabled, t2 enabled, t3 unreadable, t4 not configured
+        base = "/sys/kernel/scst_tgt/targets/iscsi"
+        values = {f"{base}/t1/enabled": "0", f"{base}/t2/enabled": "1"}
+        values[f"{base}/enabled"] = "1"
+
+        def read_attribute(path):
+            if path not in values:
+                raise SCSTError(f"Cannot read from {path}")
+            return values[path]
+
+        mock_sysfs.read_sysfs_attribute_fast.side_effect = read_attribute
+        driver_config = Mock(attributes={"enabled": "1"})
+        driver_config.targets = {
+            name: Mock(attributes={"enabled": enabled})
+            for name, enabled in (("t1", "1"), ("t2", "1"), ("t3", "1"), ("t4", "0"))
+        }
+        config = Mock(drivers={"iscsi": driver_config})
+
+        # Act: Enable targets, then drivers
+        target_writer.apply_config_enable_targets(config)
+        target_writer.apply_config_enable_drivers(config)
+
+        # Assert: t1 and t3 written once each, the enabled driver left alone
+        assert mock_sysfs.write_sysfs.call_args_list == [
+            call(f"{base}/t1/enabled", "1", check_result=False),
+            call(f"{base}/t3/enabled", "1", check_result=False),
+        ]
+
+    def test_snapshot_driver_tree(self, tmp_path):
+        """
+        Test snapshot_driver_tree reads all driver attributes in one walk
+
+        This test verifies that:
+        1. Regular attribute files are read with the '[key]' marker dropped
+        2. Target subdirectories and the mgmt interface are left out
+        3. A missing driver directory yields an empty snapshot
+        """
+        # Arrange: iscsi driver with two attributes, mgmt and a target directory
+        sysfs = SCSTSysfs()
+        sysfs.SCST_TARGETS = str(tmp_path)
+        driver = tmp_path / "iscsi"
+        (driver / "iqn.example:tgt").mkdir(parents=True)
+        (driver / "mgmt").write_text("Usage: ...\n")
+        (driver / "link_local").write_text("0\n[key]\n")
+        (driver / "iSNSServer").write_text("\n")
+
+        # Act & Assert: Attributes only, values without the key marker
+        assert snapshot_driver_tree(sysfs, "iscsi") == {
+            "link_local": "0",
+            "iSNSServer": "",
+        }
+        assert snapshot_driver_tree(sysfs, "missing") == {}
+
+    @pytest.mark.parametrize(
+        "desired, current, kwargs, expected",
+        [
+            ({"a": "1", "b": "2"}, {"a": "1", "b": "2", "c": "3"}, {}, False),
+            ({"a": "1"}, {"a": "2"}, {}, True),
+            ({"a": "0"}, {"a": None}, {}, False),
+            ({"a": "0"}, {}, {}, False),
+            ({"a": "1"}, {}, {}, True),
+            ({"a": "1", "b": "9"}, {"a": "1"}, {"skip_attrs": {"b"}}, False),
+            ({}, {"IncomingUser": "u p"}, {"removable_attrs": {"IncomingUser"}}, True),
+            (
+                {"IncomingUser": "u p"},
+                {"IncomingUser": "u p"},
+                {"removable_attrs": {"IncomingUser"}},
+                False,
+            ),
+        ],
+    )
+    def test_attrs_config_differs(self, desired, current, kwargs, expected):
+        """
+        Test attrs_config_differs across matching and differing attribute sets
+
+        This test verifies that:
+        1. Identical (or superset) current attributes report no difference
+        2. A changed value, or a missing non-zero value, is a difference
+        3. Missing attributes whose desired value is "0" match the SCST default
+        4. skip_attrs are excluded and leftover removable_attrs are a difference
+        """
+        assert attrs_config_differs(desired, current, **kwargs) is expected
+
+    def test_unescape_initiator(self):
+        """
+        Test unescape_initiator strips config file escapes
+
+        This test verifies that:
+        1. Escaped '#' and '*' are turned into their sysfs form
+        2. A name without backslashes is returned as the same object
+        """
+        # Arrange: One escaped and one plain initiator name
+        plain = "iqn.2024-01.com.example:host1"
+
+        # Act & Assert: Escapes removed, plain name passed straight through
+        assert unescape_initiator("iqn.host\\#1\\*") == "iqn.host#1*"
+        assert unescape_initiator(plain) is plain
+
+    def test_apply_config_driver_attributes_skips_read_only(
+        self, target_writer, mock_sysfs, mock_logger
+    ):
+        """
+        Test apply_config_driver_attributes tells read-only from missing attributes
+
+        This test verifies that:
+        1. Every differing attribute is written without a writability pre-check
+        2. A write refused with a permission error is skipped quietly
+        3. A write to an attribute that does not exist is reported as a warning
+        """
+        # Arrange: open_state is read-only, bogus does not exist
+        mock_sysfs.valid_path.return_value = True
+        config = Mock(
+            drivers={"iscsi": Mock(attributes={"open_state": "0", "bogus": "1"})}
+        )
+        errors = {
+            "open_state": PermissionError(13, "Permission denied"),
+            "bogus": FileNotFoundError(2, "No such file or directory"),
+        }
+
+        def fail_write(attr_name, value, dir_fd=None):
+            raise SCSTError(f"Error writing to {attr_name}") from errors[attr_name]
+
+        mock_sysfs.write_sysfs_attribute_fast.side_effect = fail_write
+
+        # Act: Call the method under test
+        with patch(
+            "scstadmin.writers.target_writer.snapshot_driver_tree",
+            return_value={"open_state": "1"},
+        ), patch("scstadmin.writers.target_writer.os.close"):
+            target_writer.apply_config_driver_attributes(config)
+
+        # Assert: Both attempted, only the missing attribute warned about
+        assert [
+            c.args[0] for c in mock_sysfs.write_sysfs_attribute_fast.call_args_list
+        ] == ["open_state", "bogus"]
+        mock_logger.warning.assert_called_once_with(
+            "Failed to set driver attribute %s.%s: %s", "iscsi", "bogus", ANY
+        )
+
+    def test_apply_config_driver_attributes_uses_snapshot(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test apply_config_driver_attributes compares against the driver snapshot
+
+        This test verifies that:
+        1. Driver attributes are compared in memory, not read one by one
+        2. Only attributes whose value differs are written
+        3. 'enabled' is left for the enable pass
+        """
+        # Arrange: link_local already matches, iSNSServer differs
+        mock_sysfs.valid_path.return_value = True
+        driver_config = Mock(
+            attributes={"enabled": "1", "link_local": "0", "iSNSServer": "10.0.0.1"}
+        )
+        config = Mock(drivers={"iscsi": driver_config})
+        snapshot = {"enabled": "0", "link_local": "0", "iSNSServer": ""}
+
+        # Act: Call the method under test with the snapshot patched in
+        with patch(
+            "scstadmin.writers.target_writer.snapshot_driver_tree",
+            return_value=snapshot,
+        ) as mock_snapshot, patch("scstadmin.writers.target_writer.os.close"):
+            target_writer.apply_config_driver_attributes(config)
+
+        # Assert: One snapshot, one write, no per-attribute reads
+        mock_snapshot.assert_called_once_with(mock_sysfs, "iscsi")
+        mock_sysfs.read_sysfs_attribute.assert_not_called()
+        mock_sysfs.write_sysfs_attribute_fast.assert_called_once_with(
+            "iSNSServer", "10.0.0.1", dir_fd=mock_sysfs.open_directory.return_value
+        )
+
+    def test_apply_config_driver_attributes_snapshots_only_needed_drivers(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test apply_config_driver_attributes reads only drivers with regular attributes
+
+        This test verifies that:
+        1. Drivers whose attributes are all mgmt-controlled are not snapshotted
+        2. Several drivers with regular attributes are snapshotted together
+        3. Each driver's writes use its own snapshot
+        """
+        # Arrange: iscsi and isert have regular attributes, srpt only MaxSessions
+        mock_sysfs.valid_path.return_value = True
+        config = Mock(
+            drivers={
+                "iscsi": Mock(attributes={"link_local": "1"}),
+                "isert": Mock(attributes={"link_local": "0"}),
+                "srpt": Mock(attributes={"MaxSessions": "8"}),
+            }
+        )
+        snapshots = {"iscsi": {"link_local": "0"}, "isert": {"link_local": "0"}}
+        target_writer._update_driver_mgmt_attribute = Mock()
+
+        # Act: Call the method under test
+        with patch(
+            "scstadmin.writers.target_writer.snapshot_driver_tree",
+            side_effect=lambda sysfs, driver: snapshots[driver],
+        ) as mock_snapshot, patch("scstadmin.writers.target_writer.os.close"):
+            target_writer.apply_config_driver_attributes(config)
+
+        # Assert: srpt never walked, only iscsi's link_local written
+        assert sorted(c.args[1] for c in mock_snapshot.call_args_list) == [
+            "iscsi",
+            "isert",
+        ]
+        mock_sysfs.open_directory.assert_called_once_with(
+            "/sys/kernel/scst_tgt/targets/iscsi"
+        )
+        mock_sysfs.write_sysfs_attribute_fast.assert_called_once_with(
+            "link_local", "1", dir_fd=mock_sysfs.open_directory.return_value
+        )
+        target_writer._update_driver_mgmt_attribute.assert_called_once_with(
+            "srpt", "MaxSessions", "8"
+        )
+
+    def test_apply_config_driver_attributes_one_directory_open(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test apply_config_driver_attributes resolves the driver path once
+
+        This test verifies that:
+        1. All attribute writes of a driver share one directory fd
+        2. The directory fd is closed once the driver is done
+        3. A driver with nothing to write never opens its directory
+        """
+        # Arrange: iscsi needs two writes, isert is already up to date
+        mock_sysfs.valid_path.return_value = True
+        mock_sysfs.open_directory.return_value = 42
+        config = Mock(
+            drivers={
+                "iscsi": Mock(attributes={"link_local": "1", "iSNSServer": "x"}),
+                "isert": Mock(attributes={"link_local": "0"}),
+            }
+        )
+        snapshots = {
+            "iscsi": {"link_local": "0", "iSNSServer": ""},
+            "isert": {"link_local": "0"},
+        }
+
+        # Act: Call the method under test
+        with patch(
+            "scstadmin.writers.target_writer.snapshot_driver_tree",
+            side_effect=lambda sysfs, driver: snapshots[driver],
+        ), patch("scstadmin.writers.target_writer.os.close") as mock_close:
+            target_writer.apply_config_driver_attributes(config)
+
+        # Assert: One open and one close for iscsi, both writes relative to it
+        mock_sysfs.open_directory.assert_called_once_with(
+            "/sys/kernel/scst_tgt/targets/iscsi"
+        )
+        assert mock_sysfs.write_sysfs_attribute_fast.call_args_list == [
+            call("link_local", "1", dir_fd=42),
+            call("iSNSServer", "x", dir_fd=42),
+        ]
+        mock_close.assert_called_once_with(42)
+        mock_sysfs.write_sysfs.assert_not_called()
+
+    def test_wait_for_sessions_closed(self, target_writer, tmp_path):
+        """
+        Test _wait_for_sessions_closed reports sessions that outlive the timeout
+
+        This test verifies that:
+        1. Sessions already gone are reported closed without waiting
+        2. A session still present is returned once the deadline passes
+        3. The wait ends at the timeout instead of a full 1 second poll interval
+        4. A missing sessions directory means every session has closed
+        """
+        # Arrange: sess1 still present, sess2 already gone
+        sessions = tmp_path / "sessions"
+        (sessions / "sess1").mkdir(parents=True)
+
+        # Act & Assert: sess2 closed, sess1 reported well before a 1s poll
+        start = time.monotonic()
+        remaining = target_writer._wait_for_sessions_closed(
+            str(sessions), {"sess1", "sess2"}, 0.05
+        )
+        assert remaining == {"sess1"}
+        assert time.monotonic() - start < 0.5
+
+        assert (
+            target_writer._wait_for_sessions_closed(str(sessions), {"sess2"}, 5)
+            == set()
+        )
+        assert (
+            target_writer._wait_for_sessions_closed(
+                str(tmp_path / "missing"), {"sess1"}, 5
+            )
+            == set()
+        )
+
+    def test_wait_for_sessions_closed_backoff(self, target_writer, tmp_path):
+        """
+        Test _wait_for_sessions_closed polls with a growing, capped interval
+
+        This test verifies that:
+        1. The first poll waits SESSION_POLL_MIN instead of a full second
+        2. Each later wait is 1.5x the previous one
+        3. The wait never exceeds SESSION_POLL_MAX
+        """
+        # Arrange: A session that never closes and a clock that never advances
+        sessions = tmp_path / "sessions"
+        (sessions / "sess1").mkdir(parents=True)
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 12:
+                # Drop the session so the wait can finish
+                (sessions / "sess1").rmdir()
+
+        # Act: Wait with sleep recorded instead of performed
+        with patch(
+            "scstadmin.writers.target_writer.time.sleep", side_effect=fake_sleep
+        ):
+            remaining = target_writer._wait_for_sessions_closed(
+                str(sessions), {"sess1"}, 300
+            )
+
+        # Assert: Exponential growth from 10ms, capped at 500ms
+        assert remaining == set()
+        assert sleeps[0] == SCSTConstants.SESSION_POLL_MIN
+        assert sleeps[1] == pytest.approx(0.015)
+        assert all(b >= a for a, b in zip(sleeps, sleeps[1:]))
+        assert max(sleeps) == SCSTConstants.SESSION_POLL_MAX
+
+    def test_format_params(self, target_writer):
+        """
+        Test _format_params joins creation parameters and reuses the result
+
+        This test verifies that:
+        1. Parameters are joined in SCST's "k1=v1;k2=v2" syntax in dict order
+        2. An identical parameter set returns the cached string
+        """
+        # Act: Format the same parameters twice
+        first = target_writer._format_params({"read_only": "1", "rotational": "0"})
+        second = target_writer._format_params({"read_only": "1", "rotational": "0"})
+
+        # Assert: Joined once, cached string reused
+        assert first == "read_only=1;rotational=0"
+        assert second is first
+
+    def test_prefetch_snapshots(self, target_writer):
+        """
+        Test _prefetch_snapshots snapshots every target of a driver
+
+        This test verifies that:
+        1. Each target is snapshotted once and keyed by its name
+        2. A target whose layout cannot be read maps to None
+        """
+        # Arrange: tgt2 cannot be read
+        snapshots = {"tgt1": TargetSnapshot(), "tgt3": TargetSnapshot()}
+
+        def snapshot_target(driver, target):
+            if target == "tgt2":
+                raise PermissionError("denied")
+            return snapshots[target]
+
+        target_writer._snapshot_target = Mock(side_effect=snapshot_target)
+
+        # Act: Prefetch three targets
+        result = target_writer._prefetch_snapshots("iscsi", ["tgt1", "tgt2", "tgt3"])
+
+        # Assert: Results keyed by target, unreadable target is None
+        assert result == {"tgt1": snapshots["tgt1"], "tgt2": None, "tgt3": snapshots["tgt3"]}
+        assert target_writer._snapshot_target.call_count == 3
+
+    def test_direct_lun_assignments_differ(self, target_writer, mock_sysfs):
+        """
+        Test _direct_lun_assignments_differ compares live and desired direct LUNs
+
+        This test verifies that:
+        1. Without a snapshot, the target is snapshotted from sysfs
+        2. Each current LUN's device is resolved from its device link
+        3. Matching assignments report no difference, changed ones do
+        """
+        # Arrange: Set up current LUNs 0 and 1 mapped to disk1 and disk2
+        driver = "iscsi"
+        target = "iqn.2023-01.example.com:test"
+        luns_path = f"/sys/kernel/scst_tgt/targets/{driver}/{target}/luns"
+        mock_sysfs.list_subdirectories.side_effect = lambda path: (
+            ["0", "1"] if path == luns_path else []
+        )
+        target_writer._read_lun_device_fast = Mock(
+            side_effect=lambda path: {"0": "disk1", "1": "disk2"}[path[-1]]
+        )
+
+        target_config = Mock()
+        target_config.luns = {
+            "0": LunConfig(lun_number="0", device="disk1"),
+            "1": LunConfig(lun_number="1", device="disk2"),
+        }
+
+        # Act & Assert: Identical assignments do not differ
+        assert (
+            target_writer._direct_lun_assignments_differ(driver, target, target_config)
+            is False
+        )
+        mock_sysfs.list_subdirectories.assert_any_call(luns_path)
+
+        # Act & Assert: A different device on LUN 1 is detected
+        target_config.luns["1"] = LunConfig(lun_number="1", device="disk3")
+        assert (
+            target_writer._direct_lun_assignments_differ(driver, target, target_config)
+            is True
+        )
+
+        # Act & Assert: Unreadable sysfs is treated as a difference
+        mock_sysfs.list_subdirectories.side_effect = PermissionError("denied")
+        assert (
+            target_writer._direct_lun_assignments_differ(driver, target, target_config)
+            is True
+        )
 
-        # At least one group should be checked for existence
-        assert target_writer._group_exists.call_count >= 1
+    def test_group_assignments_differ_true_group_membership_differs(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test _group_assignments_differ returns True when group membership differs
+
+        This test verifies that:
+        1. Group membership differences are detected (current vs desired group sets)
+        2. Method returns True early when group membership differs
+        3. Individual group config checking is skipped when membership differs
+        4. Proper sysfs path construction and directory filtering
+        """
+        # Arrange: Set up test data with different group membership
+        driver = "iscsi"
+        target = "iqn.2023-01.example.com:test"
+        target_config = Mock()
+        target_config.groups = {
+            "windows_clients": Mock(),
+            "mac_clients": Mock(),  # Desired: windows_clients, mac_clients
+        }
+
+        groups_path = (
+            "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups"
+        )
+
+        # Mock filesystem operations - different current groups
+        mock_sysfs.list_subdirectories.side_effect = lambda path: (
+            ["windows_clients", "linux_clients"] if path == groups_path else []
+        )  # Current: windows_clients, linux_clients
+        mock_sysfs.list_files.return_value = []
+
+        # Mock helper methods (should not be called due to early return)
+        target_writer._group_snapshot_matches = Mock()
+
+        # Act: Call the method under test
+        result = target_writer._group_assignments_differ(
+            driver, target, target_config
+        )
+
+        # Assert: Verify method returns True for differing group membership
+        assert result is True
+
+        # Assert: Verify helper methods were not called (early return)
+        target_writer._group_snapshot_matches.assert_not_called()
+
+    def test_group_assignments_differ_true_group_config_differs(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test _group_assignments_differ returns True when group configuration differs
+
+        This test verifies that:
+        1. Group membership matches but individual group config differs
+        2. Method returns True when any group configuration doesn't match
+        3. Proper delegation to _group_snapshot_matches for detailed comparison
+        4. Early return when first differing group is found
+        """
+        # Arrange: Set up test data with matching membership but differing config
+        driver = "iscsi"
+        target = "iqn.2023-01.example.com:test"
+        target_config = Mock()
+        target_config.groups = {"storage_group": Mock(), "backup_group": Mock()}
+
+        groups_path = (
+            "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups"
+        )
+
+        # Mock filesystem operations - matching group membership
+        mock_sysfs.list_subdirectories.side_effect = lambda path: (
+            ["storage_group", "backup_group"] if path == groups_path else []
+        )  # Current groups match desired
+        mock_sysfs.list_files.return_value = []
+
+        # Mock helper methods - first group differs
+        def mock_group_snapshot_matches(group_snapshot, group_config):
+            if group_config is target_config.groups["storage_group"]:
+                return False  # First group differs
+            return True  # Other groups match (but shouldn't be checked due to early return)
+
+        target_writer._group_snapshot_matches = Mock(
+            side_effect=mock_group_snapshot_matches
+        )
+
+        # Act: Call the method under test
+        result = target_writer._group_assignments_differ(
+            driver, target, target_config
+        )
+
+        # Assert: Verify method returns True for differing group configuration
+        assert result is True
+
+        # Assert: Verify method should return True when any group differs
+        # Note: Due to dictionary iteration order, either group could be checked first
+        # The key is that once a differing group is found, method returns True
 
         # At least one group config should be checked, and method returns on first difference
-        assert target_writer._group_config_matches.call_count >= 1
+        assert target_writer._group_snapshot_matches.call_count >= 1
 
     def test_apply_group_assignments_comprehensive_workflow(
         self, target_writer, mock_sysfs, mock_config_reader, mock_logger
@@ -2043,7 +2791,7 @@ class TestTargetWriter:
         1. Group existence and configuration checking with optimization
         2. Group creation via mgmt interface
         3. Initiator membership configuration with escaping handling
-        4. LUN assignment configuration within groups
+        4. LUN assignment configuration within groups, one batch per mgmt file
         5. Proper error handling for existing groups/initiators/LUNs
         6. Debug logging for all operations
         """
@@ -2093,6 +2841,7 @@ class TestTargetWriter:
 
         # Configure successful sysfs writes
         mock_sysfs.write_sysfs.return_value = None
+        mock_sysfs.write_sysfs_batch.return_value = []
 
         # Act: Call the method under test
         target_writer.apply_group_assignments(driver, target, target_config)
@@ -2125,39 +2874,26 @@ class TestTargetWriter:
         ]
         mock_sysfs.write_sysfs.assert_has_calls(expected_create_calls, any_order=True)
 
-        # Assert: Verify initiator assignments (with escaping)
+        # Assert: Initiator assignments (with escaping) and LUN assignments are
+        # written as one batch per group mgmt file
         base_initiators_path = (
             "/sys/kernel/scst_tgt/targets/iscsi/iqn.2023-01.example.com:test/ini_groups"
         )
-        expected_initiator_calls = [
-            # update_group initiators - client#3, escaping removed
+        assert mock_sysfs.write_sysfs_batch.call_args_list == [
             call(
                 f"{base_initiators_path}/update_group/initiators/mgmt",
-                "add iqn.example:client2",
+                ["add iqn.example:client2", "add iqn.example:client#3"],
             ),
             call(
-                f"{base_initiators_path}/update_group/initiators/mgmt",
-                "add iqn.example:client#3",
+                f"{base_initiators_path}/update_group/luns/mgmt",
+                ["add disk1 0", "add disk2 1"],
             ),
-            # new_group initiators
             call(
                 f"{base_initiators_path}/new_group/initiators/mgmt",
-                "add iqn.example:client4",
+                ["add iqn.example:client4"],
             ),
+            call(f"{base_initiators_path}/new_group/luns/mgmt", ["add disk3 0"]),
         ]
-        mock_sysfs.write_sysfs.assert_has_calls(
-            expected_initiator_calls, any_order=True
-        )
-
-        # Assert: Verify LUN assignments
-        expected_lun_calls = [
-            # update_group LUNs
-            call(f"{base_initiators_path}/update_group/luns/mgmt", "add disk1 0"),
-            call(f"{base_initiators_path}/update_group/luns/mgmt", "add disk2 1"),
-            # new_group LUNs
-            call(f"{base_initiators_path}/new_group/luns/mgmt", "add disk3 0"),
-        ]
-        mock_sysfs.write_sysfs.assert_has_calls(expected_lun_calls, any_order=True)
 
         # Assert: Verify debug logging
         mock_logger.debug.assert_any_call(
@@ -2215,19 +2951,18 @@ class TestTargetWriter:
             group_mock.luns = {"0": Mock()}
             group_mock.luns["0"].device = "disk1"
 
-        # Mock helper methods
-        def mock_group_exists(driver, target, group_name):
-            return group_name in [
-                "match_group",
-                "update_group",
-            ]  # new_group doesn't exist
+        # Mock helper methods - new_group doesn't exist
+        snapshot = TargetSnapshot(
+            groups={"match_group": GroupSnapshot(), "update_group": GroupSnapshot()}
+        )
+        target_writer._snapshot_target = Mock(return_value=snapshot)
 
-        def mock_group_config_matches(driver, target, group_name, group_config):
-            return group_name == "match_group"  # Only match_group matches
+        def mock_group_snapshot_matches(group_snapshot, group_config):
+            # Only match_group matches
+            return group_config is target_config.groups["match_group"]
 
-        target_writer._group_exists = Mock(side_effect=mock_group_exists)
-        target_writer._group_config_matches = Mock(
-            side_effect=mock_group_config_matches
+        target_writer._group_snapshot_matches = Mock(
+            side_effect=mock_group_snapshot_matches
         )
         target_writer._update_group_config = Mock()
 
@@ -2237,29 +2972,27 @@ class TestTargetWriter:
         # Act: Call the method under test
         target_writer._update_target_groups(driver, target, target_config)
 
-        # Assert: Verify group existence checks for all configured groups
-        expected_exists_calls = [
-            call(driver, target, "match_group"),
-            call(driver, target, "update_group"),
-            call(driver, target, "new_group"),
-        ]
-        target_writer._group_exists.assert_has_calls(
-            expected_exists_calls, any_order=True
-        )
+        # Assert: Group existence comes from one snapshot of the target
+        target_writer._snapshot_target.assert_called_once_with(driver, target)
 
         # Assert: Verify config matching checks for existing groups
         expected_config_calls = [
-            call(driver, target, "match_group", target_config.groups["match_group"]),
-            call(driver, target, "update_group", target_config.groups["update_group"]),
+            call(snapshot.groups["match_group"], target_config.groups["match_group"]),
+            call(snapshot.groups["update_group"], target_config.groups["update_group"]),
             # new_group not checked because it doesn't exist
         ]
-        target_writer._group_config_matches.assert_has_calls(
+        target_writer._group_snapshot_matches.assert_has_calls(
             expected_config_calls, any_order=True
         )
 
         # Assert: Verify group config update for differing group
         target_writer._update_group_config.assert_called_once_with(
-            driver, target, "update_group", target_config.groups["update_group"]
+            driver,
+            target,
+            "update_group",
+            target_config.groups["update_group"],
+            already_checked=True,
+            group_snapshot=snapshot.groups["update_group"],
         )
 
         # Assert: Verify group creation sysfs operations for new_group
@@ -2305,6 +3038,410 @@ class TestTargetWriter:
         ]
         mock_logger.debug.assert_has_calls(expected_debug_calls, any_order=True)
 
+    def test_apply_lun_assignments_create_params(
+        self, target_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test apply_lun_assignments places LUN create params in the add command
+
+        This test verifies that:
+        1. LUNs with attributes ask the config reader for their create params
+        2. LUNs without attributes never look the mgmt interface up
+        3. Creation parameters are placed in the add command
+        """
+        # Arrange: Three new LUNs, two with read_only, one without attributes
+        target_config = Mock()
+        target_config.luns = {
+            "0": LunConfig(lun_number="0", device="disk0", attributes={"read_only": "1"}),
+            "1": LunConfig(lun_number="1", device="disk1", attributes={"read_only": "0"}),
+            "2": LunConfig(lun_number="2", device="disk2"),
+        }
+        mock_sysfs.list_subdirectories.return_value = []  # No existing LUNs
+        mock_config_reader._get_lun_create_params.side_effect = (
+            lambda drv, tgt, attrs: {k: v for k, v in attrs.items() if k == "read_only"}
+        )
+
+        # Act: Call the method under test
+        target_writer.apply_lun_assignments("iscsi", "tgt", target_config)
+
+        # Assert: One lookup per LUN with attributes, params in the add commands
+        assert mock_config_reader._get_lun_create_params.call_args_list == [
+            call("iscsi", "tgt", {"read_only": "1"}),
+            call("iscsi", "tgt", {"read_only": "0"}),
+        ]
+        mgmt = "/sys/kernel/scst_tgt/targets/iscsi/tgt/luns/mgmt"
+        assert mock_sysfs.write_sysfs.call_args_list == [
+            call(mgmt, "add disk0 0 read_only=1;"),
+            call(mgmt, "add disk1 1 read_only=0;"),
+            call(mgmt, "add disk2 2"),
+        ]
+
+    def test_apply_lun_assignments_replaces_wrong_device(
+        self, target_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test apply_lun_assignments swaps a LUN's device with a single replace write
+
+        This test verifies that:
+        1. Existing LUNs are found with a single listing of the luns directory
+        2. luns/mgmt support for "replace" comes from the config reader
+        3. A LUN on the wrong device is replaced without a preceding del
+        """
+        # Arrange: LUNs 0 and 1 exist on the wrong devices
+        target_config = Mock()
+        target_config.luns = {
+            "0": LunConfig(lun_number="0", device="disk3"),
+            "1": LunConfig(lun_number="1", device="disk4"),
+        }
+        mock_sysfs.list_subdirectories.return_value = ["0", "1"]
+        target_writer._read_lun_device_fast = Mock(return_value="disk1")
+        mock_config_reader._get_lun_mgmt_info.return_value = parse_lun_mgmt_content(
+            'echo "replace H:C:I:L lun [parameters]" >mgmt'
+        )
+
+        # Act: Call the method under test
+        target_writer.apply_lun_assignments("iscsi", "tgt", target_config)
+
+        # Assert: One listing, one replace write per LUN
+        mgmt = "/sys/kernel/scst_tgt/targets/iscsi/tgt/luns/mgmt"
+        mock_sysfs.list_subdirectories.assert_called_once_with(
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/luns"
+        )
+        mock_config_reader._get_lun_mgmt_info.assert_called_with("iscsi", mgmt)
+        assert mock_sysfs.write_sysfs.call_args_list == [
+            call(mgmt, "replace disk3 0"),
+            call(mgmt, "replace disk4 1"),
+        ]
+
+    def test_apply_lun_assignments_all_current(
+        self, target_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test apply_lun_assignments returns early when every LUN is already correct
+
+        This test verifies that:
+        1. Current devices are resolved once per LUN from the single listing
+        2. A current mapping equal to the desired one issues no mgmt writes
+        3. The per-LUN config reader lookup is no longer used
+        """
+        # Arrange: LUNs 0 and 1 already point at their configured devices
+        target_config = Mock()
+        target_config.luns = {
+            "0": LunConfig(lun_number="0", device="disk1"),
+            "1": LunConfig(lun_number="1", device="disk2"),
+        }
+        mock_sysfs.list_subdirectories.return_value = ["0", "1"]
+        current = {"0": "disk1", "1": "disk2"}
+        target_writer._read_lun_device_fast = Mock(
+            side_effect=lambda lun_dir: current[lun_dir.rsplit("/", 1)[1]]
+        )
+
+        # Act: Call the method under test
+        target_writer.apply_lun_assignments("iscsi", "tgt", target_config)
+
+        # Assert: Nothing written, nothing probed
+        assert target_writer._read_lun_device_fast.call_count == 2
+        mock_sysfs.write_sysfs.assert_not_called()
+        mock_sysfs.read_sysfs.assert_not_called()
+        mock_config_reader._get_current_lun_device.assert_not_called()
+
+    def test_read_lun_device_fast(self, tmp_path):
+        """
+        Test _read_lun_device_fast resolves LUN device symlinks
+
+        This test verifies that:
+        1. The device name is the basename of the device symlink target
+        2. A LUN without a device link resolves to ""
+        3. A dangling device link (stale assignment) resolves to ""
+        """
+        # Arrange: devices/disk1 exists, devices/gone does not
+        (tmp_path / "devices" / "disk1").mkdir(parents=True)
+        for lun, device in (("0", "disk1"), ("1", None), ("2", "gone")):
+            lun_dir = tmp_path / "luns" / lun
+            lun_dir.mkdir(parents=True)
+            if device:
+                (lun_dir / "device").symlink_to(f"../../devices/{device}")
+
+        # Act & Assert
+        luns = tmp_path / "luns"
+        assert TargetWriter._read_lun_device_fast(str(luns / "0")) == "disk1"
+        assert TargetWriter._read_lun_device_fast(str(luns / "1")) == ""
+        assert TargetWriter._read_lun_device_fast(str(luns / "2")) == ""
+
+    @pytest.mark.parametrize(
+        "mgmt_help,update_verb",
+        [
+            ('echo "add H:C:I:L lun [parameters]" >mgmt', "add"),
+            (
+                'echo "add H:C:I:L lun [parameters]" >mgmt\n'
+                'echo "replace H:C:I:L lun [parameters]" >mgmt',
+                "replace",
+            ),
+        ],
+    )
+    def test_update_group_lun_assignments_add_remove_update(
+        self, target_writer, mock_sysfs, mock_config_reader, mgmt_help, update_verb
+    ):
+        """
+        Test _update_group_lun_assignments reconciles group LUNs incrementally
+
+        This test verifies that:
+        1. Current group LUNs are enumerated with list_subdirectories and
+           resolved through their device symlinks
+        2. Obsolete LUNs are deleted, missing LUNs added
+        3. LUNs pointing at the wrong device are switched with "replace" when
+           luns/mgmt supports it, otherwise re-added
+        4. Correct LUNs are left untouched
+        """
+        # Arrange: Current 0->disk1, 1->disk2, 5->disk5; desired 0->disk1, 1->disk3, 2->disk4
+        group_luns_path = (
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/ini_groups/clients/luns"
+        )
+        mock_sysfs.list_subdirectories.return_value = ["0", "1", "5"]
+        mock_config_reader._get_lun_mgmt_info.return_value = parse_lun_mgmt_content(
+            mgmt_help
+        )
+        current = {"0": "disk1", "1": "disk2", "5": "disk5"}
+        target_writer._read_lun_device_fast = Mock(
+            side_effect=lambda lun_dir: current[lun_dir.rsplit("/", 1)[1]]
+        )
+        group_config = Mock()
+        group_config.luns = {
+            "0": LunConfig(lun_number="0", device="disk1"),
+            "1": LunConfig(lun_number="1", device="disk3"),
+            "2": LunConfig(lun_number="2", device="disk4"),
+        }
+
+        # Act: Call the method under test
+        target_writer._update_group_lun_assignments(
+            "iscsi", "tgt", "clients", group_config
+        )
+
+        # Assert: Only the necessary mgmt commands were issued
+        mock_sysfs.list_subdirectories.assert_called_once_with(group_luns_path)
+        mgmt = f"{group_luns_path}/mgmt"
+        assert mock_sysfs.write_sysfs.call_args_list == [
+            call(mgmt, "del 5"),
+            call(mgmt, f"{update_verb} disk3 1"),
+            call(mgmt, "add disk4 2"),
+        ]
+
+    def test_update_group_lun_assignments_clears_all(
+        self, target_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test _update_group_lun_assignments empties a group with one clear write
+
+        This test verifies that:
+        1. When every current LUN is obsolete and luns/mgmt supports "clear",
+           a single "clear" command replaces the per-LUN "del" commands
+        """
+        # Arrange: Three current LUNs, none desired
+        group_luns_mgmt = (
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/ini_groups/clients/luns/mgmt"
+        )
+        mock_sysfs.list_subdirectories.return_value = ["0", "1", "2"]
+        mock_config_reader._get_lun_mgmt_info.return_value = parse_lun_mgmt_content(
+            'echo "clear" >mgmt'
+        )
+        target_writer._read_lun_device_fast = Mock(return_value="disk1")
+        group_config = Mock()
+        group_config.luns = {}
+
+        # Act: Call the method under test
+        target_writer._update_group_lun_assignments(
+            "iscsi", "tgt", "clients", group_config
+        )
+
+        # Assert: One clear write, no individual deletes
+        assert mock_sysfs.write_sysfs.call_args_list == [
+            call(group_luns_mgmt, "clear")
+        ]
+
+    def test_update_group_lun_assignments_steady_state(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test _update_group_lun_assignments issues nothing when the group is current
+
+        This test verifies that:
+        1. Current LUNs that are all still desired cause no "del" commands
+        2. Only the LUN missing from the group is added
+        """
+        # Arrange: Group has 0->disk1, config wants 0->disk1 and 1->disk2
+        group_luns_mgmt = (
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/ini_groups/clients/luns/mgmt"
+        )
+        group_config = Mock()
+        group_config.luns = {
+            "0": LunConfig(lun_number="0", device="disk1"),
+            "1": LunConfig(lun_number="1", device="disk2"),
+        }
+
+        # Act: Call the method under test with the current LUNs supplied
+        target_writer._update_group_lun_assignments(
+            "iscsi", "tgt", "clients", group_config, current_luns={"0": "disk1"}
+        )
+
+        # Assert: No removal, a single add
+        assert mock_sysfs.write_sysfs.call_args_list == [
+            call(group_luns_mgmt, "add disk2 1")
+        ]
+
+    def test_update_group_config_clears_replaced_initiators(
+        self, target_writer, mock_sysfs, mock_config_reader
+    ):
+        """
+        Test _update_group_config replaces a group's whole initiator list efficiently
+
+        This test verifies that:
+        1. initiators/mgmt support for "clear" comes from the config reader
+        2. When every current initiator is obsolete, one "clear" replaces the dels
+        3. The clear happens before the new initiators are added
+        """
+        # Arrange: Two current initiators, both replaced by a new one
+        initiators_mgmt = (
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/ini_groups/clients/initiators/mgmt"
+        )
+        mock_config_reader._get_initiators_mgmt_commands.return_value = {
+            "add",
+            "del",
+            "clear",
+        }
+        mock_sysfs.list_files.return_value = ["iqn.old1", "iqn.old2"]
+        mock_sysfs.list_subdirectories.return_value = []
+        mock_sysfs.mgmt_operation.return_value = True
+        target_writer._update_group_lun_assignments = Mock()
+        group_config = InitiatorGroupConfig(name="clients", initiators=["iqn.new"])
+
+        # Act: Call the method under test
+        target_writer._update_group_config(
+            "iscsi", "tgt", "clients", group_config, already_checked=True
+        )
+
+        # Assert: clear first, then the single add, no individual deletes
+        mock_config_reader._get_initiators_mgmt_commands.assert_called_once_with(
+            "iscsi", initiators_mgmt
+        )
+        mock_sysfs.write_sysfs.assert_called_once_with(initiators_mgmt, "clear")
+        mock_sysfs.mgmt_operation.assert_called_once_with(
+            initiators_mgmt, "add", "iqn.new", ANY, ANY, "iqn.new", "clients"
+        )
+        assert mock_sysfs.method_calls.index(
+            call.write_sysfs(initiators_mgmt, "clear")
+        ) < mock_sysfs.method_calls.index(
+            call.mgmt_operation(
+                initiators_mgmt, "add", "iqn.new", ANY, ANY, "iqn.new", "clients"
+            )
+        )
+
+    def test_update_group_config_adds_before_deleting_initiators(
+        self, target_writer, mock_sysfs
+    ):
+        """
+        Test _update_group_config without "clear" support on initiators/mgmt
+
+        This test verifies that:
+        1. No "clear" is written when initiators/mgmt does not list it
+        2. New initiators are added before the obsolete ones are deleted
+        """
+        # Arrange: Two current initiators, both replaced by a new one
+        initiators_mgmt = (
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/ini_groups/clients/initiators/mgmt"
+        )
+        mock_sysfs.list_files.return_value = ["iqn.old1", "iqn.old2"]
+        mock_sysfs.list_subdirectories.return_value = []
+        mock_sysfs.mgmt_operation.return_value = True
+        target_writer._update_group_lun_assignments = Mock()
+        group_config = InitiatorGroupConfig(name="clients", initiators=["iqn.new"])
+
+        # Act: Call the method under test
+        target_writer._update_group_config(
+            "iscsi", "tgt", "clients", group_config, already_checked=True
+        )
+
+        # Assert: One add followed by one del per obsolete initiator
+        mock_sysfs.write_sysfs.assert_not_called()
+        operations = [
+            (c.args[1], c.args[2]) for c in mock_sysfs.mgmt_operation.call_args_list
+        ]
+        assert operations[0] == ("add", "iqn.new")
+        assert sorted(operations[1:]) == [("del", "iqn.old1"), ("del", "iqn.old2")]
+        assert all(
+            c.args[0] == initiators_mgmt
+            for c in mock_sysfs.mgmt_operation.call_args_list
+        )
+
+    def test_update_group_config_already_checked(self, target_writer, mock_sysfs):
+        """
+        Test _update_group_config skips the config comparison when already_checked
+
+        This test verifies that:
+        1. _group_snapshot_matches is not repeated when the caller already ran it
+        2. The incremental update still proceeds to the LUN assignments
+        """
+        # Arrange: Group with no initiators so only LUN assignments are touched
+        group_config = InitiatorGroupConfig(name="clients")
+        group_config.initiators = []
+        target_writer._group_snapshot_matches = Mock(return_value=True)
+        target_writer._update_group_lun_assignments = Mock()
+        mock_sysfs.list_files.return_value = []
+        mock_sysfs.list_subdirectories.return_value = []
+
+        # Act: Call the method under test with already_checked=True
+        target_writer._update_group_config(
+            "iscsi", "tgt", "clients", group_config, already_checked=True
+        )
+
+        # Assert: The comparison was skipped and the update ran
+        target_writer._group_snapshot_matches.assert_not_called()
+        target_writer._update_group_lun_assignments.assert_called_once_with(
+            "iscsi", "tgt", "clients", group_config, current_luns={}
+        )
+
+    def test_update_group_config_uses_group_snapshot(self, target_writer, mock_sysfs):
+        """
+        Test _update_group_config works from a caller-supplied group snapshot
+
+        This test verifies that:
+        1. Initiators and LUNs are taken from the snapshot, sysfs is not listed
+        2. Only the initiator missing from the snapshot is added
+        3. The snapshot's LUNs are handed on to _update_group_lun_assignments
+        """
+        # Arrange: Snapshot already holds one of the two desired initiators
+        group_config = InitiatorGroupConfig(
+            name="clients", initiators=["iqn.keep", "iqn.new"], luns={"0": "disk1"}
+        )
+        group_snapshot = GroupSnapshot(initiators={"iqn.keep"}, luns={"0": "disk1"})
+        target_writer._update_group_lun_assignments = Mock()
+        mock_sysfs.mgmt_operation.return_value = True
+
+        # Act: Call the method under test with the snapshot
+        target_writer._update_group_config(
+            "iscsi",
+            "tgt",
+            "clients",
+            group_config,
+            already_checked=True,
+            group_snapshot=group_snapshot,
+        )
+
+        # Assert: No sysfs listing, one add, LUNs passed through
+        mock_sysfs.list_files.assert_not_called()
+        mock_sysfs.list_subdirectories.assert_not_called()
+        mock_sysfs.mgmt_operation.assert_called_once_with(
+            "/sys/kernel/scst_tgt/targets/iscsi/tgt/ini_groups/clients/initiators/mgmt",
+            "add",
+            "iqn.new",
+            ANY,
+            ANY,
+            "iqn.new",
+            "clients",
+        )
+        target_writer._update_group_lun_assignments.assert_called_once_with(
+            "iscsi", "tgt", "clients", group_config, current_luns={"0": "disk1"}
+        )
+
     def test_update_group_config_comprehensive_workflow(
         self, target_writer, mock_sysfs, mock_config_reader, mock_logger
     ):
@@ -2324,7 +3461,7 @@ class TestTargetWriter:
         driver = "iscsi"
         target = "iqn.2023-01.example.com:test"
         group_name = "storage_clients"
-        group_config = Mock()
+        group_config = InitiatorGroupConfig(name="clients")
         group_config.initiators = [
             "iqn.example:client1",  # Existing, keep
             "iqn.example:client\\#3",  # New, add (with escaping)
@@ -2336,42 +3473,31 @@ class TestTargetWriter:
         initiators_path = f"{group_path}/initiators"
         initiators_mgmt_path = f"{initiators_path}/mgmt"
 
-        # Mock filesystem operations
-        def mock_exists(path):
-            return path == initiators_path
-
-        def mock_listdir(path):
-            if path == initiators_path:
-                return [
-                    "iqn.example:client1",
-                    "iqn.example:client2",
-                    "mgmt",
-                ]  # Current initiators
-            return []
+        # Mock filesystem operations - current initiators (mgmt already filtered)
+        mock_sysfs.list_files.side_effect = lambda path: (
+            ["iqn.example:client1", "iqn.example:client2"]
+            if path == initiators_path
+            else []
+        )
 
-        def mock_isfile(path):
-            # Initiator entries are files, mgmt is excluded
-            return not path.endswith("/mgmt")
+        mock_sysfs.list_subdirectories.return_value = []
 
         # Mock helper methods - config does NOT match (so update proceeds)
-        target_writer._group_config_matches = Mock(return_value=False)
+        target_writer._group_snapshot_matches = Mock(return_value=False)
         target_writer._update_group_lun_assignments = Mock()
 
         # Configure successful mgmt operations
         mock_sysfs.mgmt_operation.return_value = None
 
-        with (
-            patch("os.path.exists", side_effect=mock_exists),
-            patch("os.listdir", side_effect=mock_listdir),
-            patch("os.path.isfile", side_effect=mock_isfile),
-            patch("os.path.join", side_effect=lambda *args: "/".join(args)),
-        ):
-            # Act: Call the method under test
-            target_writer._update_group_config(driver, target, group_name, group_config)
+        # Act: Call the method under test
+        target_writer._update_group_config(driver, target, group_name, group_config)
 
         # Assert: Verify configuration matching check is called
-        target_writer._group_config_matches.assert_called_once_with(
-            driver, target, group_name, group_config
+        target_writer._group_snapshot_matches.assert_called_once_with(
+            GroupSnapshot(
+                initiators={"iqn.example:client1", "iqn.example:client2"}, luns={}
+            ),
+            group_config,
         )
 
         # Assert: Verify initiator additions (missing initiators)
@@ -2380,15 +3506,19 @@ class TestTargetWriter:
                 initiators_mgmt_path,
                 "add",
                 "iqn.example:client#3",  # Escaping removed: \\# -> #
-                "Added initiator iqn.example:client#3 to group storage_clients",
-                "Failed to add initiator iqn.example:client#3 to group storage_clients",
+                "Added initiator %s to group %s",
+                "Failed to add initiator %s to group %s",
+                "iqn.example:client#3",
+                "storage_clients",
             ),
             call(
                 initiators_mgmt_path,
                 "add",
                 "iqn.example:client4",
-                "Added initiator iqn.example:client4 to group storage_clients",
-                "Failed to add initiator iqn.example:client4 to group storage_clients",
+                "Added initiator %s to group %s",
+                "Failed to add initiator %s to group %s",
+                "iqn.example:client4",
+                "storage_clients",
             ),
         ]
         mock_sysfs.mgmt_operation.assert_has_calls(expected_add_calls, any_order=True)
@@ -2399,8 +3529,10 @@ class TestTargetWriter:
                 initiators_mgmt_path,
                 "del",
                 "iqn.example:client2",  # client2 not in desired config
-                "Removed initiator iqn.example:client2 from group storage_clients",
-                "Failed to remove initiator iqn.example:client2 from group storage_clients",
+                "Removed initiator %s from group %s",
+                "Failed to remove initiator %s from group %s",
+                "iqn.example:client2",
+                "storage_clients",
             )
         ]
         mock_sysfs.mgmt_operation.assert_has_calls(
@@ -2409,7 +3541,7 @@ class TestTargetWriter:
 
         # Assert: Verify LUN assignment update delegation
         target_writer._update_group_lun_assignments.assert_called_once_with(
-            driver, target, group_name, group_config
+            driver, target, group_name, group_config, current_luns={}
         )
 
         # Assert: Verify debug logging for method entry
@@ -2421,19 +3553,6 @@ class TestTargetWriter:
 class TestGroupWriter:
     """Test cases for GroupWriter class"""
 
-    @pytest.fixture
-    def mock_sysfs(self):
-        """Create a mock SCSTSysfs instance for testing"""
-        mock = Mock(spec=SCSTSysfs)
-        # Set up common sysfs path constants that writers expect
-        mock.SCST_HANDLERS = "/sys/kernel/scst_tgt/handlers"
-        mock.SCST_TARGETS = "/sys/kernel/scst_tgt/targets"
-        mock.SCST_DEVICES = "/sys/kernel/scst_tgt/devices"
-        mock.SCST_DEV_GROUPS = "/sys/kernel/scst_tgt/device_groups"
-        mock.MGMT_INTERFACE = "mgmt"
-        mock.ENABLED_ATTR = "enabled"
-        return mock
-
     @pytest.fixture
     def mock_config_reader(self):
         """Create a mock configuration reader for testing"""
@@ -2456,20 +3575,20 @@ class TestGroupWriter:
         This test verifies that:
         1. Correct sysfs path is constructed for device group detection
         2. Method returns True when group path exists via filesystem check
-        3. Uses entity_exists utility function which checks os.path.exists
+        3. Uses entity_exists utility function which checks os.access(F_OK)
         """
         # Arrange: Set up test data
         group_name = "dg1"
 
         # Mock filesystem operation to return True (group exists)
-        with patch("os.path.exists", return_value=True) as mock_exists:
+        with patch("os.access", return_value=True) as mock_access:
             # Act: Call the method under test
             result = group_writer._device_group_exists(group_name)
 
             # Assert: Verify result and proper path construction
             assert result is True
-            mock_exists.assert_called_once_with(
-                "/sys/kernel/scst_tgt/device_groups/dg1"
+            mock_access.assert_called_once_with(
+                "/sys/kernel/scst_tgt/device_groups/dg1", os.F_OK
             )
 
     def test_device_group_exists_false(self, group_writer, mock_sysfs):
@@ -2485,14 +3604,14 @@ class TestGroupWriter:
         group_name = "nonexistent_group"
 
         # Mock filesystem operation to return False (group doesn't exist)
-        with patch("os.path.exists", return_value=False) as mock_exists:
+        with patch("os.access", return_value=False) as mock_access:
             # Act: Call the method under test
             result = group_writer._device_group_exists(group_name)
 
             # Assert: Verify result and proper path construction
             assert result is False
-            mock_exists.assert_called_once_with(
-                "/sys/kernel/scst_tgt/device_groups/nonexistent_group"
+            mock_access.assert_called_once_with(
+                "/sys/kernel/scst_tgt/device_groups/nonexistent_group", os.F_OK
             )
 
     def test_remove_device_group_complete_cleanup(